@@ -18,6 +18,9 @@ import subprocess
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from template_registry import get_registry, root_name_for
+
 REPO_ROOT = Path(__file__).parent.parent
 DOCS_DIR = REPO_ROOT / "docs"
 DEFAULT_OUTPUT = REPO_ROOT / "exports" / "pdf"
@@ -112,6 +115,14 @@ def find_templates(category: str = None, specific: str = None):
         return templates
 
     cats = [category] if category else TEMPLATE_CATEGORIES
+    root = root_name_for(DOCS_DIR)
+    if root is not None:
+        registry = get_registry(refresh=False)  # refreshed once in main()
+        for cat in cats:
+            for record in registry.query(root=root, folder=cat):
+                templates.append((record.path, record.abs_path))
+        return templates
+
     for cat in cats:
         cat_dir = DOCS_DIR / cat
         if cat_dir.exists():
@@ -239,6 +250,7 @@ def main():
         return
 
     out_dir = Path(args.output)
+    get_registry()
     templates = find_templates(category=args.category, specific=args.template)
 
     if not templates:
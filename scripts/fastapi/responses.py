@@ -9,3 +9,11 @@ class JSONResponse(dict):
     def __init__(self, content, status_code: int = 200):
         super().__init__(content)
         self.status_code = status_code
+
+
+class PlainTextResponse(str):
+    def __new__(cls, content, status_code: int = 200, media_type: str = "text/plain"):
+        obj = super().__new__(cls, content)
+        obj.status_code = status_code
+        obj.media_type = media_type
+        return obj
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Generate index.mdx files for all template categories with Starlight Cards."""
 
+import sys
 import yaml
 import re
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from template_registry import get_registry, root_name_for
+
 DOCS_DIR = Path(__file__).parent.parent / "partneros-docs" / "src" / "content" / "docs"
 
 # Icon mapping for Starlight
@@ -79,6 +83,27 @@ def get_templates_for_category(category_dir):
     if not category_path.exists():
         return templates
 
+    # Frontmatter comes from the shared registry when DOCS_DIR is indexed;
+    # main() refreshes it once for the whole run
+    root = root_name_for(DOCS_DIR)
+    if root is not None:
+        registry = get_registry(refresh=False)
+        for record in registry.query(root=root, folder=category_dir):
+            fm = record.frontmatter
+            if fm.get("title"):
+                templates.append(
+                    {
+                        "filename": Path(record.path).stem + "/",  # folder style
+                        "title": fm.get("title"),
+                        "description": fm.get("description", ""),
+                        "tier": fm.get("tier", []),
+                        "difficulty": fm.get("difficulty", ""),
+                        "time_required": fm.get("time_required", ""),
+                        "template_number": fm.get("template_number", ""),
+                    }
+                )
+        return templates
+
     for f in sorted(category_path.glob("*.md")):
         if f.name == "index.md":
             continue
@@ -164,6 +189,7 @@ import {{ Card, CardGrid }} from '@astrojs/starlight/components';
 
 
 def main():
+    get_registry()  # one scan of the doc trees for every category below
     for category in ICON_MAP.keys():
         category_path = DOCS_DIR / category
         if not category_path.exists():
@@ -10,7 +10,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -18,35 +17,21 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).parent.parent
 STATE_DIR = REPO_ROOT / "scripts" / "partner_agent" / "state"
 
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+from partner_agents.store import store_for
+
 
 def load_partner(slug_or_name: str) -> dict:
     """Load a single partner's state by slug or display name."""
-    candidate = STATE_DIR / slug_or_name / "metadata.json"
-    if candidate.exists():
-        with open(candidate) as f:
-            return json.load(f)
-    # Fuzzy match on name
-    for d in STATE_DIR.iterdir():
-        meta = d / "metadata.json"
-        if meta.exists():
-            with open(meta) as f:
-                data = json.load(f)
-            if data.get("name", "").lower() == slug_or_name.lower():
-                return data
-    raise FileNotFoundError(f"Partner not found: {slug_or_name}")
+    partner = store_for(STATE_DIR).find(slug_or_name)
+    if partner is None:
+        raise FileNotFoundError(f"Partner not found: {slug_or_name}")
+    return partner
 
 
 def load_all_partners() -> list:
     """Load all partner state files."""
-    partners = []
-    if not STATE_DIR.exists():
-        return partners
-    for d in sorted(STATE_DIR.iterdir()):
-        meta = d / "metadata.json"
-        if meta.exists():
-            with open(meta) as f:
-                partners.append(json.load(f))
-    return partners
+    return sorted(store_for(STATE_DIR).all(), key=lambda p: p["slug"])
 
 
 def health_badge(score) -> str:
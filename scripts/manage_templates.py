@@ -9,6 +9,9 @@ import sys
 import os
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from template_registry import get_registry, root_name_for
+
 ROOT = Path("docs")
 
 # Optional Pydantic for structured output
@@ -148,8 +151,17 @@ def update_template(args):
     return 0
 
 
+def _template_paths():
+    """Every markdown file under ROOT, from the template registry when indexed."""
+    root = root_name_for(ROOT)
+    if root is None:
+        return sorted(ROOT.rglob("*.md"))
+    records = get_registry().query(root=root, include_index=True)
+    return [r.abs_path for r in records]
+
+
 def revise_all(args):
-    for p in ROOT.rglob("*.md"):
+    for p in _template_paths():
         fm, body = read_file(p)
         changed = False
         if args.last_updated:
@@ -8,8 +8,10 @@ Usage:
     python agent.py --playbook recruit        # Run specific playbook
     python agent.py --resume acme-corp        # Resume saved session
     python agent.py --status                  # View all partners
-    python agent.py --reload                  # Reload config without restart
+    python agent.py --reload                  # Flush caches and reload config
     python agent.py --verbose                 # Enable debug logging
+    python agent.py --prefetch                # Draft the next step in the background
+    python agent.py --rebuild-index           # Rebuild state/index.json
 """
 
 import os
@@ -19,8 +21,15 @@ import re
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 import argparse
+import asyncio
+import copy
+import difflib
+import random
+import threading
 import time
 
 import yaml
@@ -61,7 +70,31 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
-from partner_state import PartnerState
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Shared template registry (scripts/template_registry.py)
+try:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from template_registry import get_registry, root_name_for
+
+    REGISTRY_AVAILABLE = True
+except ImportError:
+    REGISTRY_AVAILABLE = False
+
+# Shared LLM gateway (scripts/partner_agents/llm_gateway.py)
+try:
+    from partner_agents.llm_gateway import gateway, GatewayUnavailable
+
+    GATEWAY_AVAILABLE = True
+except ImportError:
+    GATEWAY_AVAILABLE = False
+
+from partner_state import PartnerState, slugify, store_for
 
 
 # Configure logging
@@ -92,6 +125,8 @@ class OllamaClient:
         self.endpoint = endpoint.rstrip("/")
         self.model = model
         self.retry_config = retry_config or RetryConfig()
+        # Reuse one keep-alive connection across calls
+        self.session = requests.Session() if REQUESTS_AVAILABLE else None
 
     def _retry_with_backoff(self, func, *args, **kwargs):
         """Execute function with exponential backoff retry."""
@@ -122,7 +157,7 @@ class OllamaClient:
         ollama_messages.extend(messages)
 
         def make_request():
-            response = requests.post(
+            response = self.session.post(
                 f"{self.endpoint}/api/chat",
                 json={
                     "model": self.model,
@@ -138,6 +173,263 @@ class OllamaClient:
         return self._retry_with_backoff(make_request)
 
 
+class AsyncOllamaClient:
+    """
+    Non-blocking Ollama client with a pooled connection and token streaming.
+
+    Retries connection errors, timeouts, 429 and 5xx responses with jittered
+    exponential backoff (asyncio.sleep, so the event loop keeps running).
+    Streams are only retried before the first token arrives. Cancelling the
+    calling task closes the underlying response.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:11434",
+        model: str = "llama3.2:3b",
+        retry_config: RetryConfig = None,
+        timeout: float = 120.0,
+        max_connections: int = 10,
+    ):
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required: pip install httpx")
+        self.endpoint = endpoint.rstrip("/")
+        self.model = model
+        self.retry_config = retry_config or RetryConfig()
+        self.timeout = httpx.Timeout(timeout, connect=min(timeout, 10.0))
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Shared connection pool, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.endpoint, timeout=self.timeout, limits=self.limits
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter delay before retry number attempt + 1."""
+        cap = min(
+            self.retry_config.base_delay * (2**attempt), self.retry_config.max_delay
+        )
+        return random.uniform(0, cap)
+
+    def _retryable(self, error: Exception) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.RETRY_STATUSES
+        return isinstance(error, (httpx.TransportError, httpx.TimeoutException))
+
+    def _payload(self, messages: list, system_prompt: str = None) -> dict:
+        ollama_messages = []
+        if system_prompt:
+            ollama_messages.append({"role": "system", "content": system_prompt})
+        ollama_messages.extend(messages)
+        return {"model": self.model, "messages": ollama_messages, "stream": True}
+
+    async def stream_chat(self, messages: list, system_prompt: str = None):
+        """Yield response tokens from /api/chat as they arrive."""
+        payload = self._payload(messages, system_prompt)
+        for attempt in range(self.retry_config.max_retries + 1):
+            started = False
+            try:
+                async with self.client.stream(
+                    "POST", "/api/chat", json=payload
+                ) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line.strip():
+                            continue
+                        chunk = json.loads(line)
+                        if chunk.get("error"):
+                            raise RuntimeError(f"Ollama error: {chunk['error']}")
+                        token = chunk.get("message", {}).get("content", "")
+                        if token:
+                            started = True
+                            yield token
+                        if chunk.get("done"):
+                            return
+                    return
+            except Exception as e:
+                if (
+                    started
+                    or attempt >= self.retry_config.max_retries
+                    or not self._retryable(e)
+                ):
+                    raise
+                delay = self.backoff_delay(attempt)
+                logger.warning(
+                    f"API call failed (attempt {attempt + 1}), retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def chat(self, messages: list, system_prompt: str = None) -> str:
+        """Send chat request to local Ollama and return the full reply."""
+        tokens = [t async for t in self.stream_chat(messages, system_prompt)]
+        return "".join(tokens) or "[No response]"
+
+
+class FileCache:
+    """
+    In-process cache of parsed files (playbooks, config, templates).
+
+    Entries are keyed by path and revalidated against the file's mtime and
+    size on lookup. While the background watcher runs, lookups trust the
+    cache and the watcher re-parses changed files instead.
+    """
+
+    def __init__(self, on_change: Optional[Callable[[Path], None]] = None):
+        self.on_change = on_change
+        # key -> (path, signature, value, loader)
+        self._entries: Dict[str, Tuple[Path, Tuple[int, int], Any, Callable]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def watching(self) -> bool:
+        return self._watcher is not None and self._watcher.is_alive()
+
+    def get(self, path: Path, loader: Callable[[Path], Any], key: str = None) -> Any:
+        """Return loader(path), re-running it only when the file changed."""
+        key = key or str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.watching:
+                self.hits += 1
+                return entry[2]
+        signature = self._signature(path)
+        if entry is not None and entry[1] == signature:
+            with self._lock:
+                self.hits += 1
+            return entry[2]
+
+        value = loader(path)
+        with self._lock:
+            self.misses += 1
+            if signature is not None:
+                self._entries[key] = (path, signature, value, loader)
+        return value
+
+    def listing(self, directory: Path, pattern: str) -> List[Path]:
+        """Sorted glob of a directory, re-read when the directory changes."""
+        return self.get(
+            directory,
+            lambda d: sorted(d.glob(pattern)) if d.exists() else [],
+            key=f"{directory}::{pattern}",
+        )
+
+    def poll(self) -> List[Path]:
+        """Re-parse entries whose files changed; returns their paths."""
+        with self._lock:
+            entries = list(self._entries.items())
+        changed = []
+        for key, (path, signature, _, loader) in entries:
+            current = self._signature(path)
+            if current == signature:
+                continue
+            try:
+                value = loader(path) if current is not None else None
+            except Exception as e:
+                logger.warning(f"Could not reload {path}: {e}")
+                value = None
+            with self._lock:
+                if value is None:
+                    self._entries.pop(key, None)  # deleted or unreadable
+                else:
+                    self._entries[key] = (path, current, value, loader)
+                self.reloads += 1
+            changed.append(path)
+        if self.on_change:
+            for path in changed:
+                self.on_change(path)
+        return changed
+
+    def start_watcher(self, interval: float = 2.0):
+        """Poll cached files every interval seconds in a daemon thread."""
+        if self.watching:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                self.poll()
+
+        self._watcher = threading.Thread(
+            target=run, name="partner-agent-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watcher(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+        self._watcher = None
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+            }
+
+
+def context_drift(before: str, after: str) -> float:
+    """Fraction of words that differ between two prompt contexts (0 = same)."""
+    if before == after:
+        return 0.0
+    matcher = difflib.SequenceMatcher(None, before.split(), after.split())
+    return 1.0 - matcher.ratio()
+
+
+@dataclass
+class PrefetchedStep:
+    """A speculative draft for the next playbook step."""
+
+    playbook: str
+    step_index: int
+    partner: str
+    template: dict
+    context: str  # prompt text the draft was generated from
+    future: Future
+    started: float = field(default_factory=time.perf_counter)
+
+
 class PartnerAgent:
     """Main agent class for running partnership playbooks."""
 
@@ -153,12 +445,19 @@ class PartnerAgent:
         self._setup_logging()
         self.base_dir = Path(__file__).parent
         self.config_path = config_path
+        self.cache = FileCache(on_change=self._on_file_change)
         self.config = self._load_config(config_path)
         self.templates_dir = self.base_dir / self.config.get(
             "templates_dir", "../../docs"
         )
         self.state_dir = self.base_dir / self.config.get("state_dir", "./state")
         self.playbooks_dir = self.base_dir / "playbooks"
+        # Speculatively draft step N+1 while the user reviews step N
+        self.prefetch = bool(self.config.get("prefetch", False))
+        self.prefetch_threshold = float(self.config.get("prefetch_threshold", 0.2))
+        self.prefetch_stats = {"started": 0, "used": 0, "ready": 0, "discarded": 0}
+        self._prefetched: Optional[PrefetchedStep] = None
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
         self.llm_client = self._init_llm()
         logger.info("PartnerAgent initialized successfully")
 
@@ -210,18 +509,17 @@ class PartnerAgent:
         """Load configuration from YAML file with validation."""
         config_file = self.base_dir / config_path
         if config_file.exists():
-            with open(config_file) as f:
-                config = yaml.safe_load(f)
-
-                # Validate model if specified
-                provider = config.get("provider", "anthropic")
-                model = config.get("model")
-                if model and model not in self.VALID_MODELS.get(provider, []):
-                    logger.warning(
-                        f"Model '{model}' may not exist. Valid models for {provider}: {self.VALID_MODELS.get(provider, [])}"
-                    )
+            config = dict(self.cache.get(config_file, self._read_yaml))
+
+            # Validate model if specified
+            provider = config.get("provider", "anthropic")
+            model = config.get("model")
+            if model and model not in self.VALID_MODELS.get(provider, []):
+                logger.warning(
+                    f"Model '{model}' may not exist. Valid models for {provider}: {self.VALID_MODELS.get(provider, [])}"
+                )
 
-                return config
+            return config
 
         # Default configuration
         return {
@@ -231,9 +529,21 @@ class PartnerAgent:
             "state_dir": "./state",
         }
 
+    @staticmethod
+    def _read_yaml(path: Path) -> Any:
+        with open(path) as f:
+            return yaml.safe_load(f) or {}
+
+    def _on_file_change(self, path: Path):
+        """Watcher callback: pick up config edits while running."""
+        if path == self.base_dir / self.config_path:
+            self.config = self._load_config(self.config_path)
+            logger.info("Configuration changed on disk; reloaded")
+
     def reload_config(self):
-        """Reload configuration from disk without restarting."""
+        """Flush cached playbooks, templates and config, then reload config."""
         logger.info("Reloading configuration...")
+        self.cache.clear()
         self.config = self._load_config(self.config_path)
         logger.info("Configuration reloaded successfully")
 
@@ -339,24 +649,22 @@ class PartnerAgent:
         if not playbook_file.exists():
             raise FileNotFoundError(f"Playbook not found: {name}")
 
-        with open(playbook_file) as f:
-            return yaml.safe_load(f)
+        # Callers get their own copy; the cached parse stays pristine
+        return copy.deepcopy(self.cache.get(playbook_file, self._read_yaml))
 
     def list_playbooks(self) -> list:
         """List available playbooks."""
         playbooks = []
-        if self.playbooks_dir.exists():
-            for f in self.playbooks_dir.glob("*.yaml"):
-                with open(f) as pf:
-                    data = yaml.safe_load(pf)
-                    playbooks.append(
-                        {
-                            "name": f.stem,
-                            "title": data.get("name", f.stem),
-                            "description": data.get("description", ""),
-                            "steps": len(data.get("steps", [])),
-                        }
-                    )
+        for f in self.cache.listing(self.playbooks_dir, "*.yaml"):
+            data = self.cache.get(f, self._read_yaml)
+            playbooks.append(
+                {
+                    "name": f.stem,
+                    "title": data.get("name", f.stem),
+                    "description": data.get("description", ""),
+                    "steps": len(data.get("steps", [])),
+                }
+            )
         return playbooks
 
     def load_template(self, template_path: str) -> dict:
@@ -374,16 +682,30 @@ class PartnerAgent:
         if not full_path.exists():
             raise FileNotFoundError(f"Template not found: {template_path}")
 
+        parsed = self.cache.get(
+            full_path, lambda path: self._parse_template(template_path, path)
+        )
+        return {
+            **parsed,
+            "frontmatter": dict(parsed["frontmatter"]),
+            "placeholders": list(parsed["placeholders"]),
+        }
+
+    def _parse_template(self, template_path: str, full_path: Path) -> dict:
         with open(full_path) as f:
             content = f.read()
 
-        # Parse YAML frontmatter
+        # Parse YAML frontmatter (from the template registry when indexed)
+        record = self._registry_record(template_path)
         frontmatter = {}
         body = content
         if content.startswith("---"):
             parts = content.split("---", 2)
             if len(parts) >= 3:
-                frontmatter = yaml.safe_load(parts[1])
+                if record is not None:
+                    frontmatter = dict(record.frontmatter)
+                else:
+                    frontmatter = yaml.safe_load(parts[1])
                 body = parts[2].strip()
 
         # Extract placeholders
@@ -396,6 +718,15 @@ class PartnerAgent:
             "placeholders": placeholders,
         }
 
+    def _registry_record(self, template_path: str):
+        """Fresh registry record for a template, or None if not indexed."""
+        if not REGISTRY_AVAILABLE:
+            return None
+        root = root_name_for(self.templates_dir)
+        if root is None:
+            return None
+        return get_registry(refresh=False).get_fresh(template_path, root)
+
     def _extract_placeholders(self, content: str) -> list:
         """Extract fillable placeholders from template content."""
         patterns = [
@@ -412,21 +743,19 @@ class PartnerAgent:
 
     def slugify(self, text: str) -> str:
         """Convert text to URL-friendly slug with sanitization."""
-        # First sanitize the input
-        text = self._sanitize_partner_name(text)
-        # Then slugify
-        return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+        # First sanitize the input, then use the partner store's slugs
+        return slugify(self._sanitize_partner_name(text))
 
     def get_partner_state(self, partner: str) -> dict:
         """Load saved state for a partner."""
         # Sanitize partner name first
         partner = self._sanitize_partner_name(partner)
         slug = self.slugify(partner)
-        state_file = self.state_dir / slug / "metadata.json"
+        # By name too, so records saved under another slug are found
+        saved = store_for(self.state_dir).find(partner)
 
-        if state_file.exists():
-            with open(state_file) as f:
-                state = json.load(f)
+        if saved is not None:
+            state = copy.deepcopy(saved)
             # Back-fill new fields for existing state files
             state.setdefault("tier", None)
             state.setdefault("vertical", None)
@@ -453,31 +782,29 @@ class PartnerAgent:
         """Save partner state to disk with validation."""
         # Sanitize partner name
         partner = self._sanitize_partner_name(partner)
-        slug = self.slugify(partner)
-        partner_dir = self.state_dir / slug
-        partner_dir.mkdir(parents=True, exist_ok=True)
-        state_file = partner_dir / "metadata.json"
+        store = store_for(self.state_dir)
+        existing = store.find(partner)
 
-        # Ensure state matches sanitized partner name
+        # Ensure state matches sanitized partner name and its saved record
         state["name"] = partner
-        state["slug"] = slug
+        state["slug"] = existing["slug"] if existing else self.slugify(partner)
 
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        store.save(state)
 
         logger.info(f"Saved state for partner: {partner}")
 
     def list_partners(self) -> list:
-        """List all tracked partners."""
-        partners = []
-        if self.state_dir.exists():
-            for partner_dir in self.state_dir.iterdir():
-                if partner_dir.is_dir():
-                    meta_file = partner_dir / "metadata.json"
-                    if meta_file.exists():
-                        with open(meta_file) as f:
-                            partners.append(json.load(f))
-        return partners
+        """
+        List all tracked partners from the partner index.
+
+        Entries are summaries (name, slug, tier, stage, health, playbook
+        progress); use load_partner() for a partner's full state.
+        """
+        return store_for(self.state_dir).index.list()
+
+    def load_partner(self, summary: dict) -> dict:
+        """Full saved state for a partner listed by list_partners()."""
+        return copy.deepcopy(store_for(self.state_dir).get(summary["slug"]))
 
     # -------------------------------------------------------------------------
     # Agent Superpowers
@@ -578,6 +905,9 @@ class PartnerAgent:
         provider = self.config.get("provider", "anthropic")
         model = self.config.get("model", "sonnet-4-20250514")
 
+        if GATEWAY_AVAILABLE:
+            return self._chat_via_gateway(provider, model, messages, system_prompt)
+
         # Handle Ollama
         if isinstance(self.llm_client, OllamaClient):
             return self.llm_client.chat(messages, system_prompt)
@@ -617,6 +947,46 @@ class PartnerAgent:
 
         return "[Unknown provider]"
 
+    def _chat_via_gateway(
+        self, provider: str, model: str, messages: list, system_prompt: str = None
+    ) -> str:
+        """Send messages through the shared LLM gateway (limits, circuit breaker)."""
+        base_url = None
+        api_key = None
+        if isinstance(self.llm_client, OllamaClient):
+            provider, model = "ollama", self.llm_client.model
+            base_url = self.llm_client.endpoint
+        elif provider == "anthropic":
+            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            system_prompt = system_prompt or self._get_system_prompt()
+        elif provider == "openai":
+            api_key = os.environ.get("OPENAI_API_KEY")
+        else:
+            return "[Unknown provider]"
+
+        msgs = []
+        if system_prompt:
+            msgs.append({"role": "system", "content": system_prompt})
+        msgs.extend(messages)
+        try:
+            reply = gateway.complete_sync(
+                provider,
+                model,
+                msgs,
+                api_key=api_key,
+                timeout=120.0,
+                base_url=base_url,
+                conversation="playbook",
+                agent="partner_agent",
+            )
+        except GatewayUnavailable as e:
+            logger.warning(f"LLM gateway refused call: {e}")
+            return f"[LLM unavailable - {e}. Try again shortly]"
+        except Exception as e:
+            logger.error(f"{provider} API error: {e}")
+            return f"[Error: {str(e)}]"
+        return reply.content or "[Empty content]"
+
     def _get_system_prompt(self, partner_data: dict = None) -> str:
         """Get the system prompt for the agent, optionally enriched with partner context."""
         company = self.config.get("company", {})
@@ -673,6 +1043,25 @@ Be concise and actionable. Ask one question at a time.
 When you have enough information for a section, fill it in and move to the next.
 Format filled sections in markdown."""
 
+    def _step_message(self, playbook: dict, step: dict, partner: str, template: dict):
+        return {
+            "role": "user",
+            "content": f"""We're working on: {playbook["name"]}
+Partner: {partner}
+Current step: {step["name"]}
+
+Template: {template["frontmatter"].get("title", step["name"])}
+Description: {template["frontmatter"].get("description", "")}
+
+Placeholders to fill: {", ".join(template["placeholders"][:10])}
+
+{step.get("prompt", "Guide me through filling out this template.")}""",
+        }
+
+    @staticmethod
+    def _context_text(messages: list, system: str) -> str:
+        return "\n".join([system] + [m["content"] for m in messages])
+
     def run_playbook_step(
         self,
         playbook: dict,
@@ -683,30 +1072,42 @@ Format filled sections in markdown."""
     ) -> dict:
         """Run a single step of a playbook."""
         step = playbook["steps"][step_index]
-        template = self.load_template(step["template"])
+        prefetched = self._take_prefetch(playbook, step_index, partner)
+        template = (
+            prefetched.template if prefetched else self.load_template(step["template"])
+        )
 
         # Build conversation
         messages = context.get("messages", [])
-        messages.append(
-            {
-                "role": "user",
-                "content": f"""We're working on: {playbook["name"]}
-Partner: {partner}
-Current step: {step["name"]}
-
-Template: {template["frontmatter"].get("title", step["name"])}
-Description: {template["frontmatter"].get("description", "")}
-
-Placeholders to fill: {", ".join(template["placeholders"][:10])}
-
-{step.get("prompt", "Guide me through filling out this template.")}""",
-            }
-        )
+        messages.append(self._step_message(playbook, step, partner, template))
 
         system = self._get_system_prompt(partner_data)
-        response = self.chat(messages, system_prompt=system)
+        response = None
+        if prefetched is not None:
+            drift = context_drift(
+                prefetched.context, self._context_text(messages, system)
+            )
+            if drift <= self.prefetch_threshold:
+                self.prefetch_stats["used"] += 1
+                if prefetched.future.done():
+                    self.prefetch_stats["ready"] += 1
+                try:
+                    response = prefetched.future.result()
+                except Exception as e:
+                    logger.warning(f"Prefetched draft failed, retrying live: {e}")
+            else:
+                logger.debug(f"Discarding prefetched draft (drift {drift:.2f})")
+                prefetched.future.cancel()
+                self.prefetch_stats["discarded"] += 1
+        if response is None:
+            response = self.chat(messages, system_prompt=system)
         messages.append({"role": "assistant", "content": response})
 
+        if self.prefetch:
+            self.prefetch_step(
+                playbook, step_index + 1, partner, {"messages": messages}, partner_data
+            )
+
         return {
             "step": step_index,
             "step_name": step["name"],
@@ -715,12 +1116,73 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
             "response": response,
         }
 
+    def prefetch_step(
+        self,
+        playbook: dict,
+        step_index: int,
+        partner: str,
+        context: dict,
+        partner_data: dict = None,
+    ):
+        """Load a step's template and draft its opening reply in the background."""
+        self.discard_prefetch()
+        if step_index >= len(playbook["steps"]):
+            return
+        step = playbook["steps"][step_index]
+        try:
+            template = self.load_template(step["template"])
+        except (ValueError, FileNotFoundError) as e:
+            logger.debug(f"Not prefetching step {step_index}: {e}")
+            return
+        messages = list(context.get("messages", []))
+        messages.append(self._step_message(playbook, step, partner, template))
+        system = self._get_system_prompt(partner_data)
+
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="playbook-prefetch"
+            )
+        self._prefetched = PrefetchedStep(
+            playbook=playbook["name"],
+            step_index=step_index,
+            partner=partner,
+            template=template,
+            context=self._context_text(messages, system),
+            future=self._prefetch_pool.submit(self.chat, messages, system),
+        )
+        self.prefetch_stats["started"] += 1
+
+    def _take_prefetch(
+        self, playbook: dict, step_index: int, partner: str
+    ) -> Optional[PrefetchedStep]:
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched is None:
+            return None
+        if (prefetched.playbook, prefetched.step_index, prefetched.partner) != (
+            playbook["name"],
+            step_index,
+            partner,
+        ):
+            prefetched.future.cancel()
+            self.prefetch_stats["discarded"] += 1
+            return None
+        return prefetched
+
+    def discard_prefetch(self):
+        """Drop any pending speculative draft."""
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched is not None:
+            prefetched.future.cancel()
+            self.prefetch_stats["discarded"] += 1
+
     def interactive_mode(self):
         """Run the agent in interactive mode."""
         self._print("\n" + "=" * 50)
         self._print("Partner Agent v1.2", style="bold blue")
         self._print("=" * 50 + "\n")
 
+        # Menus read from the cache; the watcher picks up edits in the background
+        self.cache.start_watcher()
         while True:
             self._print("\nWhat would you like to do?")
             self._print("1. Start a new playbook")
@@ -750,6 +1212,7 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
                 self._add_note_interactive()
             elif choice == "8":
                 self._print("\nGoodbye!", style="blue")
+                self.cache.stop_watcher()
                 break
             else:
                 self._print("Invalid choice", style="red")
@@ -766,7 +1229,7 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
             self._print(f"  {i}. {p['name']}  [{tier}]")
         choice = self._prompt("Select partner number")
         try:
-            return partners[int(choice) - 1]
+            return self.load_partner(partners[int(choice) - 1])
         except (ValueError, IndexError):
             self._print_error("Invalid selection")
             return None
@@ -885,6 +1348,7 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
 
             if i < len(playbook["steps"]) - 1:
                 if not self._confirm("\nContinue to next step?"):
+                    self.discard_prefetch()
                     self._print("Progress saved. Resume anytime.")
                     return
 
@@ -923,7 +1387,7 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
 
         choice = self._prompt("Select partner number")
         try:
-            partner_data = partners[int(choice) - 1]
+            partner_data = self.load_partner(partners[int(choice) - 1])
         except (ValueError, IndexError):
             self._print_error("Invalid selection")
             return
@@ -973,6 +1437,7 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
 
             if i < len(playbook["steps"]) - 1:
                 if not self._confirm("\nContinue to next step?"):
+                    self.discard_prefetch()
                     self._print("Progress saved. Resume anytime.")
                     return
 
@@ -1039,7 +1504,7 @@ Placeholders to fill: {", ".join(template["placeholders"][:10])}
             section_path = self.templates_dir / section
             if section_path.exists():
                 self._print(f"{section.title()} Templates:", style="bold")
-                for f in sorted(section_path.glob("*.md")):
+                for f in self.cache.listing(section_path, "*.md"):
                     if f.name != "index.md":
                         self._print(f"  - {f.name}")
                 self._print("")
@@ -1059,18 +1524,35 @@ def main():
         "--config", "-c", default="config.yaml", help="Config file path"
     )
     parser.add_argument(
-        "--reload", action="store_true", help="Reload config without restarting"
+        "--reload",
+        action="store_true",
+        help="Flush cached playbooks, templates and config and reload",
     )
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable debug logging"
     )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Draft the next playbook step in the background",
+    )
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Rebuild the partner index from saved state",
+    )
 
     args = parser.parse_args()
 
     agent = PartnerAgent(config_path=args.config, verbose=args.verbose)
+    if args.prefetch:
+        agent.prefetch = True
 
     if args.reload:
         agent.reload_config()
+    elif args.rebuild_index:
+        count = len(store_for(agent.state_dir).rebuild_index())
+        agent._print_success(f"Indexed {count} partners")
     elif args.status:
         agent._show_status()
     elif args.playbook and args.partner:
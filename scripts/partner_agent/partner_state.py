@@ -12,15 +12,28 @@ Usage:
     state.add_milestone("Signed NDA")
     state.update_stage("recruiting")
     state.save()
+
+Records are read and written through the shared partner store
+(scripts/partner_agents/store.py), which the web/CLI stack uses too. Every
+save also updates state/index.json, a one-file summary of all partners
+(name, slug, tier, stage, health, playbook progress) that listings and name
+lookups read instead of opening each metadata.json. Rebuild it from the
+partner directories with:
+
+    python partner_state.py --rebuild-index [--state-dir ./state]
 """
 
-import json
-import os
+import argparse
+import copy
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from enum import Enum
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from partner_agents.store import INDEX_FILE, slugify, store_for
+
 
 class PartnerStage(Enum):
     """Partner lifecycle stages."""
@@ -116,31 +129,22 @@ class PartnerState:
     def __init__(self, partner_name: str, state_dir: str = "./state"):
         self.partner_name = partner_name
         self.state_dir = Path(state_dir)
-        self.slug = self._slugify(partner_name)
+        self.slug = slugify(partner_name)
+        self.store = store_for(self.state_dir)
         self.state = self._load()
 
-    def _slugify(self, text: str) -> str:
-        """Convert partner name to URL-safe slug."""
-        import re
-
-        text = text.strip()
-        text = re.sub(r"[^\w\s-]", "", text)
-        text = re.sub(r"[-\s]+", "-", text)
-        return text.lower().strip("-")
-
     def _load(self) -> dict:
         """Load state from disk or return default."""
-        state_file = self.state_dir / self.slug / "metadata.json"
-
-        if state_file.exists():
-            with open(state_file) as f:
-                state = json.load(f)
-        else:
-            state = self.DEFAULT_STATE.copy()
+        saved = self.store.find(self.partner_name)
+        if saved is not None:
+            self.slug = saved["slug"]
+        # Copy: the store's cached record is shared with other readers
+        state = copy.deepcopy(saved or self.DEFAULT_STATE)
 
         # Set defaults for any missing fields
-        state.setdefault("name", self.partner_name)
-        state.setdefault("slug", self.slug)
+        # DEFAULT_STATE carries empty placeholders, so fill them explicitly
+        state["name"] = state.get("name") or self.partner_name
+        state["slug"] = state.get("slug") or self.slug
         state.setdefault("stage", "prospect")
         state.setdefault("milestones", [])
         state.setdefault("notes", [])
@@ -155,14 +159,8 @@ class PartnerState:
 
     def save(self):
         """Save state to disk."""
-        partner_dir = self.state_dir / self.slug
-        partner_dir.mkdir(parents=True, exist_ok=True)
-
         self.state["updated"] = datetime.now().isoformat()
-
-        state_file = partner_dir / "metadata.json"
-        with open(state_file, "w") as f:
-            json.dump(self.state, f, indent=2)
+        self.store.save(self.state)
 
     def add_milestone(self, name: str, description: str = "", playbook: str = ""):
         """Record a milestone completion."""
@@ -273,20 +271,19 @@ class PartnerState:
         }
 
     @classmethod
-    def list_all(cls, state_dir: str = "./state") -> List[dict]:
-        """List all partners and their states."""
-        state_path = Path(state_dir)
-        partners = []
-
-        if state_path.exists():
-            for partner_dir in state_path.iterdir():
-                if partner_dir.is_dir():
-                    meta_file = partner_dir / "metadata.json"
-                    if meta_file.exists():
-                        with open(meta_file) as f:
-                            partners.append(json.load(f))
+    def list_all(cls, state_dir: str = "./state", summary: bool = False) -> List[dict]:
+        """
+        List all partners, most recently updated first.
 
-        return sorted(partners, key=lambda p: p.get("updated", ""), reverse=True)
+        With summary=True only the index is read; otherwise each partner's
+        full record is loaded (once per process, through the store cache).
+        """
+        store = store_for(state_dir)
+        summaries = store.index.list()
+        if summary:
+            return summaries
+        records = (store.get(entry["slug"]) for entry in summaries)
+        return [copy.deepcopy(r) for r in records if r is not None]
 
 
 def create_test_state():
@@ -318,4 +315,15 @@ def create_test_state():
 
 
 if __name__ == "__main__":
-    create_test_state()
+    parser = argparse.ArgumentParser(description="Partner state utilities")
+    parser.add_argument(
+        "--rebuild-index", action="store_true", help="Rebuild state/index.json"
+    )
+    parser.add_argument("--state-dir", default="./state", help="State directory")
+    args = parser.parse_args()
+
+    if args.rebuild_index:
+        count = len(store_for(args.state_dir).rebuild_index())
+        print(f"Indexed {count} partners in {Path(args.state_dir) / INDEX_FILE}")
+    else:
+        create_test_state()
@@ -17,12 +17,15 @@ __version__ = "1.0.0"
 from .base import BaseAgent, AgentPriority, AgentStatus, AgentSkill, HandoffRequest
 from .orchestrator import Orchestrator, RaceStrategy
 from .messages import TeamRadio, TeamMessage, MessageType
+from .radio_log import RadioLog
 from .state import Telemetry, PartnerState, ProgramMetrics
+from .activity_log import ActivityLog
 from .config import TeamConfig
 from . import router
 from . import document_generator
 from . import partner_state
 from . import chat_orchestrator
+from . import tracing
 
 __all__ = [
     "BaseAgent",
@@ -35,12 +38,15 @@ __all__ = [
     "TeamRadio",
     "TeamMessage",
     "MessageType",
+    "RadioLog",
     "Telemetry",
     "PartnerState",
     "ProgramMetrics",
+    "ActivityLog",
     "TeamConfig",
     "router",
     "document_generator",
     "partner_state",
     "chat_orchestrator",
+    "tracing",
 ]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Activity Log - Time-partitioned driver activity history
+Like the team's lap charts: one sheet per race day, old seasons archived away.
+
+Entries are appended as JSON lines to one file per calendar day. A bounded
+in-memory tail keeps recent activity cheap to read, segments older than the
+retention window are deleted automatically, and date-range reads stream
+straight from disk so memory stays flat however long the server runs.
+
+Layout:
+    <log_dir>/2026-10-19.jsonl
+    <log_dir>/2026-10-20.jsonl
+    ...
+"""
+
+import json
+import threading
+from collections import deque
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+
+DateLike = Union[date, datetime, str, None]
+
+
+def _to_datetime(value: DateLike, end_of_day: bool = False) -> Optional[datetime]:
+    """Normalize date / datetime / ISO string to a datetime."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value
+    if end_of_day:
+        return datetime.combine(value, datetime.max.time())
+    return datetime.combine(value, datetime.min.time())
+
+
+class ActivityLog:
+    """
+    Append-only activity log split into daily segment files.
+
+    Args:
+        log_dir: Directory holding the daily segments
+        retention_days: Delete segments older than this many days (None keeps all)
+        tail_size: Number of recent entries kept in memory
+    """
+
+    SEGMENT_GLOB = "????-??-??.jsonl"
+
+    def __init__(
+        self,
+        log_dir: Union[str, Path],
+        retention_days: Optional[int] = 90,
+        tail_size: int = 1000,
+    ):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+        self.tail: Deque[Dict[str, Any]] = deque(maxlen=tail_size)
+        self._day: Optional[date] = None
+        self._fh = None
+        self._lock = threading.Lock()
+
+        self.enforce_retention()
+        self._load_tail()
+
+    def _segment_path(self, day: date) -> Path:
+        return self.log_dir / f"{day.isoformat()}.jsonl"
+
+    def segment_days(self) -> List[date]:
+        """Days that have a segment on disk, oldest first"""
+        days = []
+        for path in self.log_dir.glob(self.SEGMENT_GLOB):
+            try:
+                days.append(date.fromisoformat(path.stem))
+            except ValueError:
+                continue
+        return sorted(days)
+
+    def _load_tail(self):
+        """Refill the in-memory tail from the newest segments"""
+        needed = self.tail.maxlen or 0
+        chunks: List[List[Dict[str, Any]]] = []
+        for day in reversed(self.segment_days()):
+            if needed <= 0:
+                break
+            entries = list(self._read_segment(self._segment_path(day)))
+            chunks.append(entries[-needed:])
+            needed -= len(chunks[-1])
+        for chunk in reversed(chunks):
+            self.tail.extend(chunk)
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash
+        except FileNotFoundError:
+            return
+
+    def enforce_retention(self, today: Optional[date] = None) -> int:
+        """Delete segments older than the retention window. Returns count removed."""
+        if self.retention_days is None:
+            return 0
+        cutoff = (today or date.today()) - timedelta(days=self.retention_days)
+        removed = 0
+        for day in self.segment_days():
+            if day >= cutoff:
+                break
+            self._segment_path(day).unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def append(self, entry: Dict[str, Any]):
+        """Append one entry. Uses its ISO 'timestamp' to pick the segment."""
+        stamp = _to_datetime(entry.get("timestamp")) or datetime.now()
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            day = stamp.date()
+            if day != self._day:
+                self._close_handle()
+                if self._day is not None and day > self._day:
+                    self.enforce_retention(day)
+                self._fh = open(self._segment_path(day), "a", encoding="utf-8")
+                self._day = day
+            self._fh.write(line)
+            self._fh.flush()
+            self.tail.append(entry)
+
+    def recent(self, count: int = 20) -> List[Dict[str, Any]]:
+        """Most recent entries from the in-memory tail"""
+        with self._lock:
+            return list(self.tail)[-count:] if count else []
+
+    def iter_range(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        driver_id: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries between start and end (inclusive), oldest first.
+
+        Dates cover the whole day; datetimes bound to the exact instant.
+        Only the segments for days inside the range are opened.
+        """
+        start_dt = _to_datetime(start)
+        end_dt = _to_datetime(end, end_of_day=True)
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+            days = self.segment_days()
+
+        for day in days:
+            if start_dt is not None and day < start_dt.date():
+                continue
+            if end_dt is not None and day > end_dt.date():
+                break
+            for entry in self._read_segment(self._segment_path(day)):
+                if driver_id is not None and entry.get("driver") != driver_id:
+                    continue
+                stamp = _to_datetime(entry.get("timestamp"))
+                if stamp is not None:
+                    if start_dt is not None and stamp < start_dt:
+                        continue
+                    if end_dt is not None and stamp > end_dt:
+                        continue
+                yield entry
+
+    def _close_handle(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def close(self):
+        """Release the open segment handle"""
+        with self._lock:
+            self._close_handle()
+            self._day = None
+
+    def __len__(self) -> int:
+        return len(self.tail)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.recent(len(self.tail)))
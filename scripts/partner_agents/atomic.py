@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Atomic Writes - Crash-safe file replacement for every state file
+Like a pit stop: the car leaves with four new tyres or none, never three.
+
+Data goes to a temp file in the same directory, is flushed and fsynced,
+then renamed over the target. Readers see the old file or the new one,
+never a torn write. The containing directory can be fsynced as well, so
+the rename itself survives a power cut.
+
+An optional footer line `#sha256:<hex>` lets readers detect files damaged
+outside this module (disk errors, hand edits). read_json() accepts files
+with or without one. State writers add it when PARTNERAGENTS_STATE_CHECKSUM
+is set.
+
+Usage:
+    from partner_agents.atomic import read_json, write_state
+
+    write_state(path, {"partners": {...}}, indent=2)
+    data = read_json(path)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+STATE_CHECKSUM = os.environ.get("PARTNERAGENTS_STATE_CHECKSUM", "").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
+FOOTER_PREFIX = b"#sha256:"
+_FOOTER_RE = re.compile(rb"\n#sha256:([0-9a-f]{64})\n?\Z")
+
+
+class CorruptFileError(ValueError):
+    """A file's checksum footer does not match its content."""
+
+
+def add_footer(data: bytes) -> bytes:
+    """Append a checksum footer line to data."""
+    digest = hashlib.sha256(data).hexdigest().encode("ascii")
+    return data + b"\n" + FOOTER_PREFIX + digest + b"\n"
+
+
+def strip_footer(data: bytes, source: str = "data") -> bytes:
+    """Verify and remove a checksum footer; data without one is returned as is."""
+    match = _FOOTER_RE.search(data)
+    if not match:
+        return data
+    payload = data[: match.start()]
+    if hashlib.sha256(payload).hexdigest().encode("ascii") != match.group(1):
+        raise CorruptFileError(f"Checksum mismatch in {source}")
+    return payload
+
+
+def _fsync_dir(directory: Path):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows, where directories cannot be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(
+    path: Union[str, Path],
+    data: Union[str, bytes],
+    checksum: bool = False,
+    fsync: bool = True,
+    fsync_dir: bool = False,
+) -> Path:
+    """
+    Replace path with data in one step.
+
+    Args:
+        path: Target file (parent directories are created)
+        data: Content; str is encoded as UTF-8
+        checksum: Append a `#sha256:` footer line
+        fsync: Flush the temp file to disk before the rename
+        fsync_dir: Also fsync the directory after the rename
+    """
+    path = Path(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if checksum:
+        data = add_footer(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    if fsync_dir:
+        _fsync_dir(path.parent)
+    return path
+
+
+def atomic_write_json(
+    path: Union[str, Path],
+    obj: Any,
+    checksum: bool = False,
+    fsync: bool = True,
+    fsync_dir: bool = False,
+    **dump_kwargs: Any,
+) -> Path:
+    """Serialize obj as JSON and write it with atomic_write()."""
+    return atomic_write(
+        path,
+        json.dumps(obj, **dump_kwargs),
+        checksum=checksum,
+        fsync=fsync,
+        fsync_dir=fsync_dir,
+    )
+
+
+def write_state(path: Union[str, Path], obj: Any, **dump_kwargs: Any) -> Path:
+    """Durably write a JSON state file (checksummed if STATE_CHECKSUM is on)."""
+    return atomic_write_json(
+        path, obj, checksum=STATE_CHECKSUM, fsync_dir=True, **dump_kwargs
+    )
+
+
+def read_verified(path: Union[str, Path]) -> bytes:
+    """A file's content with its checksum footer verified and removed."""
+    return strip_footer(Path(path).read_bytes(), source=str(path))
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file written by this module (footer optional)."""
+    return json.loads(read_verified(path))
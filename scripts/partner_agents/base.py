@@ -11,6 +11,8 @@ from datetime import datetime
 from enum import Enum
 import logging
 
+from .tracing import Tracer, tracer, current_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,6 +57,8 @@ class HandoffRequest:
     skill_name: str
     context: Dict[str, Any]
     created_at: datetime = field(default_factory=datetime.now)
+    trace_id: Optional[str] = None
+    span_id: Optional[str] = None
 
 
 class BaseAgent(ABC):
@@ -71,6 +75,8 @@ class BaseAgent(ABC):
         self.skills: Dict[str, AgentSkill] = {}
         self.telemetry: Dict[str, Any] = {}
         self.current_task: Optional[HandoffRequest] = None
+        # Replaced by the orchestrator's tracer in register_driver
+        self.tracer: Tracer = tracer
 
     @abstractmethod
     def get_persona(self) -> Dict[str, Any]:
@@ -98,10 +104,23 @@ class BaseAgent(ABC):
             raise ValueError(f"{self.name} doesn't have skill: {skill_name}")
 
         skill = self.skills[skill_name]
+
+        # Join the handoff's trace if we were called outside its span
+        trace_id = parent_span_id = None
+        if current_span() is None and self.current_task is not None:
+            trace_id = self.current_task.trace_id
+            parent_span_id = self.current_task.span_id
+
         self.status = AgentStatus.IN_PIT
         try:
-            result = skill.callback(context)
-            return result
+            with self.tracer.span(
+                f"skill:{skill_name}",
+                driver=self.agent_id,
+                skill=skill_name,
+                trace_id=trace_id,
+                parent_span_id=parent_span_id,
+            ):
+                return skill.callback(context)
         finally:
             self.status = AgentStatus.ON_TRACK
 
@@ -125,11 +144,13 @@ class BaseAgent(ABC):
 
     def get_telemetry(self) -> Dict[str, Any]:
         """Return current driver stats"""
+        latency = self.tracer.drivers.get(self.agent_id)
         return {
             "agent_id": self.agent_id,
             "status": self.status.value,
             "skills_count": len(self.skills),
             "telemetry": self.telemetry,
+            "latency": latency.to_dict() if latency else None,
         }
 
     def update_telemetry(self, key: str, value: Any):
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Blob Store - Content-addressed storage for generated documents
+Like a shared parts bin: one copy of every part, however many cars use it.
+
+Rendered documents are stored once under the SHA-256 of their content,
+optionally gzip-compressed. Partner catalogs point at blobs by digest, so
+identical renders (the same NDA for many partners on the same day) share a
+single file.
+
+Layout:
+    partners/.blobs/ab/ab12...ef.gz
+"""
+
+import gzip
+import hashlib
+from pathlib import Path
+from typing import Union
+
+from .atomic import atomic_write
+
+BLOB_DIR = ".blobs"
+
+
+class BlobStore:
+    """
+    Hash-named blob files under one root directory.
+
+    Args:
+        root: Directory holding the blobs
+        compress: Gzip new blobs (existing blobs are read either way)
+    """
+
+    def __init__(self, root: Union[str, Path], compress: bool = True):
+        self.root = Path(root)
+        self.compress = compress
+
+    @staticmethod
+    def digest(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _candidates(self, digest: str):
+        folder = self.root / digest[:2]
+        return folder / f"{digest}.gz", folder / f"{digest}.md"
+
+    def path_for(self, digest: str) -> Path:
+        """Where a blob with this digest is (or would be) stored."""
+        compressed, plain = self._candidates(digest)
+        if plain.exists() and not compressed.exists():
+            return plain
+        return compressed if self.compress else plain
+
+    def exists(self, digest: str) -> bool:
+        return any(p.exists() for p in self._candidates(digest))
+
+    def put(self, content: str) -> str:
+        """Store content if it is new and return its digest."""
+        digest = self.digest(content)
+        if self.exists(digest):
+            return digest
+
+        data = content.encode("utf-8")
+        if self.compress:
+            data = gzip.compress(data, mtime=0)
+        atomic_write(self.path_for(digest), data)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Read a blob's content. Raises FileNotFoundError if missing."""
+        compressed, plain = self._candidates(digest)
+        if compressed.exists():
+            return gzip.decompress(compressed.read_bytes()).decode("utf-8")
+        return plain.read_text(encoding="utf-8")
@@ -24,7 +24,6 @@ Usage:
     )
 """
 
-import json
 import os
 import re
 from pathlib import Path
@@ -32,10 +31,18 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
+from . import retrieval
+from .atomic import read_json, write_state
+from .tracing import tracer
+
 # Base directory
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 MEMORY_DIR = REPO_ROOT / "partners" / ".memory"
 
+# Template passages attached to each prompt (0 disables retrieval)
+RETRIEVAL_TOP_K = int(os.environ.get("PARTNERAGENTS_RETRIEVAL_TOP_K", "4"))
+RETRIEVAL_TOKEN_BUDGET = int(os.environ.get("PARTNERAGENTS_RETRIEVAL_BUDGET", "800"))
+
 
 @dataclass
 class Message:
@@ -74,15 +81,14 @@ class ConversationMemory:
         """Load all conversations from disk"""
         for f in self.memory_dir.glob("*.json"):
             try:
-                with open(f, "r") as fp:
-                    data = json.load(fp)
-                    conv = Conversation(
-                        id=data["id"],
-                        created_at=data["created_at"],
-                        messages=[Message(**m) for m in data.get("messages", [])],
-                        context=data.get("context", {}),
-                    )
-                    self.conversations[conv.id] = conv
+                data = read_json(f)
+                conv = Conversation(
+                    id=data["id"],
+                    created_at=data["created_at"],
+                    messages=[Message(**m) for m in data.get("messages", [])],
+                    context=data.get("context", {}),
+                )
+                self.conversations[conv.id] = conv
             except Exception:
                 pass
 
@@ -108,8 +114,7 @@ class ConversationMemory:
             "context": conv.context,
         }
 
-        with open(self._conversation_file(conv_id), "w") as fp:
-            json.dump(data, fp, indent=2)
+        write_state(self._conversation_file(conv_id), data, indent=2)
 
     def get_or_create(self, conv_id: str = "default") -> Conversation:
         """Get existing or create new conversation"""
@@ -240,6 +245,23 @@ AGENT_SKILLS = {
 }
 
 
+def build_reference_context(user_message: str) -> str:
+    """Relevant template passages for the prompt, within the token budget"""
+    if RETRIEVAL_TOP_K <= 0 or RETRIEVAL_TOKEN_BUDGET <= 0:
+        return ""
+    with tracer.span("retrieval") as span:
+        try:
+            passages = retrieval.get_chunk_index().retrieve(
+                user_message, RETRIEVAL_TOP_K, RETRIEVAL_TOKEN_BUDGET
+            )
+        except OSError as e:
+            # A missing or unreadable index must never break the chat turn
+            span.error = f"{type(e).__name__}: {e}"
+            return ""
+        span.attributes["passages"] = len(passages)
+    return retrieval.format_passages(passages)
+
+
 def build_swarm_prompt(user_message: str, conv_id: str = "default") -> str:
     """Build the system prompt for the agent swarm"""
 
@@ -261,6 +283,8 @@ CURRENT PARTNER: {current_partner}
             role = "User" if msg["role"] == "user" else msg.get("agent", "Assistant")
             history_text += f"{role}: {msg['content'][:200]}...\n"
 
+    reference_text = build_reference_context(user_message)
+
     skills_list = []
     for agent_id, agent_data in AGENT_SKILLS.items():
         for skill_name, skill_desc in agent_data["skills"].items():
@@ -272,7 +296,7 @@ CURRENT PARTNER: {current_partner}
 
 Your job is to understand what the user wants and orchestrate the right agents to get it done.
 
-{partner_context}{history_text}
+{partner_context}{history_text}{reference_text}
 
 AVAILABLE AGENTS AND SKILLS:
 {skills_text}
@@ -284,6 +308,7 @@ INSTRUCTIONS:
 4. Execute the skill and return a helpful response
 5. Tell the user which agent handled their request
 6. If you need more info, ask clarifying questions
+7. When reference material is given, ground answers in it and cite the template
 
 Response format:
 - Be conversational and helpful
@@ -367,40 +392,47 @@ class ChatOrchestrator:
         self, user_message: str, conv_id: str = "default", llm_client=None
     ) -> Dict[str, Any]:
         """Main chat interface - orchestrates the agent swarm"""
+        with tracer.span("chat", conv_id=conv_id) as span:
 
-        # Save user message
-        self.memory.add_message(conv_id, "user", user_message)
+            # Save user message
+            self.memory.add_message(conv_id, "user", user_message)
 
-        # Extract partner mentions and update context
-        partners = extract_partner_mentions(user_message)
-        if partners:
-            partner_name = partners[0]
-            self.memory.set_context(conv_id, "current_partner", partner_name)
+            # Extract partner mentions and update context
+            partners = extract_partner_mentions(user_message)
+            if partners:
+                partner_name = partners[0]
+                self.memory.set_context(conv_id, "current_partner", partner_name)
 
-        # Build prompt
-        system_prompt = build_swarm_prompt(user_message, conv_id)
+            # Build prompt
+            system_prompt = build_swarm_prompt(user_message, conv_id)
 
-        # Get history for LLM
-        history = self.memory.get_history(conv_id, limit=10)
+            # Get history for LLM
+            history = self.memory.get_history(conv_id, limit=10)
 
-        # Call LLM
-        response_text = ""
-        agent_used = "swarm"
+            # Call LLM
+            response_text = ""
+            agent_used = "swarm"
 
-        if llm_client:
-            response_text = await llm_client(system_prompt, user_message, history)
-        else:
-            # Fallback response
-            response_text = self._fallback_response(user_message)
+            if llm_client:
+                with tracer.span("llm", driver=agent_used):
+                    response_text = await llm_client(
+                        system_prompt, user_message, history
+                    )
+            else:
+                # Fallback response
+                response_text = self._fallback_response(user_message)
 
-        # Save assistant response
-        self.memory.add_message(conv_id, "assistant", response_text, agent=agent_used)
+            # Save assistant response
+            self.memory.add_message(
+                conv_id, "assistant", response_text, agent=agent_used
+            )
 
-        return {
-            "response": response_text,
-            "agent": agent_used,
-            "partners_detected": partners,
-        }
+            return {
+                "response": response_text,
+                "agent": agent_used,
+                "partners_detected": partners,
+                "trace_id": span.trace_id,
+            }
 
     def _fallback_response(self, message: str) -> str:
         """Fallback when no LLM available"""
@@ -42,13 +42,21 @@ except ImportError:
     RICH_AVAILABLE = False
 
 # Add scripts to path
-import json
 import re
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
 
-from partner_agents import router, partner_state, document_generator
+from partner_agents import (
+    router,
+    partner_state,
+    document_generator,
+    template_search,
+    chat_orchestrator,
+    usage,
+)
+from partner_agents.llm_gateway import gateway, GatewayUnavailable, ProviderError
+from partner_agents.usage import usage_store
 
 console = Console() if RICH_AVAILABLE else None
 
@@ -168,8 +176,6 @@ async def send_message(
         model: Model to use
         last_partner: Previous partner name from conversation context
     """
-    import httpx
-
     # Use the web.py chat handler logic
     sanitized = message.strip()
 
@@ -305,76 +311,11 @@ async def send_message(
 
                 # Full onboarding: create NDA + MSA + DPA + checklist
                 if intent.name == "onboard":
-                    created_docs = []
-
-                    # Create NDA, MSA, DPA
-                    for doc in ["nda", "msa", "dpa"]:
-                        doc_result = document_generator.create_document(
-                            doc_type=doc,
-                            partner_name=partner_name,
-                            fields=intent.entities,
-                        )
-                        if doc_result:
-                            partner_state.add_document(
-                                partner_name=partner_name,
-                                doc_type=doc,
-                                template=doc_result["template"],
-                                file_path=doc_result["path"],
-                                fields=doc_result["fields"],
-                                status="draft",
-                            )
-                            created_docs.append(doc.upper())
-
-                    # Create onboarding checklist document
-                    checklist_content = f"""# Onboarding Checklist for {partner_name}
-
-## Week 1: Foundation
-- [ ] Send welcome email
-- [ ] Schedule kickoff call
-- [ ] Share partner portal access
-- [ ] Provide product training schedule
-
-## Week 2-3: Technical Enablement
-- [ ] Complete technical integration setup
-- [ ] Test API connections
-- [ ] Review documentation and resources
-- [ ] Set up sandbox environment
-
-## Week 4: Go-to-Market
-- [ ] Finalize joint GTM plan
-- [ ] Co-branded marketing materials
-- [ ] Announce partnership (if applicable)
-- [ ] First co-sell opportunity identified
-
-## First 90 Days
-- [ ] Complete certification (if applicable)
-- [ ] First deal registered
-- [ ] QBR scheduled
-- [ ] Expansion opportunities identified
-"""
-                    # Save checklist
-                    from pathlib import Path
-                    import os
-                    from datetime import datetime
-
-                    slug = partner_name.lower().replace(" ", "-")
-                    checklist_dir = Path(f"partners/{slug}/documents")
-                    checklist_dir.mkdir(parents=True, exist_ok=True)
-                    checklist_path = (
-                        checklist_dir
-                        / f"{datetime.now().strftime('%Y-%m-%d')}-onboarding-checklist.md"
-                    )
-                    checklist_path.write_text(checklist_content)
-
-                    partner_state.add_document(
-                        partner_name=partner_name,
-                        doc_type="checklist",
-                        template="recruitment/09-onboarding.md",
-                        file_path=str(checklist_path),
-                        fields={"partner_name": partner_name},
-                        status="draft",
+                    packet = document_generator.create_onboarding_packet(
+                        partner_name, intent.entities
                     )
-                    created_docs.append("CHECKLIST")
+                    partner_state.add_documents(partner_name, packet)
+                    created_docs = [doc["doc_type"].upper() for doc in packet]
 
                     return {
                         "response": f"## Onboarded **{partner_name}**!\n\nCreated:\n"
@@ -656,111 +597,49 @@ Available commands the user can use:
 
 Be concise and helpful. If the user asks something outside of partner management, politely redirect to what you can help with."""
 
-    # Streaming response collector
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": sanitized},
+    ]
     full_content = ""
-
-    # Show typing indicator
-    if RICH_AVAILABLE:
-        with console.status("[bold green]Thinking...", spinner="dots") as status:
-            try:
-                async with httpx.AsyncClient() as client:
-                    async with client.stream(
-                        "POST",
-                        "https://openrouter.ai/api/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json={
-                            "model": model,
-                            "messages": [
-                                {"role": "system", "content": system_prompt},
-                                {"role": "user", "content": sanitized},
-                            ],
-                            "stream": True,
-                        },
-                        timeout=60.0,
-                    ) as response:
-                        if response.status_code == 200:
-                            buffer = ""
-
-                            async for line in response.aiter_lines():
-                                if not line or not line.startswith("data: "):
-                                    continue
-
-                                if line == "data: [DONE]":
-                                    break
-
-                                try:
-                                    data = json.loads(line[6:])
-                                    delta = data.get("choices", [{}])[0].get(
-                                        "delta", {}
-                                    )
-                                    content = delta.get("content", "")
-                                    if content:
-                                        buffer += content
-
-                                        # Buffer chunks before displaying (wait for complete words)
-                                        if " " in buffer or "\n" in buffer:
-                                            full_content += buffer
-                                            buffer = ""
-
-                                except json.JSONDecodeError:
-                                    continue
-                        else:
-                            return {
-                                "response": f"AI Error: {response.status_code}",
-                                "agent": "system",
-                            }
-            except Exception as e:
-                return {
-                    "response": f"Error calling AI: {str(e)}",
-                    "agent": "system",
-                }
-    else:
-        # Fallback for non-rich environments
-        try:
-            async with httpx.AsyncClient() as client:
-                async with client.stream(
-                    "POST",
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": model,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": sanitized},
-                        ],
-                        "stream": True,
-                    },
+    try:
+        if RICH_AVAILABLE:
+            with console.status("[bold green]Thinking...", spinner="dots"):
+                reply = await gateway.complete(
+                    "openrouter",
+                    model,
+                    messages,
+                    api_key=api_key,
                     timeout=60.0,
-                ) as response:
-                    if response.status_code == 200:
-                        buffer = ""
-                        async for line in response.aiter_lines():
-                            if not line or not line.startswith("data: "):
-                                continue
-                            if line == "data: [DONE]":
-                                break
-                            try:
-                                data = json.loads(line[6:])
-                                delta = data.get("choices", [{}])[0].get("delta", {})
-                                content = delta.get("content", "")
-                                if content:
-                                    buffer += content
-                                    if " " in buffer or "\n" in buffer:
-                                        full_content += buffer
-                                        buffer = ""
-                            except json.JSONDecodeError:
-                                continue
-        except Exception as e:
-            return {
-                "response": f"Error calling AI: {str(e)}",
-                "agent": "system",
-            }
+                    conversation="cli",
+                    agent="ai_assistant",
+                )
+        else:
+            reply = await gateway.complete(
+                "openrouter",
+                model,
+                messages,
+                api_key=api_key,
+                timeout=60.0,
+                conversation="cli",
+                agent="ai_assistant",
+            )
+        full_content = reply.content
+    except GatewayUnavailable:
+        return {
+            "response": chat_orchestrator.orchestrator._fallback_response(sanitized),
+            "agent": "swarm",
+        }
+    except ProviderError as e:
+        return {
+            "response": f"AI Error: {e.status_code}",
+            "agent": "system",
+        }
+    except Exception as e:
+        return {
+            "response": f"Error calling AI: {str(e)}",
+            "agent": "system",
+        }
 
     if full_content:
         return {
@@ -820,6 +699,15 @@ SLASH_COMMANDS = {
     "partners": ("List all partners", "Show all partners in your program"),
     "status": ("Check partner status", "Usage: /status <partner_name>"),
     "onboard": ("Onboard a partner", "Usage: /onboard <partner_name>"),
+    "bulk": (
+        "Generate a document for many partners",
+        "Usage: /bulk <nda|msa|dpa> [tier]",
+    ),
+    "catalog": (
+        "Rebuild or compact document storage",
+        "Usage: /catalog rebuild [partner_name] | /catalog compact",
+    ),
+    "search": ("Search templates", "Usage: /search <query>"),
     "deal": ("Register a deal", "Usage: /deal <partner>, $<amount>"),
     "email": ("Generate outreach email", "Usage: /email <partner_name>"),
     "qbr": ("Schedule QBR", "Usage: /qbr <partner_name>"),
@@ -834,7 +722,10 @@ SLASH_COMMANDS = {
     "exit": ("Exit the CLI", "Exit PartnerAgents"),
     "source": ("Manage data sources", "Connect/disconnect data sources"),
     "think": ("Toggle thinking mode", "Show AI reasoning process"),
-    "tokens": ("Show token usage", "Display token count for this session"),
+    "tokens": (
+        "Show token usage and cost",
+        "Totals by conversation, model, agent or day: /tokens [by] [csv]",
+    ),
 }
 
 
@@ -932,6 +823,79 @@ async def handle_slash_command(
         else:
             response["response"] = "Usage: /onboard <partner_name>"
 
+    elif cmd == "bulk":
+        doc_type = args[0].lower() if args else ""
+        if doc_type not in document_generator.TEMPLATE_MAP:
+            response["response"] = "Usage: /bulk <nda|msa|dpa> [tier]"
+        else:
+            tier = args[1] if len(args) > 1 else None
+
+            def report(done, total, entry):
+                if console is not None and (done == total or done % 100 == 0):
+                    console.print(f"  {done}/{total} {doc_type.upper()} documents")
+
+            manifest = document_generator.create_documents_bulk(
+                doc_type,
+                {"tier": tier} if tier else None,
+                progress=report,
+                manifest_dir=document_generator.DOCUMENTS_DIR / ".manifests",
+            )
+            scope = f"{tier} partners" if tier else "all partners"
+            lines = [
+                f"## Bulk {doc_type.upper()} for {scope}",
+                "",
+                f"- **Created:** {manifest['created']}/{manifest['total']}",
+                f"- **Failed:** {manifest['failed']}",
+            ]
+            if manifest.get("manifest_path"):
+                lines.append(f"- **Manifest:** `{manifest['manifest_path']}`")
+            for error in manifest["errors"][:5]:
+                lines.append(f"  - {error['partner']}: {error['error']}")
+            response = {
+                "response": "\n".join(lines),
+                "agent": "engine",
+                "manifest": manifest,
+            }
+
+    elif cmd == "catalog":
+        if args and args[0].lower() == "rebuild":
+            partner_name = " ".join(args[1:]) or None
+            counts = document_generator.rebuild_catalog(partner_name)
+            if counts:
+                response["response"] = "Rebuilt document catalogs:\n" + "\n".join(
+                    f"  - {slug}: {count} documents" for slug, count in counts.items()
+                )
+            else:
+                response["response"] = "No partner documents found."
+        elif args and args[0].lower() == "compact":
+            counts = document_generator.compact_documents()
+            response["response"] = (
+                f"Moved {counts['files']} documents into "
+                f"{counts['blobs']} shared blobs."
+            )
+        else:
+            response["response"] = (
+                "Usage: /catalog rebuild [partner_name] | /catalog compact"
+            )
+
+    elif cmd == "search":
+        if args:
+            query = " ".join(args)
+            results = template_search.search_templates(query, limit=8)
+            if results:
+                response["response"] = f"## Templates matching '{query}'\n\n" + (
+                    "\n".join(
+                        f"- **{r['title']}** (`{r['path']}`)"
+                        + (f" - {r['description']}" if r["description"] else "")
+                        for r in results
+                    )
+                )
+            else:
+                response["response"] = f"No templates match '{query}'."
+            response["results"] = results
+        else:
+            response["response"] = "Usage: /search <query>"
+
     elif cmd == "deal":
         if args:
             # Parse "partner, $amount"
@@ -1101,7 +1065,7 @@ Enter your values to calculate specific ROI."""
         response["response"] = """## Data Sources
 
 Current sources:
-- partners.json (local database)
+- Partner store (scripts/partner_agent/state)
 
 Connect more sources:
 - Salesforce
@@ -1112,7 +1076,51 @@ Connect more sources:
         response["response"] = "Thinking mode: Shows AI reasoning - coming soon"
 
     elif cmd == "tokens":
-        response["response"] = "Token tracking - coming soon"
+        by = next((a for a in args if a in usage.DIMENSIONS), "model")
+        stats = gateway.metrics()
+        if "csv" in args:
+            response["response"] = usage_store.to_csv(by)
+            response["usage"] = {"by": by, "models": stats["models"]}
+            return response
+
+        totals = usage_store.summary()
+        rows = usage_store.rows(by)
+        lines = [
+            f"## Token usage by {by}",
+            "",
+            f"**All time:** {totals['prompt_tokens']:,} prompt / "
+            f"{totals['completion_tokens']:,} completion tokens, "
+            f"{totals['calls']} calls, ${totals['cost_usd']:.4f}",
+            "",
+        ]
+        for row in rows[:15]:
+            lines.append(
+                f"- **{row['key']}:** {row['prompt_tokens']:,} prompt / "
+                f"{row['completion_tokens']:,} completion tokens, "
+                f"{row['calls']} calls ({row['cached_calls']} cached), "
+                f"{row['avg_latency_ms']:.0f} ms avg, ${row['cost_usd']:.4f}"
+            )
+        if not rows:
+            lines.append("- No LLM calls yet")
+        cache = stats.get("cache")
+        if cache:
+            lines += [
+                "",
+                f"**Cache:** {cache['hit_rate']:.0%} hit rate "
+                f"({cache['exact_hits']} exact, {cache['similar_hits']} similar, "
+                f"{cache['misses']} misses), {cache['entries']} entries",
+            ]
+        lines += [
+            "",
+            "Group with `/tokens conversation|model|agent|day`, add `csv` to export",
+        ]
+        response["response"] = "\n".join(lines)
+        response["usage"] = {
+            "by": by,
+            "summary": totals,
+            "rows": rows,
+            "models": stats["models"],
+        }
 
     else:
         response["response"] = f"Unknown command: /{cmd}\nUse /help for all commands"
@@ -1289,6 +1297,14 @@ async def one_shot_mode(message: str, api_key: str, model: str):
     print_response(response)
 
 
+async def run_mode(mode):
+    """Run a chat mode, then close the gateway's pool before the loop ends."""
+    try:
+        await mode
+    finally:
+        await gateway.aclose()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="PartnerAgents CLI - Chat with the agent swarm",
@@ -1324,10 +1340,10 @@ Examples:
 
     if args.message:
         # One-shot mode
-        asyncio.run(one_shot_mode(args.message, api_key, model))
+        asyncio.run(run_mode(one_shot_mode(args.message, api_key, model)))
     else:
         # Interactive mode
-        asyncio.run(interactive_mode(api_key, model))
+        asyncio.run(run_mode(interactive_mode(api_key, model)))
 
 
 if __name__ == "__main__":
@@ -47,7 +47,11 @@ class TeamConfig:
         default_factory=lambda: {
             "state_dir": "scripts/partner_agents/state",
             "log_retention_days": 90,
+            "activity_tail_size": 1000,
             "metrics_refresh_minutes": 15,
+            "radio_log_dir": None,
+            "radio_segment_bytes": 1_048_576,
+            "radio_max_segments": None,
         }
     )
 
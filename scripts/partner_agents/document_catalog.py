@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Document Catalog - Per-partner index of generated documents
+Like the team's parts ledger: know what's on the car without taking it apart.
+
+Each partner's documents directory holds a .catalog.json listing every
+document with its type, date, size and save time. The catalog is updated as
+documents are saved, so "latest NDA" or "documents from last quarter" are
+answered from one small file instead of globbing and stat-ing the directory.
+rebuild() re-derives the catalog from disk when files were added or removed
+by hand.
+
+In content-addressed storage mode an entry carries a "blob" digest instead
+of a file on disk; read() resolves either kind.
+
+Layout:
+    partners/<slug>/documents/.catalog.json
+    partners/<slug>/documents/<date>-<type>.md
+    partners/.blobs/<xx>/<digest>.gz
+"""
+
+import re
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .atomic import read_json, write_state
+from .blob_store import BLOB_DIR, BlobStore
+
+CATALOG_FILE = ".catalog.json"
+
+_DATED_NAME_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-(.+)\.md$")
+
+DateLike = Union[date, datetime, str, None]
+
+# Parsed catalogs keyed by catalog path, validated by (mtime_ns, size)
+_cache: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+# One lock per catalog file: saves for different partners never wait on
+# each other, only read-modify-writes of the same catalog are serialized
+_locks: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    with _locks_lock:
+        return _locks.setdefault(str(path), threading.Lock())
+
+
+def _entry_for(
+    path: Path,
+    saved_at: Optional[float] = None,
+    blob: Optional[str] = None,
+    size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Catalog entry for one document file or blob."""
+    match = _DATED_NAME_RE.match(path.name)
+    entry = {
+        "filename": path.name,
+        "doc_type": match.group(2) if match else path.stem,
+        "date": match.group(1) if match else None,
+    }
+    if blob is None:
+        stat = path.stat()
+        entry["size"] = stat.st_size
+        entry["modified"] = saved_at if saved_at is not None else stat.st_mtime
+    else:
+        entry["size"] = size
+        entry["modified"] = saved_at if saved_at is not None else time.time()
+        entry["blob"] = blob
+    return entry
+
+
+def _to_date(value: DateLike) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat()
+
+
+class DocumentCatalog:
+    """The catalog for one partner documents directory."""
+
+    def __init__(self, documents_dir: Path):
+        self.documents_dir = Path(documents_dir)
+        self.path = self.documents_dir / CATALOG_FILE
+        self._lock = _lock_for(self.path)
+        self.blobs = BlobStore(self.documents_dir.parent.parent / BLOB_DIR)
+
+    def _read(self) -> Optional[List[Dict[str, Any]]]:
+        """Entries from disk (cached), or None if there is no catalog yet."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        key = str(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        try:
+            entries = read_json(self.path)["documents"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        _cache[key] = (signature, entries)
+        return entries
+
+    def _write(self, entries: List[Dict[str, Any]]):
+        entries.sort(key=lambda e: e["modified"], reverse=True)
+        write_state(self.path, {"documents": entries}, indent=2)
+        stat = self.path.stat()
+        _cache[str(self.path)] = ((stat.st_mtime_ns, stat.st_size), entries)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """All entries, newest first, rebuilding if the catalog is missing."""
+        entries = self._read()
+        if entries is None:
+            if not self.documents_dir.exists():
+                return []
+            entries = self.rebuild()
+        return entries
+
+    def record(
+        self,
+        file_path: Path,
+        blob: Optional[str] = None,
+        size: Optional[int] = None,
+        saved_at: Optional[float] = None,
+    ):
+        """Add or replace the entry for a just-saved document or blob."""
+        with self._lock:
+            entries = self._read()
+            if entries is None:
+                entries = self._scan([])
+            entries = [e for e in entries if e["filename"] != file_path.name]
+            saved_at = saved_at if saved_at is not None else time.time()
+            entries.append(_entry_for(file_path, saved_at, blob, size))
+            self._write(entries)
+
+    def _blob_entries(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Blob-backed entries whose blob is still present."""
+        return [e for e in entries if e.get("blob") and self.blobs.exists(e["blob"])]
+
+    def _scan(self, keep: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        files = [_entry_for(p) for p in self.documents_dir.glob("*.md") if p.is_file()]
+        on_disk = {e["filename"] for e in files}
+        return files + [e for e in keep if e["filename"] not in on_disk]
+
+    def rebuild(self) -> List[Dict[str, Any]]:
+        """Re-derive the catalog from the files and blobs on disk."""
+        with self._lock:
+            entries = self._scan(self._blob_entries(self._read() or []))
+            self._write(entries)
+            return entries
+
+    def _exists(self, entry: Dict[str, Any]) -> bool:
+        if entry.get("blob"):
+            return self.blobs.exists(entry["blob"])
+        return (self.documents_dir / entry["filename"]).exists()
+
+    def read(self, filename: str) -> Optional[str]:
+        """Content of a catalogued document, from its file or its blob."""
+        path = self.documents_dir / filename
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+        for entry in self.entries():
+            if entry["filename"] == filename and entry.get("blob"):
+                try:
+                    return self.blobs.get(entry["blob"])
+                except FileNotFoundError:
+                    return None
+        return None
+
+    def find(
+        self,
+        doc_type: Optional[str] = None,
+        start: DateLike = None,
+        end: DateLike = None,
+    ) -> List[Dict[str, Any]]:
+        """Entries matching a type and/or document date range, newest first."""
+        start_date, end_date = _to_date(start), _to_date(end)
+        results = []
+        for entry in self.entries():
+            if doc_type is not None and entry["doc_type"] != doc_type:
+                continue
+            day = entry["date"] or date.fromtimestamp(entry["modified"]).isoformat()
+            if start_date is not None and day < start_date:
+                continue
+            if end_date is not None and day > end_date:
+                continue
+            results.append(entry)
+        return results
+
+    def latest(self, doc_type: str) -> Optional[Path]:
+        """Path of the newest document of a type."""
+        matches = self.find(doc_type)
+        if not matches:
+            return None
+        path = self.documents_dir / matches[0]["filename"]
+        if not self._exists(matches[0]):
+            # Drift: the file was removed behind the catalog's back
+            self.rebuild()
+            matches = self.find(doc_type)
+            return self.documents_dir / matches[0]["filename"] if matches else None
+        return path
+
+
+def rebuild_all(documents_root: Path) -> Dict[str, int]:
+    """Rebuild the catalog of every partner under documents_root."""
+    counts = {}
+    for documents_dir in sorted(Path(documents_root).glob("*/documents")):
+        counts[documents_dir.parent.name] = len(
+            DocumentCatalog(documents_dir).rebuild()
+        )
+    return counts
@@ -13,21 +13,83 @@ Placeholder patterns supported:
 - $variable or ${variable} - dollar style
 - ___field___ - underscore style
 
+Onboarding packet: NDA, MSA, DPA and an onboarding checklist, rendered and
+written concurrently by create_onboarding_packet().
+
 Output: partners/<partner-slug>/documents/<date>-<type>.md
+
+Set PARTNERAGENTS_DOC_STORAGE=cas to store rendered documents as shared,
+content-addressed blobs (partners/.blobs) instead of one file per document;
+paths stay the same and read_document() resolves them either way.
+PARTNERAGENTS_DOC_COMPRESS=0 stores blobs uncompressed.
+
+Parsed templates are cached per process and revalidated by file mtime and
+size, so repeated documents parse each template once. Set
+PARTNERAGENTS_TEMPLATE_CACHE_SIZE to change the number of cached templates.
 """
 
 import re
 import os
 import html
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .blob_store import BlobStore
+from .document_catalog import DateLike, DocumentCatalog, rebuild_all
 
 # Base directory - PartnerAgents root
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 TEMPLATES_DIR = REPO_ROOT / "partneros-docs" / "src" / "content" / "docs"
 DOCUMENTS_DIR = REPO_ROOT / "partners"
 
+# "files" writes each document; "cas" stores deduplicated blobs
+STORAGE_MODE = os.environ.get("PARTNERAGENTS_DOC_STORAGE", "files").lower()
+COMPRESS_BLOBS = os.environ.get("PARTNERAGENTS_DOC_COMPRESS", "1") != "0"
+
+
+# Document type -> template path under TEMPLATES_DIR
+TEMPLATE_MAP = {
+    "nda": "legal/01-nda.md",
+    "msa": "legal/02-msa.md",
+    "dpa": "legal/03-dpa.md",
+}
+
+# Documents created for every newly onboarded partner
+ONBOARDING_PACKET = ("nda", "msa", "dpa")
+CHECKLIST_TEMPLATE = "recruitment/09-onboarding.md"
+
+ONBOARDING_CHECKLIST = """# Onboarding Checklist for {partner_name}
+
+## Week 1: Foundation
+- [ ] Send welcome email
+- [ ] Schedule kickoff call
+- [ ] Share partner portal access
+- [ ] Provide product training schedule
+
+## Week 2-3: Technical Enablement
+- [ ] Complete technical integration setup
+- [ ] Test API connections
+- [ ] Review documentation and resources
+- [ ] Set up sandbox environment
+
+## Week 4: Go-to-Market
+- [ ] Finalize joint GTM plan
+- [ ] Co-branded marketing materials
+- [ ] Announce partnership (if applicable)
+- [ ] First co-sell opportunity identified
+
+## First 90 Days
+- [ ] Complete certification (if applicable)
+- [ ] First deal registered
+- [ ] QBR scheduled
+- [ ] Expansion opportunities identified
+"""
+
 
 def _slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
@@ -37,6 +99,18 @@ def _slugify(text: str) -> str:
     return text.strip("-")
 
 
+def _matches(partner: Dict, partner_filter) -> bool:
+    """Apply a bulk partner filter (callable or field dict)."""
+    if partner_filter is None:
+        return True
+    if callable(partner_filter):
+        return bool(partner_filter(partner))
+    return all(
+        str(partner.get(key, "")).lower() == str(value).lower()
+        for key, value in partner_filter.items()
+    )
+
+
 def _ensure_partner_dir(partner_name: str) -> Path:
     """Ensure partner directory exists."""
     slug = _slugify(partner_name)
@@ -45,39 +119,109 @@ def _ensure_partner_dir(partner_name: str) -> Path:
     return partner_dir
 
 
-def extract_placeholders(content: str) -> List[str]:
-    """Extract all placeholder patterns from template content."""
-    placeholders = set()
+# Placeholder patterns, applied in this order when filling
+BRACKET_RE = re.compile(r"\[([^\]]+)\]")
+DOLLAR_RE = re.compile(r"\$\{?(\w+)\}?")
+UNDERSCORE_RE = re.compile(r"___([a-z_]+)___")
+PLACEHOLDER_PATTERNS = (
+    ("bracket", BRACKET_RE),
+    ("dollar", DOLLAR_RE),
+    ("underscore", UNDERSCORE_RE),
+)
 
-    # Pattern 1: [Placeholder Name]
-    bracket_pattern = r"\[([^\]]+)\]"
-    for match in re.finditer(bracket_pattern, content):
-        placeholders.add(match.group(1).strip())
 
-    # Pattern 2: $variable or ${variable}
-    dollar_pattern = r"\$\{?(\w+)\}?"
-    for match in re.finditer(dollar_pattern, content):
-        placeholders.add(match.group(1).strip())
+def build_placeholder_plan(content: str) -> Dict[str, List[str]]:
+    """Placeholder names found by each pattern, in first-seen order."""
+    plan = {}
+    for kind, pattern in PLACEHOLDER_PATTERNS:
+        names = dict.fromkeys(m.group(1).strip() for m in pattern.finditer(content))
+        plan[kind] = list(names)
+    return plan
 
-    # Pattern 3: ___field___
-    underscore_pattern = r"___([a-z_]+)___"
-    for match in re.finditer(underscore_pattern, content):
-        placeholders.add(match.group(1).strip())
 
+def extract_placeholders(content: str) -> List[str]:
+    """Extract all placeholder patterns from template content."""
+    placeholders = set()
+    for names in build_placeholder_plan(content).values():
+        placeholders.update(names)
     return list(placeholders)
 
 
-def load_template(template_path: str) -> Optional[Dict[str, Any]]:
-    """Load a template from the docs directory."""
-    # Handle both "legal/01-nda.md" and "legal/01-nda" formats
-    if not template_path.endswith(".md"):
-        template_path = template_path + ".md"
-
-    full_path = TEMPLATES_DIR / template_path
-
-    if not full_path.exists():
-        return None
-
+class TemplateCache:
+    """
+    Process-wide LRU cache of parsed templates.
+
+    Entries are keyed by absolute path and revalidated against the file's
+    mtime and size on every lookup, so edited templates are re-parsed.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Return the parsed template at path, parsing only if it changed"""
+        try:
+            stat = path.stat()
+        except OSError:
+            self.invalidate(path)
+            return None
+        key = str(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        parsed = _parse_template_file(path)
+        with self._lock:
+            self._entries[key] = (signature, parsed)
+            self._entries.move_to_end(key)
+            while self.max_size >= 0 and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return parsed
+
+    def invalidate(self, path: Optional[Path] = None):
+        """Drop one template, or everything when path is None"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+    def resize(self, max_size: int):
+        """Change the maximum number of cached templates"""
+        with self._lock:
+            self.max_size = max_size
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+template_cache = TemplateCache(
+    int(os.environ.get("PARTNERAGENTS_TEMPLATE_CACHE_SIZE", "128"))
+)
+
+
+def _parse_template_file(full_path: Path) -> Dict[str, Any]:
+    """Read a template and split frontmatter, body and placeholders."""
     with open(full_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -97,41 +241,187 @@ def load_template(template_path: str) -> Optional[Dict[str, Any]]:
                     key, value = line.split(":", 1)
                     frontmatter[key.strip()] = value.strip()
 
-    placeholders = extract_placeholders(body)
+    plan = build_placeholder_plan(body)
+    placeholders = list({name for names in plan.values() for name in names})
 
     return {
-        "path": str(full_path),
-        "relative_path": template_path,
         "frontmatter": frontmatter,
         "body": body,
         "placeholders": placeholders,
+        "plan": plan,
+        "compiled": CompiledTemplate(body, plan),
+    }
+
+
+def load_template(template_path: str) -> Optional[Dict[str, Any]]:
+    """Load a template from the docs directory."""
+    # Handle both "legal/01-nda.md" and "legal/01-nda" formats
+    if not template_path.endswith(".md"):
+        template_path = template_path + ".md"
+
+    full_path = TEMPLATES_DIR / template_path
+
+    parsed = template_cache.get(full_path)
+    if parsed is None:
+        return None
+
+    # Copy the mutable parts so callers cannot corrupt the cached entry
+    return {
+        "path": str(full_path),
+        "relative_path": template_path,
+        "frontmatter": dict(parsed["frontmatter"]),
+        "body": parsed["body"],
+        "placeholders": list(parsed["placeholders"]),
+        "plan": parsed["plan"],
+        "compiled": parsed["compiled"],
     }
 
 
+# Stands in for an already-filled slot while later patterns are matched
+_SLOT = "\x00"
+# Text around a filled slot that a later pattern could extend into
+_DOLLAR_HAZARD_RE = re.compile(r"\$\{?\w*\x00")
+_DOLLAR_TAIL_RE = re.compile(r"[\w{}]*")
+_UNDERSCORE_HAZARD_RE = re.compile(r"_[a-z_]*\x00|\x00[a-z_]*_")
+
+
+class CompiledTemplate:
+    """
+    A template tokenized into literal segments and placeholder slots.
+
+    fill_template's three passes each rescan the previous pass's output.
+    Here the passes run once per set of filled placeholder names: matches
+    are made on the literal text with filled slots held opaque, giving a
+    plan that renders with a single join. A render falls back to the
+    regex passes whenever a value could make a later pattern match
+    differently (e.g. a bracket value containing "$"), so output is always
+    identical.
+    """
+
+    MAX_PLANS = 32
+
+    def __init__(self, body: str, plan: Optional[Dict[str, List[str]]] = None):
+        self.body = body
+        plan = plan or build_placeholder_plan(body)
+        self.names = tuple(dict.fromkeys(n for names in plan.values() for n in names))
+        self._plans: Dict[frozenset, Optional[Tuple[List[str], list]]] = {}
+
+    def render(self, fields: Dict[str, Any]) -> str:
+        """Fill placeholders from fields"""
+        filled = frozenset(n for n in self.names if n in fields)
+        plan = self._plans.get(filled, False)
+        if plan is False:
+            if len(self._plans) >= self.MAX_PLANS:
+                self._plans.clear()
+            plan = self._plans[filled] = self._compile(filled)
+        if plan is None:
+            return _fill_passes(self.body, fields)
+
+        segments, slots = plan
+        out = list(segments)
+        for index, name, stage, guard in slots:
+            value = fields[name]
+            if (
+                not isinstance(value, str)
+                or (stage < 3 and "_" in value)
+                or (stage == 1 and "$" in value)
+            ):
+                return _fill_passes(self.body, fields)
+            if guard is not None:
+                # "$[X]": the value may complete a $variable placeholder
+                prefix, suffix = guard
+                match = DOLLAR_RE.match(prefix + value + suffix)
+                if match and match.group(1) in fields:
+                    return _fill_passes(self.body, fields)
+            out[index] = value
+        return "".join(out)
+
+    def _compile(self, filled: frozenset) -> Optional[Tuple[List[str], list]]:
+        """Build (segments, slots) for one set of filled names, or None"""
+        if _SLOT in self.body:
+            return None
+
+        text, slots = self.body, []
+        for stage, (kind, pattern) in enumerate(PLACEHOLDER_PATTERNS, start=1):
+            if kind == "dollar":
+                for hazard in _DOLLAR_HAZARD_RE.finditer(text):
+                    prefix = hazard.group(0)[:-1]
+                    suffix = _DOLLAR_TAIL_RE.match(text, hazard.end()).group(0)
+                    after = hazard.end() + len(suffix)
+                    if prefix not in ("$", "${") or text[after : after + 1] == _SLOT:
+                        return None
+                    index = text.count(_SLOT, 0, hazard.end() - 1)
+                    name, slot_stage, _ = slots[index]
+                    slots[index] = (name, slot_stage, (prefix, suffix))
+            if kind == "underscore" and _UNDERSCORE_HAZARD_RE.search(text):
+                return None
+
+            pieces, new_slots, pos, taken = [], [], 0, 0
+            for match in pattern.finditer(text):
+                if _SLOT in match.group(0):
+                    return None
+                name = match.group(1).strip()
+                if name not in filled:
+                    continue
+                before = text[pos : match.start()]
+                count = before.count(_SLOT)
+                new_slots.extend(slots[taken : taken + count])
+                taken += count
+                pieces.append(before)
+                pieces.append(_SLOT)
+                new_slots.append((name, stage, None))
+                pos = match.end()
+            pieces.append(text[pos:])
+            new_slots.extend(slots[taken:])
+            text, slots = "".join(pieces), new_slots
+
+        segments: List[str] = []
+        slot_plan = []
+        for i, literal in enumerate(text.split(_SLOT)):
+            if literal:
+                segments.append(literal)
+            if i < len(slots):
+                slot_plan.append((len(segments), *slots[i]))
+                segments.append("")
+        return segments, slot_plan
+
+
+def compile_template(template: Dict[str, Any]) -> CompiledTemplate:
+    """Compiled form of a loaded template, building it if needed."""
+    compiled = template.get("compiled")
+    if compiled is None or compiled.body != template["body"]:
+        compiled = CompiledTemplate(template["body"])
+    return compiled
+
+
 def fill_template(template: Dict[str, Any], fields: Dict[str, Any]) -> str:
     """Fill template with provided fields."""
-    body = template["body"]
+    return compile_template(template).render(fields)
+
+
+def _fill_passes(body: str, fields: Dict[str, Any]) -> str:
+    """Reference renderer: one regex pass per placeholder pattern."""
 
     # Pattern 1: [Placeholder Name]
     def replace_bracket(match):
         placeholder = match.group(1).strip()
         return fields.get(placeholder, match.group(0))
 
-    body = re.sub(r"\[([^\]]+)\]", replace_bracket, body)
+    body = BRACKET_RE.sub(replace_bracket, body)
 
     # Pattern 2: $variable or ${variable}
     def replace_dollar(match):
         placeholder = match.group(1).strip()
         return fields.get(placeholder, match.group(0))
 
-    body = re.sub(r"\$\{?(\w+)\}?", replace_dollar, body)
+    body = DOLLAR_RE.sub(replace_dollar, body)
 
     # Pattern 3: ___field___
     def replace_underscore(match):
         placeholder = match.group(1).strip()
         return fields.get(placeholder, match.group(0))
 
-    body = re.sub(r"___([a-z_]+)___", replace_underscore, body)
+    body = UNDERSCORE_RE.sub(replace_underscore, body)
 
     return body
 
@@ -145,11 +435,52 @@ def save_document(partner_name: str, template_name: str, content: str) -> Path:
     filename = f"{date_str}-{template_name}.md"
 
     file_path = partner_dir / filename
-    file_path.write_text(content, encoding="utf-8")
+    catalog = DocumentCatalog(partner_dir)
+    if STORAGE_MODE == "cas":
+        blobs = BlobStore(catalog.blobs.root, compress=COMPRESS_BLOBS)
+        digest = blobs.put(content)
+        file_path.unlink(missing_ok=True)  # a stale full copy would shadow the blob
+        catalog.record(file_path, blob=digest, size=len(content.encode("utf-8")))
+    else:
+        file_path.write_text(content, encoding="utf-8")
+        catalog.record(file_path)
 
     return file_path
 
 
+def read_document(path: Union[str, Path]) -> Optional[str]:
+    """Read a saved document by path, whether stored as a file or a blob."""
+    path = Path(path)
+    return DocumentCatalog(path.parent).read(path.name)
+
+
+def compact_documents(documents_root: Optional[Path] = None) -> Dict[str, int]:
+    """
+    Move existing document files into the blob store.
+
+    Returns counts of files converted and unique blobs they collapsed into.
+    """
+    root = Path(documents_root or DOCUMENTS_DIR)
+    files, digests = 0, set()
+    for documents_dir in sorted(root.glob("*/documents")):
+        catalog = DocumentCatalog(documents_dir)
+        blobs = BlobStore(catalog.blobs.root, compress=COMPRESS_BLOBS)
+        for path in sorted(documents_dir.glob("*.md")):
+            content = path.read_text(encoding="utf-8")
+            digest = blobs.put(content)
+            saved_at = path.stat().st_mtime
+            path.unlink()
+            catalog.record(
+                path,
+                blob=digest,
+                size=len(content.encode("utf-8")),
+                saved_at=saved_at,
+            )
+            files += 1
+            digests.add(digest)
+    return {"files": files, "blobs": len(digests)}
+
+
 class DocumentGenerator:
     """Main document generator class."""
 
@@ -174,14 +505,7 @@ class DocumentGenerator:
         Returns:
             Dict with document info or None if failed
         """
-        # Map doc type to template
-        template_map = {
-            "nda": "legal/01-nda.md",
-            "msa": "legal/02-msa.md",
-            "dpa": "legal/03-dpa.md",
-        }
-
-        template_path = template_map.get(doc_type)
+        template_path = TEMPLATE_MAP.get(doc_type)
         if not template_path:
             return None
 
@@ -190,17 +514,30 @@ class DocumentGenerator:
         if not template:
             return None
 
+        return self._write_document(template, doc_type, partner_name, fields)
+
+    def _write_document(
+        self,
+        template: Dict[str, Any],
+        doc_type: str,
+        partner_name: str,
+        fields: Dict[str, Any],
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Fill a loaded template and save it for one partner."""
+        now = now or datetime.now()
+
         # Fill with default values + provided fields
         defaults = {
             "Partner Name": partner_name,
             "partner_name": partner_name,
             "[Partner Name]": partner_name,
-            "Effective Date": datetime.now().strftime("%B %d, %Y"),
-            "effective_date": datetime.now().strftime("%Y-%m-%d"),
+            "Effective Date": now.strftime("%B %d, %Y"),
+            "effective_date": now.strftime("%Y-%m-%d"),
             "Term Years": "2",
             "term_years": "2",
-            "Date": datetime.now().strftime("%B %d, %Y"),
-            "today_date": datetime.now().strftime("%B %d, %Y"),
+            "Date": now.strftime("%B %d, %Y"),
+            "today_date": now.strftime("%B %d, %Y"),
         }
         defaults.update(fields)
 
@@ -212,53 +549,196 @@ class DocumentGenerator:
         return {
             "doc_type": doc_type,
             "partner_name": partner_name,
-            "template": template_path,
+            "template": template["relative_path"],
             "path": str(file_path),
             "relative_path": str(file_path.relative_to(REPO_ROOT)),
             "fields": defaults,
             "created_at": datetime.now().isoformat(),
         }
 
-    def get_document_path(self, partner_name: str, doc_type: str) -> Optional[Path]:
-        """Get path to most recent document of a type for a partner."""
-        slug = _slugify(partner_name)
-        partner_dir = DOCUMENTS_DIR / slug / "documents"
+    def create_documents_bulk(
+        self,
+        doc_type: str,
+        partner_filter: Union[Callable[[Dict], bool], Dict[str, Any], None] = None,
+        fields_fn: Optional[Callable[[Dict], Dict[str, Any]]] = None,
+        partners: Optional[List[Dict]] = None,
+        max_workers: int = 8,
+        progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+        record: bool = True,
+        manifest_dir: Optional[Path] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create one document type for many partners.
 
-        if not partner_dir.exists():
-            return None
+        The template is loaded and compiled once; filling and writing run on
+        a thread pool since the work is dominated by file I/O.
 
-        # Find matching files
-        pattern = f"*-{doc_type}.md"
-        files = list(partner_dir.glob(pattern))
+        Args:
+            doc_type: Type of document (nda, msa, dpa)
+            partner_filter: Callable on a partner dict, or a dict of field
+                values to match case-insensitively (e.g. {"tier": "Gold"})
+            fields_fn: Extra template fields for a partner
+            partners: Partner dicts (default: partner_state.list_partners())
+            max_workers: Writer threads
+            progress: Called as progress(done, total, entry) after each document
+            record: Add the documents to the partner store in one batched write
+            manifest_dir: Also write the manifest as JSON into this directory
 
-        if not files:
-            return None
+        Returns:
+            Manifest dict with per-partner paths and errors
+        """
+        from . import partner_state
 
-        # Return most recent
-        return max(files, key=lambda f: f.stat().st_mtime)
+        started = datetime.now()
+        manifest: Dict[str, Any] = {
+            "doc_type": doc_type,
+            "template": TEMPLATE_MAP.get(doc_type),
+            "started_at": started.isoformat(),
+            "total": 0,
+            "created": 0,
+            "failed": 0,
+            "documents": [],
+            "errors": [],
+        }
+        template = load_template(manifest["template"]) if manifest["template"] else None
+        if template is None:
+            manifest["errors"].append({"partner": None, "error": "Unknown template"})
+            manifest["finished_at"] = datetime.now().isoformat()
+            return manifest
+
+        if partners is None:
+            partners = partner_state.list_partners()
+        selected = [p for p in partners if _matches(p, partner_filter)]
+        manifest["total"] = len(selected)
+
+        def work(partner: Dict) -> Dict[str, Any]:
+            fields = fields_fn(partner) if fields_fn else {}
+            return self._write_document(
+                template, doc_type, partner["name"], fields, now=started
+            )
+
+        created: Dict[str, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(work, p): p for p in selected}
+            for done, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]["name"]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    entry = {"partner": name, "error": f"{type(e).__name__}: {e}"}
+                    manifest["errors"].append(entry)
+                else:
+                    entry = {
+                        "partner": name,
+                        "path": result["path"],
+                        "relative_path": result["relative_path"],
+                    }
+                    manifest["documents"].append(entry)
+                    created[name] = [result]
+                if progress:
+                    progress(done, manifest["total"], entry)
+
+        if record and created:
+            partner_state.add_documents_many(created)
+
+        manifest["documents"].sort(key=lambda d: d["partner"].lower())
+        manifest["created"] = len(manifest["documents"])
+        manifest["failed"] = len(manifest["errors"])
+        manifest["finished_at"] = datetime.now().isoformat()
+
+        if manifest_dir is not None:
+            manifest_dir = Path(manifest_dir)
+            manifest_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path = (
+                manifest_dir / f"{started.strftime('%Y%m%d-%H%M%S')}-{doc_type}.json"
+            )
+            manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+            manifest["manifest_path"] = str(manifest_path)
+        return manifest
+
+    def create_checklist(self, partner_name: str) -> Dict[str, Any]:
+        """Write the onboarding checklist for a partner."""
+        file_path = save_document(
+            partner_name,
+            "onboarding-checklist",
+            ONBOARDING_CHECKLIST.format(partner_name=partner_name),
+        )
+        return {
+            "doc_type": "checklist",
+            "partner_name": partner_name,
+            "template": CHECKLIST_TEMPLATE,
+            "path": str(file_path),
+            "relative_path": str(file_path.relative_to(REPO_ROOT)),
+            "fields": {"partner_name": partner_name},
+            "created_at": datetime.now().isoformat(),
+        }
+
+    def create_onboarding_packet(
+        self,
+        partner_name: str,
+        fields: Dict[str, Any],
+        doc_types: Tuple[str, ...] = ONBOARDING_PACKET,
+        checklist: bool = True,
+        max_workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Render and write the onboarding packet concurrently.
+
+        Returns the created documents in packet order (checklist last);
+        documents whose template is missing are left out.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.create_document, doc_type, partner_name, fields)
+                for doc_type in doc_types
+            ]
+            if checklist:
+                futures.append(pool.submit(self.create_checklist, partner_name))
+            results = [f.result() for f in futures]
+        return [r for r in results if r]
+
+    def _catalog(self, partner_name: str) -> DocumentCatalog:
+        return DocumentCatalog(DOCUMENTS_DIR / _slugify(partner_name) / "documents")
+
+    def _describe(self, catalog: DocumentCatalog, entry: Dict) -> Dict[str, Any]:
+        path = catalog.documents_dir / entry["filename"]
+        return {
+            "filename": entry["filename"],
+            "doc_type": entry["doc_type"],
+            "date": entry["date"],
+            "path": str(path),
+            "relative_path": str(path.relative_to(REPO_ROOT)),
+            "modified": datetime.fromtimestamp(entry["modified"]).isoformat(),
+        }
+
+    def get_document_path(self, partner_name: str, doc_type: str) -> Optional[Path]:
+        """Get path to most recent document of a type for a partner."""
+        return self._catalog(partner_name).latest(doc_type)
 
     def list_partner_documents(self, partner_name: str) -> List[Dict[str, Any]]:
         """List all documents for a partner."""
-        slug = _slugify(partner_name)
-        partner_dir = DOCUMENTS_DIR / slug / "documents"
-
-        if not partner_dir.exists():
-            return []
-
-        documents = []
-        for f in sorted(
-            partner_dir.glob("*.md"), key=lambda x: x.stat().st_mtime, reverse=True
-        ):
-            documents.append(
-                {
-                    "filename": f.name,
-                    "path": str(f),
-                    "relative_path": str(f.relative_to(REPO_ROOT)),
-                    "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat(),
-                }
-            )
+        catalog = self._catalog(partner_name)
+        return [self._describe(catalog, e) for e in catalog.entries()]
 
-        return documents
+    def find_documents(
+        self,
+        partner_name: str,
+        doc_type: Optional[str] = None,
+        start: DateLike = None,
+        end: DateLike = None,
+    ) -> List[Dict[str, Any]]:
+        """Documents for a partner by type and/or date range, newest first."""
+        catalog = self._catalog(partner_name)
+        return [self._describe(catalog, e) for e in catalog.find(doc_type, start, end)]
+
+    def rebuild_catalog(self, partner_name: Optional[str] = None) -> Dict[str, int]:
+        """Rebuild one partner's catalog, or every partner's, from disk."""
+        if partner_name:
+            catalog = self._catalog(partner_name)
+            if not catalog.documents_dir.exists():
+                return {}
+            return {_slugify(partner_name): len(catalog.rebuild())}
+        return rebuild_all(DOCUMENTS_DIR)
 
 
 # Convenience function
@@ -272,6 +752,27 @@ def create_document(
     return generator.create_document(doc_type, partner_name, fields or {})
 
 
+def create_onboarding_packet(
+    partner_name: str, fields: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Quick function to create the NDA/MSA/DPA/checklist packet."""
+    return generator.create_onboarding_packet(partner_name, fields or {})
+
+
+def create_documents_bulk(
+    doc_type: str, partner_filter=None, fields_fn=None, **kwargs
+) -> Dict[str, Any]:
+    """Quick function to create one document type for many partners."""
+    return generator.create_documents_bulk(
+        doc_type, partner_filter, fields_fn, **kwargs
+    )
+
+
 def list_documents(partner_name: str) -> List[Dict[str, Any]]:
     """Quick function to list partner documents."""
     return generator.list_partner_documents(partner_name)
+
+
+def rebuild_catalog(partner_name: Optional[str] = None) -> Dict[str, int]:
+    """Quick function to rebuild document catalogs after manual edits."""
+    return generator.rebuild_catalog(partner_name)
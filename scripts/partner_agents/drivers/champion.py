@@ -12,6 +12,7 @@ from datetime import datetime
 import logging
 
 from ..base import BaseAgent, AgentSkill, AgentPriority
+from ..state import telemetry
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +133,13 @@ class ChampionAgent(BaseAgent):
                 "Ask/Next Steps",
             ],
             "time_period": context.get("time_period", "Q1 2026"),
+            "metrics": context.get("metrics")
+            or telemetry.get_metrics_history(
+                ["total_pipeline", "closed_revenue", "active_partners"],
+                start=context.get("metrics_start"),
+                resolution="day",
+                max_points=90,
+            ),
             "created_at": datetime.now().isoformat(),
         }
 
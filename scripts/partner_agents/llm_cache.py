@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+LLM Cache - Reuse completions for repeated and near-identical prompts
+Like reusing last lap's setup when the track hasn't changed.
+
+Completions are keyed on the model, endpoint, max_tokens, a hash of the
+conversation context (system prompt and earlier turns) and the normalized
+final user message. On an exact miss, an opt-in similarity lookup compares
+cheap local embeddings - hashed word vectors, no network - against entries
+in the same scope, so "email Acme about the QBR" can reuse the answer to
+"please email Acme about QBRs". A near-hit also needs the same numbers and
+names (capitalized words) in the same word order: "Acme owes Globex 5000"
+never answers "Globex owes Acme 5000", nor "health score 80" "health
+score 35".
+
+Entries expire after a TTL and the cache is an LRU bounded by entry count.
+With a path it persists as an append-only JSONL log that is replayed on
+start and compacted when it grows to twice the live entries; by default it
+stays in memory.
+
+Layout:
+    .cache/llm-cache.jsonl
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .atomic import atomic_write
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+CACHE_PATH = REPO_ROOT / ".cache" / "llm-cache.jsonl"
+
+EMBED_DIMS = 1024
+WORD_RE = re.compile(r"[a-z0-9$%]+")
+TOKEN_RE = re.compile(r"[A-Za-z0-9$%]+")
+STOPWORDS = frozenset(
+    "a an and about for from in of on please the to with write draft create "
+    "make me can you could would".split()
+)
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return " ".join(WORD_RE.findall(text.lower()))
+
+
+def _stem(word: str) -> str:
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def embed(text: str) -> Dict[int, float]:
+    """Sparse, L2-normalized hashed bag-of-words vector."""
+    vector: Dict[int, float] = {}
+    for word in WORD_RE.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        digest = hashlib.blake2b(_stem(word).encode(), digest_size=4).digest()
+        slot = int.from_bytes(digest, "little") % EMBED_DIMS
+        vector[slot] = vector.get(slot, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in vector.values()))
+    return {k: v / norm for k, v in vector.items()} if norm else {}
+
+
+def terms(text: str) -> Tuple[List[str], List[str]]:
+    """
+    (terms, marked): stemmed non-stopwords in order, and the subset that
+    are numbers or capitalized names, which a near-hit may not change.
+    """
+    ordered: List[str] = []
+    marked: List[str] = []
+    for token in TOKEN_RE.findall(text):
+        word = token.lower()
+        if word in STOPWORDS:
+            continue
+        stem = _stem(word)
+        ordered.append(stem)
+        if token[0].isupper() or any(c.isdigit() for c in token):
+            marked.append(stem)
+    return ordered, marked
+
+
+def same_facts(a: Tuple[List[str], List[str]], b: Tuple[List[str], List[str]]) -> bool:
+    """True if no number or name differs and shared words keep their order."""
+    a_terms, b_terms = set(a[0]), set(b[0])
+    if (a_terms ^ b_terms) & set(a[1] + b[1]):
+        return False
+    shared_a = [t for t in dict.fromkeys(a[0]) if t in b_terms]
+    shared_b = [t for t in dict.fromkeys(b[0]) if t in a_terms]
+    return shared_a == shared_b
+
+
+def cosine(a: Dict[int, float], b: Dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+def context_hash(messages: List[Dict[str, str]]) -> str:
+    """Hash of everything before the final user message."""
+    payload = json.dumps(
+        [[m.get("role"), m.get("content")] for m in messages[:-1]],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+@dataclass
+class CacheEntry:
+    """One cached completion."""
+
+    key: str
+    scope: str  # model, endpoint, max_tokens and context hash
+    content: str
+    created_at: float
+    vector: Dict[int, float] = field(default_factory=dict)
+    terms: List[str] = field(default_factory=list)
+    marked: List[str] = field(default_factory=list)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+@dataclass
+class CacheStats:
+    exact_hits: int = 0
+    similar_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.exact_hits + self.similar_hits + self.misses
+
+    def to_dict(self) -> Dict[str, Any]:
+        hits = self.exact_hits + self.similar_hits
+        return {
+            **asdict(self),
+            "hit_rate": round(hits / self.lookups, 4) if self.lookups else 0.0,
+        }
+
+
+class LLMCache:
+    """
+    TTL + LRU completion cache with similarity fallback and disk persistence.
+
+    Args:
+        path: JSONL log file (e.g. CACHE_PATH), or None to keep the cache
+            in memory
+        max_entries: LRU bound
+        ttl_seconds: Entry lifetime (0 keeps entries until evicted)
+        similarity: Cosine threshold for near-duplicate hits (None disables)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        max_entries: int = 1000,
+        ttl_seconds: float = 86_400,
+        similarity: Optional[float] = None,
+    ):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity = similarity
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.stats = CacheStats()
+        self._log_lines = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        base_url: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Tuple[str, str]:
+        """(key, scope) for a request."""
+        scope = f"{model}@{base_url or ''}:{max_tokens or ''}:{context_hash(messages)}"
+        last = messages[-1].get("content", "") if messages else ""
+        key = hashlib.sha256(f"{scope}:{normalize(last)}".encode()).hexdigest()
+        return key, scope
+
+    def _expired(self, entry: CacheEntry, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - entry.created_at > self.ttl_seconds
+
+    # -- persistence -----------------------------------------------------
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        now = time.time()
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                self._log_lines += 1
+                try:
+                    data = json.loads(line)
+                    if "evict" in data:
+                        self.entries.pop(data["evict"], None)
+                        continue
+                    data["vector"] = {int(k): v for k, v in data["vector"].items()}
+                    entry = CacheEntry(**data)
+                except (ValueError, TypeError, KeyError):
+                    continue  # torn write
+                if self._expired(entry, now):
+                    continue
+                self.entries.pop(entry.key, None)
+                self.entries[entry.key] = entry
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _append(self, record: Dict[str, Any]):
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._log_lines += 1
+        if self._log_lines > 2 * max(self.max_entries, len(self.entries)):
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the log with only live entries."""
+        atomic_write(
+            self.path,
+            "".join(
+                json.dumps(asdict(entry), separators=(",", ":")) + "\n"
+                for entry in self.entries.values()
+            ),
+            fsync=False,
+        )
+        self._log_lines = len(self.entries)
+
+    # -- lookups ---------------------------------------------------------
+
+    def get(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        base_url: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[CacheEntry]:
+        """Cached completion for a request: exact match first, then similar."""
+        key, scope = self.make_key(model, messages, base_url, max_tokens)
+        now = time.time()
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                del self.entries[key]
+                entry = None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.stats.exact_hits += 1
+                return entry
+
+            if self.similarity is not None and messages:
+                prompt = messages[-1].get("content", "")
+                vector, facts = embed(prompt), terms(prompt)
+                best, best_score = None, self.similarity
+                for candidate in self.entries.values():
+                    if candidate.scope != scope or self._expired(candidate, now):
+                        continue
+                    if not candidate.terms or not same_facts(
+                        facts, (candidate.terms, candidate.marked)
+                    ):
+                        continue
+                    score = cosine(vector, candidate.vector)
+                    if score >= best_score:
+                        best, best_score = candidate, score
+                if best is not None:
+                    self.entries.move_to_end(best.key)
+                    self.stats.similar_hits += 1
+                    return best
+
+            self.stats.misses += 1
+            return None
+
+    def put(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        content: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        base_url: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ):
+        """Store a completion, evicting the least recently used entries."""
+        key, scope = self.make_key(model, messages, base_url, max_tokens)
+        prompt = messages[-1].get("content", "") if messages else ""
+        ordered, marked = terms(prompt)
+        entry = CacheEntry(
+            key=key,
+            scope=scope,
+            content=content,
+            created_at=time.time(),
+            vector=embed(prompt),
+            terms=ordered,
+            marked=marked,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+        with self._lock:
+            self.entries.pop(key, None)
+            self.entries[key] = entry
+            self.stats.stores += 1
+            self._append(asdict(entry))
+            while len(self.entries) > self.max_entries:
+                evicted, _ = self.entries.popitem(last=False)
+                self.stats.evictions += 1
+                self._append({"evict": evicted})
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            if self.path and self.path.exists():
+                self.path.unlink()
+            self._log_lines = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def from_env() -> Optional[LLMCache]:
+    """
+    Cache configured from PARTNERAGENTS_LLM_CACHE* variables (None if off).
+
+    Similarity lookups and persistence are opt-in: set
+    PARTNERAGENTS_LLM_CACHE_SIMILARITY (e.g. 0.9) and
+    PARTNERAGENTS_LLM_CACHE_PATH (e.g. .cache/llm-cache.jsonl).
+    """
+    if os.environ.get("PARTNERAGENTS_LLM_CACHE", "1") == "0":
+        return None
+    similarity = os.environ.get("PARTNERAGENTS_LLM_CACHE_SIMILARITY", "")
+    return LLMCache(
+        path=os.environ.get("PARTNERAGENTS_LLM_CACHE_PATH") or None,
+        max_entries=int(os.environ.get("PARTNERAGENTS_LLM_CACHE_SIZE", "1000")),
+        ttl_seconds=float(os.environ.get("PARTNERAGENTS_LLM_CACHE_TTL", "86400")),
+        similarity=float(similarity) if similarity not in ("", "off") else None,
+    )
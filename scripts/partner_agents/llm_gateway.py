@@ -0,0 +1,824 @@
+#!/usr/bin/env python3
+"""
+LLM Gateway - One way out to every model provider
+Like the pit lane speed limiter: everyone goes through the same gate, at a safe pace.
+
+Every LLM call - web chat, CLI and PartnerAgent playbooks - goes through
+LLMGateway.complete(). The gateway enforces a global and a per-model
+concurrency limit - shared by every thread and event loop that calls it,
+so the web loop, a CLI asyncio.run() and complete_sync() draw on one
+quota - queues callers with a deadline instead of piling up requests, trips a per-provider circuit breaker during outages so callers
+can fail fast to their fallback, and records latency and token counts per
+model in one place.
+
+Hedging (opt-in, PARTNERAGENTS_LLM_HEDGE=1): when a call has not answered
+within the model's recent p95 latency, a duplicate request - optionally to
+a fallback model - is fired and whichever answers first wins; the other is
+cancelled.
+
+Providers: openrouter, openai (OpenAI chat-completions format), anthropic
+(messages API) and ollama (/api/chat). Base URLs can be overridden with
+PARTNERAGENTS_<PROVIDER>_URL, e.g. to point at a local stand-in server.
+
+Usage:
+    from partner_agents.llm_gateway import gateway, GatewayUnavailable
+
+    try:
+        reply = await gateway.complete("openrouter", model, messages, api_key=key)
+        print(reply.content)
+    except GatewayUnavailable:
+        ...  # circuit open or queue deadline passed - use a fallback
+
+Call `await gateway.aclose()` before an event loop that used the gateway
+finishes; gateway.close() (run at exit) closes the rest.
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import httpx
+
+from .llm_cache import LLMCache
+from .llm_cache import from_env as cache_from_env
+from .tracing import LatencyHistogram, tracer
+from .usage import UsageStore, usage_store
+
+PROVIDER_URLS = {
+    "openrouter": "https://openrouter.ai/api/v1",
+    "openai": "https://api.openai.com/v1",
+    "anthropic": "https://api.anthropic.com/v1",
+    "ollama": "http://localhost:11434",
+}
+
+# Failures that say "the provider is unwell" rather than "the request is bad"
+BREAKER_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def provider_url(provider: str) -> str:
+    """Base URL for a provider, honoring PARTNERAGENTS_<PROVIDER>_URL."""
+    env = os.environ.get(f"PARTNERAGENTS_{provider.upper()}_URL")
+    if provider == "ollama":
+        env = env or os.environ.get("OLLAMA_ENDPOINT")
+    return (env or PROVIDER_URLS[provider]).rstrip("/")
+
+
+class GatewayError(Exception):
+    """Base class for gateway failures."""
+
+
+class GatewayUnavailable(GatewayError):
+    """The gateway refused the call without contacting the provider."""
+
+
+class CircuitOpenError(GatewayUnavailable):
+    """The provider's circuit breaker is open."""
+
+
+class QueueTimeoutError(GatewayUnavailable):
+    """No concurrency slot freed up before the caller's deadline."""
+
+
+class ProviderError(GatewayError):
+    """The provider answered with an error status."""
+
+    def __init__(self, status_code: int, body: str = ""):
+        super().__init__(f"HTTP {status_code}: {body[:200]}")
+        self.status_code = status_code
+        self.body = body
+
+
+@dataclass
+class LLMResponse:
+    """A completed LLM call."""
+
+    content: str
+    provider: str
+    model: str
+    latency_ms: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached: bool = False
+    hedged: bool = False  # answered by the duplicate request
+
+
+@dataclass
+class HedgePolicy:
+    """
+    When to fire a duplicate request for a slow call.
+
+    The delay is the given percentile of the model's recorded latency,
+    clamped to [min_delay, max_delay] seconds; until min_samples calls have
+    been recorded, default_delay is used.
+    """
+
+    percentile: float = 95.0
+    min_delay: float = 0.5
+    max_delay: float = 10.0
+    default_delay: float = 2.0
+    min_samples: int = 20
+    fallback_model: Optional[str] = None  # hedge to this model instead
+
+    def delay(self, latency: LatencyHistogram) -> float:
+        if latency.count < self.min_samples:
+            return self.default_delay
+        seconds = (latency.percentile(self.percentile) or 0.0) / 1000
+        return min(self.max_delay, max(self.min_delay, seconds))
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after failure_threshold consecutive failures; after
+    reset_timeout one probe call is let through (half-open) and its outcome
+    closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+    def release_probe(self):
+        """A probe ended without a verdict (e.g. cancelled)."""
+        with self._lock:
+            self.probing = False
+
+
+@dataclass
+class ModelStats:
+    """Per provider/model counters."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    rejected: int = 0
+    queue_timeouts: int = 0
+    cache_hits: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    hedge_saved_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.latency.to_dict(),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "rejected": self.rejected,
+            "queue_timeouts": self.queue_timeouts,
+            "cache_hits": self.cache_hits,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_saved_ms": round(self.hedge_saved_ms, 3),
+        }
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) when usage is not reported."""
+    return max(1, len(text) // 4) if text else 0
+
+
+class _Slots:
+    """
+    Counting semaphore shared by every thread and event loop.
+
+    asyncio.Semaphore belongs to a single loop; waiters here are futures on
+    their own loops, woken in FIFO order with call_soon_threadsafe.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self, timeout: float):
+        """Take a slot, raising asyncio.TimeoutError after timeout seconds."""
+        with self._lock:
+            if self.in_use < self.limit and not self._waiters:
+                self.in_use += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # granted just as we gave up
+            raise  # else _grant sees the cancelled waiter and passes the slot on
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+                    return  # the slot moves to the waiter
+                except RuntimeError:
+                    continue  # its loop has closed
+            self.in_use -= 1
+
+    def _grant(self, waiter: asyncio.Future):
+        if waiter.done():
+            self.release()
+        else:
+            waiter.set_result(None)
+
+
+class LLMGateway:
+    """
+    Shared front door for LLM providers.
+
+    Args:
+        max_concurrency: In-flight calls across all models
+        per_model_concurrency: In-flight calls per provider/model
+        queue_timeout: Seconds a caller may wait for a slot
+        request_timeout: Seconds a provider call may take once started
+        failure_threshold: Consecutive failures that open a provider's circuit
+        reset_timeout: Seconds before an open circuit lets a probe through
+        cache: Completion cache consulted before calling out (None disables)
+        usage: Store that per-call tokens, latency and cost are recorded into
+        hedge: Policy for duplicating slow calls (None disables hedging)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        per_model_concurrency: int = 4,
+        queue_timeout: float = 10.0,
+        request_timeout: float = 30.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        cache: Optional[LLMCache] = None,
+        usage: Optional[UsageStore] = None,
+        hedge: Optional[HedgePolicy] = None,
+    ):
+        self.cache = cache
+        self.usage = usage
+        self.hedge = hedge
+        self.max_concurrency = max_concurrency
+        self.per_model_concurrency = per_model_concurrency
+        self.queue_timeout = queue_timeout
+        self.request_timeout = request_timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.stats: Dict[str, ModelStats] = {}
+        self.slots = _Slots(max_concurrency)
+        self.model_slots: Dict[str, _Slots] = {}
+        # httpx pools are bound to the loop that opened them
+        self._clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # -- shared state ----------------------------------------------------
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        with self._lock:
+            if provider not in self.breakers:
+                self.breakers[provider] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout
+                )
+            return self.breakers[provider]
+
+    def _stats(self, key: str) -> ModelStats:
+        with self._lock:
+            if key not in self.stats:
+                self.stats[key] = ModelStats()
+            return self.stats[key]
+
+    def _model_slots(self, key: str) -> _Slots:
+        with self._lock:
+            if key not in self.model_slots:
+                self.model_slots[key] = _Slots(self.per_model_concurrency)
+            return self.model_slots[key]
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None:
+                client = self._clients[loop] = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency,
+                    )
+                )
+            return client
+
+    async def aclose(self):
+        """Close the running event loop's connection pool."""
+        with self._lock:
+            client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def close(self):
+        """Close connection pools on every open loop and stop complete_sync's loop."""
+        with self._lock:
+            clients = list(self._clients.items())
+            self._clients.clear()
+            sync_loop, self._sync_loop = self._sync_loop, None
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        for loop, client in clients:
+            if loop.is_closed():
+                continue
+            if loop is current:
+                loop.create_task(client.aclose())
+            elif loop.is_running():
+                try:
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(5)
+                except Exception:
+                    pass
+            else:
+                loop.run_until_complete(client.aclose())
+        if sync_loop is not None:
+            sync_loop.call_soon_threadsafe(sync_loop.stop)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Latency, token and rejection counters per model plus breaker states."""
+        with self._lock:
+            metrics = {
+                "models": {key: s.to_dict() for key, s in self.stats.items()},
+                "circuits": {p: b.state for p, b in self.breakers.items()},
+            }
+        if self.hedge is not None:
+            models = metrics["models"].values()
+            metrics["hedging"] = {
+                **asdict(self.hedge),
+                "fired": sum(m["hedges"] for m in models),
+                "wins": sum(m["hedge_wins"] for m in models),
+                "saved_ms": round(sum(m["hedge_saved_ms"] for m in models), 3),
+            }
+        if self.cache is not None:
+            metrics["cache"] = {
+                **self.cache.stats.to_dict(),
+                "entries": len(self.cache),
+            }
+        return metrics
+
+    # -- calls -----------------------------------------------------------
+
+    async def _acquire(self, slots: _Slots, deadline: float):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError
+        await slots.acquire(remaining)
+
+    async def complete(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        api_key: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[float] = None,
+        queue_timeout: Optional[float] = None,
+        base_url: Optional[str] = None,
+        use_cache: bool = True,
+        conversation: Optional[str] = None,
+        agent: Optional[str] = None,
+        hedge: bool = True,
+    ) -> LLMResponse:
+        """
+        Run one chat completion.
+
+        messages may start with a {"role": "system"} entry; it is moved to
+        the provider's system field where the API needs that. Cached
+        completions are returned without taking a slot or calling out.
+        conversation and agent tag the call in the usage store; hedge=False
+        opts a call out of the gateway's hedging policy.
+
+        Raises:
+            CircuitOpenError / QueueTimeoutError: refused without calling out
+            ProviderError: the provider returned an error status
+            httpx.HTTPError / asyncio.TimeoutError: transport failure
+        """
+        if provider not in PROVIDER_URLS:
+            raise ValueError(f"Unknown provider: {provider}")
+        key = f"{provider}/{model}"
+        stats = self._stats(key)
+        base_url = base_url or provider_url(provider)
+        cache = self.cache if use_cache else None
+        if cache is not None:
+            hit = cache.get(key, messages, base_url, max_tokens)
+            if hit is not None:
+                with self._lock:
+                    stats.cache_hits += 1
+                reply = LLMResponse(
+                    content=hit.content,
+                    provider=provider,
+                    model=model,
+                    latency_ms=0.0,
+                    cached=True,
+                )
+                self._record_usage(key, reply, conversation, agent)
+                return reply
+
+        breaker = self.breaker(provider)
+        if not breaker.allow():
+            with self._lock:
+                stats.rejected += 1
+            raise CircuitOpenError(f"{provider} circuit is open")
+
+        deadline = time.monotonic() + (
+            self.queue_timeout if queue_timeout is None else queue_timeout
+        )
+
+        def attempt(attempt_model: str):
+            return self._attempt(
+                provider,
+                attempt_model,
+                messages,
+                api_key,
+                max_tokens,
+                timeout or self.request_timeout,
+                base_url,
+                deadline,
+                conversation,
+                agent,
+            )
+
+        if self.hedge is not None and hedge:
+            reply = await self._hedged(attempt, provider, model, stats)
+        else:
+            reply = await attempt(model)
+
+        if cache is not None and reply.content:
+            cache.put(
+                f"{reply.provider}/{reply.model}",
+                messages,
+                reply.content,
+                reply.prompt_tokens,
+                reply.completion_tokens,
+                base_url,
+                max_tokens,
+            )
+        return reply
+
+    async def _attempt(
+        self,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        api_key: Optional[str],
+        max_tokens: Optional[int],
+        timeout: float,
+        base_url: str,
+        deadline: float,
+        conversation: Optional[str],
+        agent: Optional[str],
+    ) -> LLMResponse:
+        """Take a global and a per-model slot, then call the provider once."""
+        key = f"{provider}/{model}"
+        stats = self._stats(key)
+        breaker = self.breaker(provider)
+        model_slot = self._model_slots(key)
+        try:
+            await self._acquire(self.slots, deadline)
+        except asyncio.TimeoutError:
+            breaker.release_probe()
+            with self._lock:
+                stats.queue_timeouts += 1
+            raise QueueTimeoutError(f"No free slot for {key}") from None
+        try:
+            try:
+                await self._acquire(model_slot, deadline)
+            except asyncio.TimeoutError:
+                breaker.release_probe()
+                with self._lock:
+                    stats.queue_timeouts += 1
+                raise QueueTimeoutError(f"No free slot for {key}") from None
+            start = time.perf_counter()
+            try:
+                reply = await self._call(
+                    self._client(),
+                    provider,
+                    model,
+                    messages,
+                    api_key,
+                    max_tokens,
+                    timeout,
+                    base_url,
+                    breaker,
+                    stats,
+                )
+            except (GatewayError, httpx.HTTPError, asyncio.TimeoutError, ValueError):
+                latency_ms = (time.perf_counter() - start) * 1000
+                self._record_usage(key, None, conversation, agent, latency_ms)
+                raise
+            finally:
+                model_slot.release()
+        finally:
+            self.slots.release()
+
+        self._record_usage(key, reply, conversation, agent)
+        return reply
+
+    async def _hedged(
+        self,
+        attempt: Callable[[str], Any],
+        provider: str,
+        model: str,
+        stats: ModelStats,
+    ) -> LLMResponse:
+        """
+        Run attempt(model); if it is still pending after the policy's delay,
+        race it against a duplicate and cancel whichever loses.
+        """
+        policy = self.hedge
+        start = time.perf_counter()
+        primary = asyncio.ensure_future(attempt(model))
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=policy.delay(stats.latency))
+            if done or not self.breaker(provider).allow():
+                return await primary
+
+            with self._lock:
+                stats.hedges += 1
+            secondary = asyncio.ensure_future(attempt(policy.fallback_model or model))
+            pending.add(secondary)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winners = [t for t in done if t.exception() is None]
+                if winners:
+                    break
+            else:
+                raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        winner = primary if primary in winners else winners[0]
+        reply = winner.result()
+        if winner is secondary:
+            # The primary was cancelled, so its latency is estimated from
+            # the model's recorded calls that ran at least this long
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            expected_ms = stats.latency.mean_above(elapsed_ms)
+            with self._lock:
+                stats.hedge_wins += 1
+                if expected_ms is not None:
+                    stats.hedge_saved_ms += expected_ms - elapsed_ms
+            reply.hedged = True
+        return reply
+
+    def _record_usage(
+        self,
+        key: str,
+        reply: Optional[LLMResponse],
+        conversation: Optional[str],
+        agent: Optional[str],
+        latency_ms: float = 0.0,
+    ):
+        if self.usage is None:
+            return
+        self.usage.record(
+            key,
+            prompt_tokens=reply.prompt_tokens if reply else 0,
+            completion_tokens=reply.completion_tokens if reply else 0,
+            latency_ms=reply.latency_ms if reply else latency_ms,
+            conversation=conversation,
+            agent=agent,
+            cached=bool(reply and reply.cached),
+            error=reply is None,
+        )
+
+    async def _call(
+        self,
+        client: httpx.AsyncClient,
+        provider: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        api_key: Optional[str],
+        max_tokens: Optional[int],
+        timeout: float,
+        base_url: str,
+        breaker: CircuitBreaker,
+        stats: ModelStats,
+    ) -> LLMResponse:
+        start = time.perf_counter()
+        error: Optional[bool] = True
+        try:
+            with tracer.span("llm.call", provider=provider, model=model):
+                content, usage = await asyncio.wait_for(
+                    PROVIDERS[provider](
+                        client, base_url, model, messages, api_key, max_tokens
+                    ),
+                    timeout,
+                )
+            error = False
+        except ProviderError as e:
+            if e.status_code in BREAKER_STATUSES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()  # the provider is up; the request was bad
+            raise
+        except (httpx.HTTPError, asyncio.TimeoutError, ValueError):
+            breaker.record_failure()
+            raise
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            error = None  # abandoned (e.g. lost a hedge race): not a sample
+            raise
+        finally:
+            latency_ms = round((time.perf_counter() - start) * 1000, 3)
+            if error is not None:
+                with self._lock:
+                    stats.latency.record(latency_ms, error=error)
+
+        breaker.record_success()
+        prompt_tokens = usage.get("prompt_tokens") or estimate_tokens(
+            "".join(m.get("content", "") for m in messages)
+        )
+        completion_tokens = usage.get("completion_tokens") or estimate_tokens(content)
+        with self._lock:
+            stats.prompt_tokens += prompt_tokens
+            stats.completion_tokens += completion_tokens
+        return LLMResponse(
+            content=content,
+            provider=provider,
+            model=model,
+            latency_ms=latency_ms,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+        )
+
+    def complete_sync(self, *args, **kwargs) -> LLMResponse:
+        """complete() for synchronous callers, run on a shared background loop."""
+        with self._lock:
+            if self._sync_loop is None:
+                self._sync_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._sync_loop.run_forever,
+                    name="llm-gateway",
+                    daemon=True,
+                ).start()
+        future = asyncio.run_coroutine_threadsafe(
+            self.complete(*args, **kwargs), self._sync_loop
+        )
+        return future.result()
+
+
+# -- provider adapters -------------------------------------------------------
+
+
+def _check(response: httpx.Response):
+    if response.status_code != 200:
+        raise ProviderError(response.status_code, response.text)
+
+
+async def _openai_compatible(client, base_url, model, messages, api_key, max_tokens):
+    payload: Dict[str, Any] = {"model": model, "messages": messages}
+    if max_tokens:
+        payload["max_tokens"] = max_tokens
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    response = await client.post(
+        f"{base_url}/chat/completions", headers=headers, json=payload
+    )
+    _check(response)
+    result = response.json()
+    choices = result.get("choices") or []
+    content = (choices[0].get("message") or {}).get("content") if choices else None
+    return content or "", result.get("usage") or {}
+
+
+async def _anthropic(client, base_url, model, messages, api_key, max_tokens):
+    system = "\n\n".join(m["content"] for m in messages if m["role"] == "system")
+    payload: Dict[str, Any] = {
+        "model": model,
+        "max_tokens": max_tokens or 4096,
+        "messages": [m for m in messages if m["role"] != "system"],
+    }
+    if system:
+        payload["system"] = system
+    response = await client.post(
+        f"{base_url}/messages",
+        headers={
+            "x-api-key": api_key or "",
+            "anthropic-version": "2023-06-01",
+            "Content-Type": "application/json",
+        },
+        json=payload,
+    )
+    _check(response)
+    result = response.json()
+    content = "".join(
+        block.get("text", "")
+        for block in result.get("content", [])
+        if block.get("type") == "text"
+    )
+    usage = result.get("usage") or {}
+    return content, {
+        "prompt_tokens": usage.get("input_tokens"),
+        "completion_tokens": usage.get("output_tokens"),
+    }
+
+
+async def _ollama(client, base_url, model, messages, api_key, max_tokens):
+    payload: Dict[str, Any] = {"model": model, "messages": messages, "stream": False}
+    if max_tokens:
+        payload["options"] = {"num_predict": max_tokens}
+    response = await client.post(f"{base_url}/api/chat", json=payload)
+    _check(response)
+    # Tolerate servers that stream NDJSON even when asked not to
+    content, usage = [], {}
+    for line in response.text.splitlines():
+        if not line.strip():
+            continue
+        chunk = json.loads(line)
+        content.append((chunk.get("message") or {}).get("content", ""))
+        if chunk.get("done"):
+            usage = {
+                "prompt_tokens": chunk.get("prompt_eval_count"),
+                "completion_tokens": chunk.get("eval_count"),
+            }
+    return "".join(content), usage
+
+
+PROVIDERS: Dict[str, Callable] = {
+    "openrouter": _openai_compatible,
+    "openai": _openai_compatible,
+    "anthropic": _anthropic,
+    "ollama": _ollama,
+}
+
+
+def _hedge_from_env() -> Optional[HedgePolicy]:
+    if os.environ.get("PARTNERAGENTS_LLM_HEDGE", "0") != "1":
+        return None
+    return HedgePolicy(
+        percentile=float(os.environ.get("PARTNERAGENTS_LLM_HEDGE_PERCENTILE", "95")),
+        fallback_model=os.environ.get("PARTNERAGENTS_LLM_HEDGE_FALLBACK") or None,
+    )
+
+
+def _from_env() -> LLMGateway:
+    return LLMGateway(
+        max_concurrency=int(os.environ.get("PARTNERAGENTS_LLM_CONCURRENCY", "16")),
+        per_model_concurrency=int(
+            os.environ.get("PARTNERAGENTS_LLM_MODEL_CONCURRENCY", "4")
+        ),
+        queue_timeout=float(os.environ.get("PARTNERAGENTS_LLM_QUEUE_TIMEOUT", "10")),
+        request_timeout=float(os.environ.get("PARTNERAGENTS_LLM_TIMEOUT", "30")),
+        cache=cache_from_env(),
+        usage=usage_store,
+        hedge=_hedge_from_env(),
+    )
+
+
+# Process-wide gateway shared by web, CLI and PartnerAgent
+gateway = _from_env()
+atexit.register(gateway.close)
@@ -4,12 +4,16 @@ Team Radio - Inter-agent communication protocol
 Like F1 team radio: structured, time-stamped, categorized.
 """
 
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import json
 
+from .config import TeamConfig
+from .tracing import current_span
+from .radio_log import RadioLog, TimeLike
+
 
 class MessageType(Enum):
     HANDSHAKE = "driver_connect"
@@ -34,23 +38,46 @@ class TeamMessage:
     subject: str
     content: Dict[str, Any]
     acknowledged: bool = False
+    trace_id: Optional[str] = None
+    span_id: Optional[str] = None
 
 
 class TeamRadio:
     """
     The team radio system.
     All inter-agent communication flows through here.
+
+    Keeps the last max_history messages in memory. Pass a RadioLog to also
+    persist every transmission for time-range queries after a restart.
     """
 
-    def __init__(self, max_history: int = 1000):
+    def __init__(self, max_history: int = 1000, log: Optional[RadioLog] = None):
         self.max_history = max_history
         self.messages: List[TeamMessage] = []
         self.subscribers: Dict[str, List[Callable]] = {}
+        self.log = log
+        self._sequence = log.count if log else 0
+
+    @classmethod
+    def from_config(cls, config) -> "TeamRadio":
+        """Build a radio from TeamConfig, persisting if radio_log_dir is set"""
+        settings = config.telemetry
+        log_dir = settings.get("radio_log_dir")
+        log = None
+        if log_dir:
+            log = RadioLog(
+                log_dir,
+                max_segment_bytes=settings.get("radio_segment_bytes", 1_048_576),
+                max_segments=settings.get("radio_max_segments"),
+            )
+        return cls(log=log)
 
     def transmit(self, message: Dict) -> str:
         """Send a message through the radio"""
+        span = current_span()
+        self._sequence += 1
         msg = TeamMessage(
-            id=f"MSG-{len(self.messages) + 1:06d}",
+            id=f"MSG-{self._sequence:06d}",
             timestamp=datetime.now(),
             message_type=MessageType(message.get("type", "radio_message")),
             from_driver=message.get("from", "system"),
@@ -58,6 +85,8 @@ class TeamRadio:
             priority=message.get("priority", "GREEN"),
             subject=message.get("message", ""),
             content=message.get("content", {}),
+            trace_id=message.get("trace_id") or (span.trace_id if span else None),
+            span_id=message.get("span_id") or (span.span_id if span else None),
         )
 
         self.messages.append(msg)
@@ -65,6 +94,13 @@ class TeamRadio:
         if len(self.messages) > self.max_history:
             self.messages = self.messages[-self.max_history :]
 
+        if self.log is not None:
+            record = self._to_dict(msg)
+            record["ts"] = msg.timestamp.timestamp()
+            record["priority"] = msg.priority
+            record["content"] = msg.content
+            self.log.append(record)
+
         self._notify(msg)
 
         return msg.id
@@ -95,21 +131,65 @@ class TeamRadio:
                 if m.from_driver == driver_id or m.to_driver == driver_id
             ]
 
-        return [
-            {
-                "id": m.id,
-                "timestamp": m.timestamp.isoformat(),
-                "from": m.from_driver,
-                "to": m.to_driver,
-                "message": m.subject,
-                "type": m.message_type.value,
-            }
-            for m in messages
-        ]
+        return [self._to_dict(m) for m in messages]
+
+    def query(
+        self,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        driver_id: Optional[str] = None,
+        message_type: Union[MessageType, str, None] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get messages by time range, driver and type.
+        Served from the persistent log when one is attached, else from memory.
+        """
+        if isinstance(message_type, MessageType):
+            message_type = message_type.value
+
+        if self.log is not None:
+            return list(
+                self.log.query(start, end, driver_id, message_type, limit=limit)
+            )
+
+        start_dt = datetime.fromisoformat(start) if isinstance(start, str) else start
+        end_dt = datetime.fromisoformat(end) if isinstance(end, str) else end
+        if isinstance(start_dt, (int, float)):
+            start_dt = datetime.fromtimestamp(start_dt)
+        if isinstance(end_dt, (int, float)):
+            end_dt = datetime.fromtimestamp(end_dt)
+
+        results = []
+        for m in self.messages:
+            if start_dt and m.timestamp < start_dt:
+                continue
+            if end_dt and m.timestamp > end_dt:
+                break
+            if driver_id and driver_id not in (m.from_driver, m.to_driver):
+                continue
+            if message_type and m.message_type.value != message_type:
+                continue
+            results.append(self._to_dict(m))
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def _to_dict(self, m: TeamMessage) -> Dict:
+        return {
+            "id": m.id,
+            "timestamp": m.timestamp.isoformat(),
+            "from": m.from_driver,
+            "to": m.to_driver,
+            "message": m.subject,
+            "type": m.message_type.value,
+            "trace_id": m.trace_id,
+            "span_id": m.span_id,
+        }
 
     def clear(self):
-        """Clear radio history"""
+        """Clear in-memory radio history (the persistent log is kept)"""
         self.messages = []
 
 
-radio = TeamRadio()
+radio = TeamRadio.from_config(TeamConfig())
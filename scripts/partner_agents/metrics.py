@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Metrics Store - Program metrics over time
+Like the pit wall's timing screens: every lap logged, sector and stint summaries on tap.
+
+Program metrics are sampled into a compact columnar time series: one
+array('d') per metric plus a timestamp column. Each sample also updates
+minute/hour/day rollups, so charts over weeks or quarters read a few hundred
+pre-aggregated points instead of rescanning partner files. Queries can be
+further downsampled to a fixed number of points.
+
+Usage:
+    from partner_agents.metrics import MetricsStore
+
+    store = MetricsStore("scripts/partner_agents/state/metrics.json")
+    store.record({"total_pipeline": 1.2e6, "closed_revenue": 3.4e5})
+    store.query(["total_pipeline"], start=..., resolution="hour")
+"""
+
+import base64
+import logging
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .atomic import read_json, write_state
+
+logger = logging.getLogger(__name__)
+
+TimeLike = Union[datetime, float, str, None]
+
+# Numeric ProgramMetrics fields tracked as series
+METRIC_NAMES = (
+    "total_partners",
+    "active_partners",
+    "total_pipeline",
+    "closed_revenue",
+    "mtd_new_partners",
+    "ytd_new_partners",
+)
+
+# Rollup bucket width (seconds) and how many buckets each keeps
+RESOLUTIONS = {
+    "raw": (0, 5_000),
+    "minute": (60, 10_080),  # 7 days
+    "hour": (3_600, 8_784),  # ~1 year
+    "day": (86_400, 3_660),  # ~10 years
+}
+
+
+def _to_epoch(value: TimeLike) -> Optional[float]:
+    """Normalize datetime / ISO string / epoch float to epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+class MetricSeries:
+    """
+    Columnar time series: a timestamp column and one float column per metric.
+
+    When width is set, samples falling in the same bucket are averaged into a
+    single point stamped with the bucket start.
+    """
+
+    def __init__(
+        self, metrics: Iterable[str] = METRIC_NAMES, width: int = 0, capacity: int = 0
+    ):
+        self.metrics = tuple(metrics)
+        self.width = width
+        self.capacity = capacity
+        self.timestamps = array("d")
+        self.counts = array("L")
+        self.columns: Dict[str, array] = {m: array("d") for m in self.metrics}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def append(self, ts: float, values: Dict[str, float]):
+        """Add one sample, merging into the current bucket if it matches"""
+        if self.width:
+            ts = ts - (ts % self.width)
+        if self.width and self.timestamps and self.timestamps[-1] == ts:
+            n = self.counts[-1] + 1
+            for name, column in self.columns.items():
+                value = float(values.get(name, 0.0))
+                column[-1] += (value - column[-1]) / n
+            self.counts[-1] = n
+            return
+
+        self.timestamps.append(ts)
+        self.counts.append(1)
+        for name, column in self.columns.items():
+            column.append(float(values.get(name, 0.0)))
+        if self.capacity and len(self.timestamps) > self.capacity:
+            self._trim(len(self.timestamps) - self.capacity)
+
+    def _trim(self, count: int):
+        del self.timestamps[:count]
+        del self.counts[:count]
+        for column in self.columns.values():
+            del column[:count]
+
+    def bounds(self, start: Optional[float], end: Optional[float]):
+        """Index range [lo, hi) for timestamps within [start, end]"""
+        lo = 0 if start is None else bisect_left(self.timestamps, start)
+        hi = len(self.timestamps) if end is None else bisect_right(self.timestamps, end)
+        return lo, hi
+
+    def to_dict(self) -> Dict[str, Any]:
+        def pack(values: array) -> str:
+            if sys.byteorder != "little":
+                values = array(values.typecode, values)
+                values.byteswap()
+            return base64.b64encode(values.tobytes()).decode("ascii")
+
+        return {
+            "width": self.width,
+            "capacity": self.capacity,
+            "timestamps": pack(self.timestamps),
+            "counts": pack(array("d", self.counts)),
+            "columns": {name: pack(col) for name, col in self.columns.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], metrics: Iterable[str]) -> "MetricSeries":
+        def unpack(encoded: Optional[str]) -> array:
+            values = array("d")
+            if encoded:
+                values.frombytes(base64.b64decode(encoded))
+                if sys.byteorder != "little":
+                    values.byteswap()
+            return values
+
+        series = cls(metrics, data.get("width", 0), data.get("capacity", 0))
+        series.timestamps = unpack(data.get("timestamps"))
+        series.counts = array("L", (int(c) for c in unpack(data.get("counts"))))
+        size = len(series.timestamps)
+        for name in series.metrics:
+            column = unpack(data.get("columns", {}).get(name))
+            # Metrics added since the file was written start out as zeros
+            series.columns[name] = (
+                column if len(column) == size else array("d", [0.0]) * size
+            )
+        return series
+
+
+class MetricsStore:
+    """
+    Program metrics history with raw samples and minute/hour/day rollups.
+
+    Args:
+        path: JSON file the series are persisted to (None keeps it in memory)
+        metrics: Metric names to track
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        metrics: Iterable[str] = METRIC_NAMES,
+    ):
+        self.path = Path(path) if path else None
+        self.metrics = tuple(metrics)
+        self.series: Dict[str, MetricSeries] = {
+            name: MetricSeries(self.metrics, width, capacity)
+            for name, (width, capacity) in RESOLUTIONS.items()
+        }
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = read_json(self.path)
+        except (OSError, ValueError):
+            return
+        for name, payload in data.get("series", {}).items():
+            if name in self.series:
+                self.series[name] = MetricSeries.from_dict(payload, self.metrics)
+
+    def save(self):
+        """Persist all resolutions atomically"""
+        if not self.path:
+            return
+        with self._lock:
+            payload = {
+                "metrics": list(self.metrics),
+                "series": {name: s.to_dict() for name, s in self.series.items()},
+            }
+        write_state(self.path, payload, separators=(",", ":"))
+
+    @property
+    def last_sample_at(self) -> Optional[float]:
+        """Epoch seconds of the newest raw sample"""
+        raw = self.series["raw"].timestamps
+        return raw[-1] if raw else None
+
+    def record(self, values: Dict[str, float], ts: TimeLike = None):
+        """Record one sample into the raw series and every rollup"""
+        stamp = _to_epoch(ts) or time.time()
+        with self._lock:
+            for series in self.series.values():
+                series.append(stamp, values)
+
+    def pick_resolution(
+        self, start: Optional[float], end: Optional[float], max_points: int
+    ) -> str:
+        """Finest resolution whose bucket count over the range fits max_points"""
+        if start is None:
+            return "day"
+        span = (end or time.time()) - start
+        for name, (width, _) in RESOLUTIONS.items():
+            if not width:
+                continue
+            if span / width <= max_points:
+                return name
+        return "day"
+
+    def query(
+        self,
+        metrics: Optional[Iterable[str]] = None,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        resolution: str = "auto",
+        max_points: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return series for charts.
+
+        Args:
+            metrics: Metric names (default: all)
+            start: Inclusive lower bound (datetime, ISO string or epoch)
+            end: Inclusive upper bound
+            resolution: "raw", "minute", "hour", "day" or "auto"
+            max_points: Downsample to at most this many points by averaging
+        """
+        names = list(metrics) if metrics else list(self.metrics)
+        unknown = [m for m in names if m not in self.metrics]
+        if unknown:
+            raise ValueError(f"Unknown metric(s): {', '.join(unknown)}")
+        if resolution != "auto" and resolution not in self.series:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        start_ts, end_ts = _to_epoch(start), _to_epoch(end)
+        if resolution == "auto":
+            resolution = self.pick_resolution(start_ts, end_ts, max_points or 500)
+
+        with self._lock:
+            series = self.series[resolution]
+            lo, hi = series.bounds(start_ts, end_ts)
+            timestamps = series.timestamps[lo:hi]
+            columns = {m: series.columns[m][lo:hi] for m in names}
+
+        if max_points and len(timestamps) > max_points:
+            timestamps, columns = _downsample(timestamps, columns, max_points)
+
+        return {
+            "resolution": resolution,
+            "timestamps": [datetime.fromtimestamp(t).isoformat() for t in timestamps],
+            "series": {m: list(col) for m, col in columns.items()},
+        }
+
+    def latest(self) -> Dict[str, float]:
+        """Most recent raw sample"""
+        with self._lock:
+            raw = self.series["raw"]
+            if not raw:
+                return {}
+            return {m: raw.columns[m][-1] for m in self.metrics}
+
+
+def _downsample(timestamps: array, columns: Dict[str, array], max_points: int):
+    """Average consecutive runs of points down to max_points"""
+    size = len(timestamps)
+    out_ts = array("d")
+    out_cols = {m: array("d") for m in columns}
+    for i in range(max_points):
+        lo = i * size // max_points
+        hi = (i + 1) * size // max_points
+        if hi <= lo:
+            continue
+        out_ts.append(timestamps[lo])
+        for m, col in columns.items():
+            out_cols[m].append(sum(col[lo:hi]) / (hi - lo))
+    return out_ts, out_cols
+
+
+def program_values(metrics) -> Dict[str, float]:
+    """Numeric fields of a ProgramMetrics as a flat dict"""
+    names = {f.name for f in fields(metrics)}
+    data = asdict(metrics)
+    return {m: float(data[m]) for m in METRIC_NAMES if m in names}
+
+
+class MetricsSampler:
+    """
+    Background thread that refreshes Telemetry metrics on an interval.
+
+    Args:
+        telemetry: Telemetry instance to sample
+        interval_minutes: Minutes between samples
+    """
+
+    def __init__(self, telemetry, interval_minutes: float = 15):
+        self.telemetry = telemetry
+        self.interval = interval_minutes * 60
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.telemetry.refresh_metrics()
+            except Exception as e:
+                logger.warning(f"Metrics sample failed: {e}")
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
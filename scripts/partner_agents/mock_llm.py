@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+Mock LLM - Offline stand-in for OpenRouter/OpenAI and Ollama
+Like the team simulator: same wheel, same telemetry, no car on track.
+
+Serves the OpenAI chat-completions API (POST .../chat/completions, SSE when
+"stream": true) and Ollama's /api/chat (NDJSON streaming) with a
+configurable time-to-first-token distribution and token rate, so load tests
+of the web stack see realistic timings without a key or network.
+
+Replies come from one of three modes:
+    synth   - deterministic text derived from the prompt (default)
+    replay  - responses captured in a fixtures file, synth on a miss
+    record  - forward to a real upstream and append its answers to fixtures
+
+Usage:
+    python -m partner_agents.mock_llm --port 8765 --latency lognormal:800:0.5
+    PARTNERAGENTS_OPENROUTER_URL=http://127.0.0.1:8765/api/v1 \\
+        python -m partner_agents.web
+
+    # capture real answers once, then replay them offline
+    python -m partner_agents.mock_llm --mode record \\
+        --upstream https://openrouter.ai/api/v1 --fixtures fixtures.jsonl
+    python -m partner_agents.mock_llm --mode replay --fixtures fixtures.jsonl \\
+        --latency recorded
+
+Latency specs (milliseconds): fixed:MS, uniform:LO:HI,
+lognormal:MEDIAN:SIGMA, or "recorded" to reuse fixture timings in replay.
+
+Tests can inject faults on a running server: the next `fail_next` chat
+requests answer 503 and the next `stall_next` wait `stall_delay` seconds
+before answering.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+MODES = ("synth", "replay", "record")
+
+WORDS = (
+    "partner enablement pipeline co-sell joint customer onboarding tier "
+    "certification marketplace revenue quarterly business review playbook "
+    "integration referral incentive launch roadmap executive sponsor"
+).split()
+
+
+class LatencyProfile:
+    """Time-to-first-token distribution parsed from a spec string."""
+
+    def __init__(self, spec: str = "fixed:0"):
+        self.spec = spec
+        kind, _, rest = spec.partition(":")
+        params = [float(p) for p in rest.split(":") if p]
+        expected = {"fixed": 1, "uniform": 2, "lognormal": 2, "recorded": 0}
+        if kind not in expected or len(params) != expected[kind]:
+            raise ValueError(f"Bad latency spec: {spec!r}")
+        self.kind = kind
+        self.params = params
+
+    def sample(self, rng: random.Random, recorded_ms: Optional[float] = None) -> float:
+        """Delay in milliseconds."""
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "uniform":
+            return rng.uniform(*self.params)
+        if self.kind == "lognormal":
+            median, sigma = self.params
+            return median * math.exp(rng.gauss(0.0, sigma))
+        return recorded_ms or 0.0
+
+
+@dataclass
+class Fixture:
+    """One captured completion."""
+
+    key: str
+    model: str
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+
+
+def request_key(model: str, messages: List[Dict[str, Any]]) -> str:
+    """Stable key for a request: model plus role/content of every message."""
+    payload = json.dumps(
+        [model, [[m.get("role"), m.get("content")] for m in messages]],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def count_tokens(text: str) -> int:
+    return max(1, len(text) // 4) if text else 0
+
+
+def synth_reply(model: str, messages: List[Dict[str, Any]], tokens: int) -> str:
+    """Deterministic filler reply of roughly `tokens` words for a request."""
+    rng = random.Random(request_key(model, messages))
+    last = messages[-1].get("content", "") if messages else ""
+    opening = " ".join(str(last).split()[:8])
+    words = [rng.choice(WORDS) for _ in range(max(0, tokens - 4))]
+    return f"Mock reply to: {opening}. " + " ".join(words)
+
+
+class FixtureStore:
+    """Fixtures keyed by request, persisted as JSONL."""
+
+    def __init__(self, path: Union[str, Path, None]):
+        self.path = Path(path) if path else None
+        self.fixtures: Dict[str, Fixture] = {}
+        self._lock = threading.Lock()
+        if self.path and self.path.exists():
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                try:
+                    fixture = Fixture(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+                self.fixtures[fixture.key] = fixture
+
+    def get(self, key: str) -> Optional[Fixture]:
+        return self.fixtures.get(key)
+
+    def add(self, fixture: Fixture):
+        with self._lock:
+            self.fixtures[fixture.key] = fixture
+            if self.path:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(asdict(fixture), separators=(",", ":")) + "\n")
+
+    def __len__(self) -> int:
+        return len(self.fixtures)
+
+
+class MockLLMServer:
+    """
+    Threaded HTTP server speaking the OpenAI and Ollama chat wire formats.
+
+    Args:
+        host / port: Bind address (port 0 picks a free port)
+        latency: Time-to-first-token spec, see module docstring
+        tokens_per_second: Streaming rate after the first token (0 = instant)
+        reply_tokens: Length of synthesized replies
+        mode: synth, replay or record
+        fixtures: JSONL fixtures file read by replay and appended by record
+        upstream: Base URL record mode forwards to (OpenAI format)
+        seed: Seed for the latency distribution
+        reply: Fixed text for every synthesized reply (None synthesizes)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "fixed:0",
+        tokens_per_second: float = 0.0,
+        reply_tokens: int = 60,
+        mode: str = "synth",
+        fixtures: Union[str, Path, None] = None,
+        upstream: Optional[str] = None,
+        seed: int = 0,
+        reply: Optional[str] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode} (use {', '.join(MODES)})")
+        if mode == "record" and not upstream:
+            raise ValueError("record mode needs an upstream URL")
+        self.latency = LatencyProfile(latency)
+        self.tokens_per_second = tokens_per_second
+        self.reply_tokens = reply_tokens
+        self.mode = mode
+        self.fixtures = FixtureStore(fixtures)
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.reply = reply
+        self.stats = {"requests": 0, "replayed": 0, "recorded": 0, "synthesized": 0}
+        self.fail_next = 0
+        self.stall_next = 0
+        self.stall_delay = 1.0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> int:
+        """Chat requests received, failed ones included."""
+        return self.stats["requests"]
+
+    @property
+    def token_delay(self) -> float:
+        """Seconds between streamed tokens (the inverse of tokens_per_second)."""
+        return self.token_gap()
+
+    @token_delay.setter
+    def token_delay(self, seconds: float):
+        self.tokens_per_second = 1.0 / seconds if seconds else 0.0
+
+    # -- lifecycle -------------------------------------------------------
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mock-llm",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # -- replies ---------------------------------------------------------
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def admit(self) -> Tuple[bool, float]:
+        """Count a chat request and apply injected faults: (fail, stall seconds)."""
+        with self._lock:
+            self.stats["requests"] += 1
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                return True, 0.0
+            if self.stall_next > 0:
+                self.stall_next -= 1
+                return False, self.stall_delay
+        return False, 0.0
+
+    def respond(
+        self, model: str, messages: List[Dict[str, Any]], headers: Dict[str, str]
+    ) -> Tuple[Fixture, float]:
+        """The reply for a request and the delay before its first token (ms)."""
+        key = request_key(model, messages)
+        fixture = self.fixtures.get(key) if self.mode != "synth" else None
+        if fixture is not None:
+            self._count("replayed")
+        elif self.mode == "record":
+            fixture = self._record(key, model, messages, headers)
+            self._count("recorded")
+            return fixture, 0.0  # upstream already took its time
+        else:
+            content = self.reply
+            if content is None:
+                content = synth_reply(model, messages, self.reply_tokens)
+            fixture = Fixture(
+                key=key,
+                model=model,
+                content=content,
+                prompt_tokens=count_tokens(
+                    "".join(str(m.get("content", "")) for m in messages)
+                ),
+                completion_tokens=len(content.split()),
+            )
+            self._count("synthesized")
+        with self._lock:
+            delay_ms = self.latency.sample(self._rng, fixture.latency_ms)
+        return fixture, delay_ms
+
+    def _record(
+        self,
+        key: str,
+        model: str,
+        messages: List[Dict[str, Any]],
+        headers: Dict[str, str],
+    ) -> Fixture:
+        forward = {
+            k: v
+            for k, v in headers.items()
+            if k.lower() in ("authorization", "http-referer", "x-title")
+        }
+        start = time.perf_counter()
+        response = httpx.post(
+            f"{self.upstream}/chat/completions",
+            headers=forward,
+            json={"model": model, "messages": messages},
+            timeout=120.0,
+        )
+        response.raise_for_status()
+        result = response.json()
+        choices = result.get("choices") or []
+        content = (choices[0].get("message") or {}).get("content") if choices else ""
+        usage = result.get("usage") or {}
+        fixture = Fixture(
+            key=key,
+            model=model,
+            content=content or "",
+            prompt_tokens=usage.get("prompt_tokens") or 0,
+            completion_tokens=usage.get("completion_tokens") or 0,
+            latency_ms=round((time.perf_counter() - start) * 1000, 3),
+        )
+        self.fixtures.add(fixture)
+        return fixture
+
+    def token_pieces(self, content: str) -> List[str]:
+        words = content.split(" ")
+        return [w + (" " if i < len(words) - 1 else "") for i, w in enumerate(words)]
+
+    def token_gap(self) -> float:
+        return 1.0 / self.tokens_per_second if self.tokens_per_second else 0.0
+
+    def generate(self, content: str):
+        """Wait as long as streaming content would take (non-streamed replies)."""
+        gap = self.token_gap()
+        if gap:
+            time.sleep(gap * (len(self.token_pieces(content)) - 1))
+
+    # -- HTTP ------------------------------------------------------------
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Dict[str, Any]):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _chunk(self, data: bytes):
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_GET(self):
+                if self.path.endswith("/api/tags"):
+                    self._send_json(200, {"models": [{"name": "mock"}]})
+                elif self.path.endswith("/models"):
+                    self._send_json(200, {"data": [{"id": "mock"}]})
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send_json(400, {"error": "invalid JSON"})
+                    return
+                if self.path.endswith("/chat/completions"):
+                    wire = "openai"
+                elif self.path == "/api/chat":
+                    wire = "ollama"
+                else:
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                failing, stall = server.admit()
+                if failing:
+                    self._send_json(503, {"error": "injected failure"})
+                    return
+                time.sleep(stall)
+
+                model = body.get("model", "mock")
+                messages = body.get("messages") or []
+                try:
+                    fixture, delay_ms = server.respond(
+                        model, messages, dict(self.headers)
+                    )
+                except httpx.HTTPError as e:
+                    self._send_json(502, {"error": f"upstream: {e}"})
+                    return
+                time.sleep(delay_ms / 1000)
+
+                stream = body.get("stream", wire == "ollama")
+                try:
+                    if wire == "openai":
+                        self._openai(fixture, stream)
+                    else:
+                        self._ollama(fixture, stream)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client gave up mid-stream
+
+            def _openai(self, fixture: Fixture, stream: bool):
+                usage = {
+                    "prompt_tokens": fixture.prompt_tokens,
+                    "completion_tokens": fixture.completion_tokens,
+                    "total_tokens": fixture.prompt_tokens + fixture.completion_tokens,
+                }
+                base = {
+                    "id": f"mock-{fixture.key[:12]}",
+                    "created": int(time.time()),
+                    "model": fixture.model,
+                }
+                if not stream:
+                    server.generate(fixture.content)
+                    self._send_json(
+                        200,
+                        {
+                            **base,
+                            "object": "chat.completion",
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {
+                                        "role": "assistant",
+                                        "content": fixture.content,
+                                    },
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                            "usage": usage,
+                        },
+                    )
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                gap = server.token_gap()
+                for i, piece in enumerate(server.token_pieces(fixture.content)):
+                    if i and gap:
+                        time.sleep(gap)
+                    event = {
+                        **base,
+                        "object": "chat.completion.chunk",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "delta": {"content": piece},
+                                "finish_reason": None,
+                            }
+                        ],
+                    }
+                    self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+                final = {
+                    **base,
+                    "object": "chat.completion.chunk",
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                    "usage": usage,
+                }
+                self._chunk(f"data: {json.dumps(final)}\n\n".encode())
+                self._chunk(b"data: [DONE]\n\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _ollama(self, fixture: Fixture, stream: bool):
+                done = {
+                    "model": fixture.model,
+                    "message": {"role": "assistant", "content": ""},
+                    "done": True,
+                    "prompt_eval_count": fixture.prompt_tokens,
+                    "eval_count": fixture.completion_tokens,
+                }
+                if not stream:
+                    server.generate(fixture.content)
+                    done["message"]["content"] = fixture.content
+                    self._send_json(200, done)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                gap = server.token_gap()
+                for i, piece in enumerate(server.token_pieces(fixture.content)):
+                    if i and gap:
+                        time.sleep(gap)
+                    line = {
+                        "model": fixture.model,
+                        "message": {"role": "assistant", "content": piece},
+                        "done": False,
+                    }
+                    self._chunk((json.dumps(line) + "\n").encode())
+                self._chunk((json.dumps(done) + "\n").encode())
+                self.wfile.write(b"0\r\n\r\n")
+
+        return Handler
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Offline mock LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="lognormal:800:0.5")
+    parser.add_argument("--tokens-per-second", type=float, default=40.0)
+    parser.add_argument("--reply-tokens", type=int, default=60)
+    parser.add_argument("--mode", choices=MODES, default="synth")
+    parser.add_argument("--fixtures")
+    parser.add_argument("--upstream")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = MockLLMServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        reply_tokens=args.reply_tokens,
+        mode=args.mode,
+        fixtures=args.fixtures,
+        upstream=args.upstream,
+        seed=args.seed,
+    )
+    print(f"Mock LLM ({args.mode}) on {server.url}")
+    print(f"  PARTNERAGENTS_OPENROUTER_URL={server.url}/api/v1")
+    print(f"  PARTNERAGENTS_OLLAMA_URL={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,13 @@ The Race Engineer - coordinates all drivers.
 """
 
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 import logging
 
 from .base import BaseAgent, AgentPriority, HandoffRequest
-from .messages import TeamRadio, MessageType
+from .messages import TeamRadio, MessageType, radio as default_radio
+from .tracing import Tracer, tracer as default_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +31,22 @@ class Orchestrator:
     Coordinates all 6 agents, manages handoffs, tracks progress.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        tracer: Optional[Tracer] = None,
+        max_history: int = 500,
+        radio: Optional[TeamRadio] = None,
+    ):
         self.drivers: Dict[str, BaseAgent] = {}
         self.race_strategy: Optional[RaceStrategy] = None
-        self.radio = TeamRadio()
+        self.radio = radio or TeamRadio()
+        self.tracer = tracer or default_tracer
+        self.max_history = max_history
         self.telemetry_history: List[Dict] = []
 
     def register_driver(self, agent: BaseAgent):
         """Add a driver to the garage"""
+        agent.tracer = self.tracer
         self.drivers[agent.agent_id] = agent
         logger.info(f"🏎️ {agent.name} joined the grid")
 
@@ -61,38 +70,52 @@ class Orchestrator:
 
         driver = self.drivers[driver_id]
 
-        request = HandoffRequest(
-            from_agent=from_driver or "system",
-            to_agent=driver_id,
-            priority=priority,
-            skill_name=skill_name,
-            context=context,
-        )
-
-        self.radio.transmit(
-            {
-                "from": from_driver or "system",
-                "to": driver_id,
-                "message": f"Calling {skill_name}",
-                "priority": priority.name,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
-
-        driver.receive_handoff(request)
-        result = driver.call_skill(skill_name, context)
-        response = driver.complete_handoff(result)
-
-        self.radio.transmit(
-            {
-                "from": driver_id,
-                "to": "all",
-                "message": f"Completed {skill_name}",
-                "result": "success",
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
-
+        span = None
+        try:
+            with self.tracer.span(
+                f"handoff:{skill_name}",
+                driver=driver_id,
+                from_driver=from_driver or "system",
+                priority=priority.name,
+            ) as span:
+                request = HandoffRequest(
+                    from_agent=from_driver or "system",
+                    to_agent=driver_id,
+                    priority=priority,
+                    skill_name=skill_name,
+                    context=context,
+                    trace_id=span.trace_id,
+                    span_id=span.span_id,
+                )
+
+                self.radio.transmit(
+                    {
+                        "from": from_driver or "system",
+                        "to": driver_id,
+                        "message": f"Calling {skill_name}",
+                        "priority": priority.name,
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
+
+                driver.receive_handoff(request)
+                result = driver.call_skill(skill_name, context)
+                response = driver.complete_handoff(result)
+
+                self.radio.transmit(
+                    {
+                        "from": driver_id,
+                        "to": "all",
+                        "message": f"Completed {skill_name}",
+                        "result": "success",
+                        "timestamp": datetime.now().isoformat(),
+                    }
+                )
+        finally:
+            if span is not None:
+                self._record_handoff(span)
+
+        response["trace_id"] = span.trace_id
         return response
 
     def pit_stop(
@@ -107,6 +130,23 @@ class Orchestrator:
             from_driver=from_driver,
         )
 
+    def _record_handoff(self, span):
+        """Keep a bounded history of handoff timings"""
+        self.telemetry_history.append(
+            {
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "driver": span.driver,
+                "skill": span.name.split(":", 1)[-1],
+                "from": span.attributes.get("from_driver"),
+                "started_at": span.started_at,
+                "duration_ms": span.duration_ms,
+                "error": span.error,
+            }
+        )
+        if len(self.telemetry_history) > self.max_history:
+            self.telemetry_history = self.telemetry_history[-self.max_history :]
+
     def full_course_yellow(self):
         """All hands on deck - emergency"""
         for driver in self.drivers.values():
@@ -120,12 +160,13 @@ class Orchestrator:
         }
 
     def race_summary(self) -> Dict:
-        """Full race report"""
+        """Full race report - JSON-serializable"""
         return {
-            "strategy": self.race_strategy,
+            "strategy": asdict(self.race_strategy) if self.race_strategy else None,
             "standings": self.get_standings(),
             "radio_log": self.radio.get_recent(10),
             "telemetry": self.telemetry_history,
+            "tracing": self.tracer.export(),
         }
 
     def get_driver(self, driver_id: str) -> Optional[BaseAgent]:
@@ -137,4 +178,5 @@ class Orchestrator:
         return list(self.drivers.keys())
 
 
-orchestrator = Orchestrator()
+# Shares the module radio so a configured radio log has a single writer
+orchestrator = Orchestrator(radio=default_radio)
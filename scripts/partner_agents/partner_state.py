@@ -1,62 +1,63 @@
-"""Partner state management."""
+"""
+Partner state management.
 
-# TODO: Technical Debt - Divergent state management.
-# This implementation uses a single partners.json file, while the CLI agent
-# in scripts/partner_agent/ uses a directory-per-partner approach.
-# These should be unified into a single persistence layer.
+Partners live in the shared partner store (partner_agents.store), the same
+records the playbook agent and report generator use. The legacy
+partners.json is only read by `python -m partner_agents.store migrate`.
+"""
 
-import json
-import os
 import html
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
-PARTNERS_FILE = Path(__file__).resolve().parent / "partners.json"
+from . import store
 
-# In-memory cache for performance
+# Pointing PARTNERS_FILE elsewhere (as tests do) keeps the store in a
+# "state" directory beside it instead of the shared one
+PARTNERS_FILE = store.LEGACY_PARTNERS_FILE
+
+# Partner list and stats, valid while the store's signature is unchanged
 _partners_cache: Optional[List[Dict]] = None
-_partners_by_name: Dict[str, Dict] = {}
 _stats_cache: Optional[Dict] = None
-_last_mtime: float = 0
+_cache_signature: Optional[Tuple] = None
+
+
+def _store() -> store.PartnerStore:
+    if PARTNERS_FILE == store.LEGACY_PARTNERS_FILE:
+        return store.store_for(store.STATE_DIR)
+    return store.store_for(Path(PARTNERS_FILE).parent / "state")
 
 
 def load_partners() -> List[Dict]:
-    """Load partners from file with in-memory caching."""
-    global _partners_cache, _last_mtime, _partners_by_name
+    """All partners, oldest first, cached until the store changes."""
+    global _partners_cache, _stats_cache, _cache_signature
 
-    if not PARTNERS_FILE.exists():
-        _partners_cache = []
-        _partners_by_name = {}
-        _last_mtime = 0
-        return []
+    partner_store = _store()
+    signature = (partner_store.state_dir, partner_store.signature())
+    if _partners_cache is not None and signature == _cache_signature:
+        return _partners_cache
+    _partners_cache = partner_store.all()
+    _stats_cache = None
+    _cache_signature = (partner_store.state_dir, partner_store.signature())
+    return _partners_cache
 
-    try:
-        mtime = os.path.getmtime(PARTNERS_FILE)
-        if _partners_cache is not None and mtime <= _last_mtime:
-            return _partners_cache
 
-        with open(PARTNERS_FILE) as f:
-            _partners_cache = json.load(f)
-            _partners_by_name = {p["name"].lower(): p for p in _partners_cache}
-            _last_mtime = mtime
-            return _partners_cache
-    except Exception:
-        return _partners_cache if _partners_cache is not None else []
+def _invalidate():
+    global _partners_cache, _stats_cache
+    _partners_cache = None
+    _stats_cache = None
 
 
 def save_partners(partners: List[Dict]):
-    """Save partners to file and update cache."""
-    global _partners_cache, _last_mtime, _stats_cache, _partners_by_name
-    with open(PARTNERS_FILE, "w") as f:
-        json.dump(partners, f, indent=2)
-    _partners_cache = partners
-    _partners_by_name = {p["name"].lower(): p for p in partners}
-    _stats_cache = None  # Invalidate stats cache
-    try:
-        _last_mtime = os.path.getmtime(PARTNERS_FILE)
-    except Exception:
-        _last_mtime = 0
+    """
+    Write the partners that changed.
+
+    Partners missing from the list are kept: other writers share the store,
+    so a list loaded earlier may not hold every partner. Use delete_partner().
+    """
+    _store().save_many(partners)
+    _invalidate()
 
 
 def add_partner(
@@ -83,7 +84,7 @@ def add_partner(
         "contact": contact,
         "email": email,
         "status": "Onboarding",
-        "created_at": datetime.now().isoformat(),
+        "created": datetime.now().isoformat(),
         "deals": [],
         "campaigns": [],
         "notes": [],
@@ -96,9 +97,8 @@ def add_partner(
 
 
 def get_partner(name: str) -> Dict:
-    """Get partner by name (optimized with dict lookup)."""
-    load_partners()
-    return _partners_by_name.get(name.lower())
+    """Get partner by name (through the store's index)."""
+    return _store().find(name)
 
 
 def list_partners() -> List[Dict]:
@@ -112,7 +112,6 @@ def update_partner(name: str, updates: Dict) -> Dict:
     for p in partners:
         if p["name"].lower() == name.lower():
             p.update(updates)
-            p["updated_at"] = datetime.now().isoformat()
             save_partners(partners)
             return p
     return None
@@ -138,7 +137,6 @@ def register_deal(partner_name: str, deal_value: int, account: str) -> Dict:
                 "registered_at": datetime.now().isoformat(),
             }
             p.setdefault("deals", []).append(deal)
-            p["updated_at"] = datetime.now().isoformat()
             save_partners(partners)
             return deal
     return None
@@ -177,13 +175,12 @@ def get_partner_stats() -> Dict:
 
 def delete_partner(name: str) -> bool:
     """Delete a partner by name."""
-    partners = load_partners()
-    original_len = len(partners)
-    partners = [p for p in partners if p["name"].lower() != name.lower()]
-    if len(partners) < original_len:
-        save_partners(partners)
-        return True
-    return False
+    partner = get_partner(name)
+    if partner is None or partner["name"].lower() != name.lower():
+        return False
+    _store().delete(partner["slug"])
+    _invalidate()
+    return True
 
 
 def add_document(
@@ -195,23 +192,60 @@ def add_document(
     status: str = "draft",
 ) -> Optional[Dict]:
     """Add a document to a partner's document list."""
-    partners = load_partners()
-    for p in partners:
-        if p["name"].lower() == partner_name.lower():
-            doc = {
-                "id": f"doc-{len(p.get('documents', [])) + 1}",
-                "type": doc_type,
+    docs = add_documents(
+        partner_name,
+        [
+            {
+                "doc_type": doc_type,
                 "template": template,
                 "path": file_path,
+                "fields": fields,
                 "status": status,
-                "fields": fields or {},
-                "created_at": datetime.now().isoformat(),
             }
-            p.setdefault("documents", []).append(doc)
-            p["updated_at"] = datetime.now().isoformat()
-            save_partners(partners)
-            return doc
-    return None
+        ],
+    )
+    return docs[0] if docs else None
+
+
+def add_documents(partner_name: str, documents: List[Dict]) -> List[Dict]:
+    """
+    Add several documents to a partner in a single write.
+
+    Each entry uses the keys returned by document_generator.create_document
+    (doc_type, template, path, fields) plus an optional status.
+    """
+    return add_documents_many({partner_name: documents}).get(partner_name, [])
+
+
+def add_documents_many(documents: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    """Add documents for many partners (name -> entries) in a single write."""
+    partners = load_partners()
+    wanted = {name.lower(): entries for name, entries in documents.items()}
+    names = {name.lower(): name for name in documents}
+    now = datetime.now().isoformat()
+    added: Dict[str, List[Dict]] = {}
+    for p in partners:
+        entries = wanted.pop(p["name"].lower(), None)
+        if not entries:
+            continue
+        existing = p.setdefault("documents", [])
+        new_docs = []
+        for entry in entries:
+            doc = {
+                "id": f"doc-{len(existing) + 1}",
+                "type": entry["doc_type"],
+                "template": entry["template"],
+                "path": entry["path"],
+                "status": entry.get("status", "draft"),
+                "fields": entry.get("fields") or {},
+                "created_at": now,
+            }
+            existing.append(doc)
+            new_docs.append(doc)
+        added[names[p["name"].lower()]] = new_docs
+    if added:
+        save_partners(partners)
+    return added
 
 
 def get_partner_documents(partner_name: str) -> List[Dict]:
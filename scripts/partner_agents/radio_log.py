@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Radio Log - Persistent, segmented TeamRadio history
+Like the FIA's timing archive: every transmission kept, every lap searchable.
+
+Messages are appended as JSON lines to size-capped segment files. Each
+segment has a small sidecar holding its time range, the drivers and message
+types it contains, and a sparse (timestamp, byte offset) index. Queries skip
+whole segments using the sidecar and seek straight to the first matching
+record inside a segment, so cost tracks the size of the result rather than
+the size of the log.
+
+Layout:
+    <log_dir>/radio-000001.jsonl
+    <log_dir>/radio-000001.idx.json
+    ...
+"""
+
+import json
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+from .atomic import atomic_write_json
+
+TimeLike = Union[datetime, float, str, None]
+
+
+def _to_epoch(value: TimeLike) -> Optional[float]:
+    """Normalize datetime / ISO string / epoch float to epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+@dataclass
+class Segment:
+    """Metadata for one segment file"""
+
+    number: int
+    path: Path
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+    count: int = 0
+    size: int = 0
+    drivers: Set[str] = field(default_factory=set)
+    types: Set[str] = field(default_factory=set)
+    index: List[List[float]] = field(default_factory=list)  # [ts, offset]
+
+    @property
+    def index_path(self) -> Path:
+        return self.path.with_suffix(".idx.json")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "count": self.count,
+            "size": self.size,
+            "drivers": sorted(self.drivers),
+            "types": sorted(self.types),
+            "index": self.index,
+        }
+
+    def overlaps(self, start: Optional[float], end: Optional[float]) -> bool:
+        if self.first_ts is None:
+            return False
+        if start is not None and self.last_ts < start:
+            return False
+        if end is not None and self.first_ts > end:
+            return False
+        return True
+
+
+class RadioLog:
+    """
+    Append-only radio log split into rotating segment files.
+
+    Args:
+        log_dir: Directory holding segment and index files
+        max_segment_bytes: Rotate to a new segment once this size is reached
+        index_every: Add a sparse index entry every N records
+        max_segments: Optionally delete the oldest segments beyond this count
+    """
+
+    SEGMENT_GLOB = "radio-*.jsonl"
+
+    def __init__(
+        self,
+        log_dir: Union[str, Path],
+        max_segment_bytes: int = 1_048_576,
+        index_every: int = 64,
+        max_segments: Optional[int] = None,
+    ):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.index_every = max(1, index_every)
+        self.max_segments = max_segments
+        self.segments: List[Segment] = []
+        self._fh = None
+        self._lock = threading.Lock()
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        for path in sorted(self.log_dir.glob(self.SEGMENT_GLOB)):
+            try:
+                number = int(path.stem.split("-", 1)[1])
+            except (IndexError, ValueError):
+                continue
+            segment = Segment(number=number, path=path)
+            sidecar = segment.index_path
+            if sidecar.exists():
+                try:
+                    data = json.loads(sidecar.read_text())
+                    segment.first_ts = data.get("first_ts")
+                    segment.last_ts = data.get("last_ts")
+                    segment.count = data.get("count", 0)
+                    segment.size = data.get("size", 0)
+                    segment.drivers = set(data.get("drivers", []))
+                    segment.types = set(data.get("types", []))
+                    segment.index = data.get("index", [])
+                except (OSError, ValueError):
+                    segment = Segment(number=number, path=path)
+            # Sidecar may lag the data file after a crash; scan only the tail
+            actual = path.stat().st_size
+            if actual < segment.size:
+                segment = Segment(number=number, path=path)
+            if actual != segment.size:
+                self._scan_tail(segment)
+            self.segments.append(segment)
+
+    def _scan_tail(self, segment: Segment):
+        """Index records written after the sidecar was last saved."""
+        with open(segment.path, "r+b") as f:
+            f.seek(segment.size)
+            offset = segment.size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    offset += len(line)
+                    continue
+                self._track(segment, record, offset)
+                offset += len(line)
+            # Drop a torn final write so the next append starts on a clean line
+            f.truncate(offset)
+            segment.size = offset
+        self._write_sidecar(segment)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @property
+    def count(self) -> int:
+        """Total records across all segments"""
+        return sum(s.count for s in self.segments)
+
+    def _track(self, segment: Segment, record: Dict[str, Any], offset: int):
+        ts = record["ts"]
+        if segment.count % self.index_every == 0:
+            segment.index.append([ts, offset])
+        if segment.first_ts is None:
+            segment.first_ts = ts
+        segment.last_ts = ts
+        segment.count += 1
+        segment.drivers.update(
+            d for d in (record.get("from"), record.get("to")) if d is not None
+        )
+        if record.get("type"):
+            segment.types.add(record["type"])
+
+    def _write_sidecar(self, segment: Segment):
+        # Sidecars are rebuilt from the segment if lost, so skip the fsync
+        atomic_write_json(
+            segment.index_path, segment.to_dict(), fsync=False, separators=(",", ":")
+        )
+
+    def _open_segment(self, number: int) -> Segment:
+        segment = Segment(
+            number=number, path=self.log_dir / f"radio-{number:06d}.jsonl"
+        )
+        segment.path.touch()
+        self.segments.append(segment)
+        return segment
+
+    def _active_segment(self, incoming: int) -> Segment:
+        if not self.segments:
+            return self._open_segment(1)
+        segment = self.segments[-1]
+        if segment.count and segment.size + incoming > self.max_segment_bytes:
+            self._close_handle()
+            self._write_sidecar(segment)
+            segment = self._open_segment(segment.number + 1)
+            self._enforce_max_segments()
+        return segment
+
+    def _enforce_max_segments(self):
+        if not self.max_segments:
+            return
+        while len(self.segments) > self.max_segments:
+            oldest = self.segments.pop(0)
+            oldest.path.unlink(missing_ok=True)
+            oldest.index_path.unlink(missing_ok=True)
+
+    def _close_handle(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def append(self, record: Dict[str, Any]):
+        """Append one radio record. Requires an epoch 'ts' field."""
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode(
+            "utf-8"
+        )
+        with self._lock:
+            segment = self._active_segment(len(line))
+            if self._fh is None:
+                self._fh = open(segment.path, "ab")
+            offset = segment.size
+            self._fh.write(line)
+            self._fh.flush()
+            segment.size += len(line)
+            indexed = len(segment.index)
+            self._track(segment, record, offset)
+            if len(segment.index) != indexed:
+                self._write_sidecar(segment)
+
+    def flush(self):
+        """Persist the active segment's sidecar"""
+        with self._lock:
+            if self.segments:
+                self._write_sidecar(self.segments[-1])
+
+    def close(self):
+        """Flush and release the active file handle"""
+        self.flush()
+        with self._lock:
+            self._close_handle()
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        driver_id: Optional[str] = None,
+        message_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records in time order.
+
+        Args:
+            start: Inclusive lower bound (datetime, ISO string or epoch)
+            end: Inclusive upper bound
+            driver_id: Only messages from or to this driver
+            message_type: Only this MessageType value (e.g. "pit_stop")
+            limit: Stop after this many matches
+        """
+        start_ts, end_ts = _to_epoch(start), _to_epoch(end)
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+            candidates = [
+                s
+                for s in self.segments
+                if s.overlaps(start_ts, end_ts)
+                and (driver_id is None or driver_id in s.drivers)
+                and (message_type is None or message_type in s.types)
+            ]
+            snapshot = [(s, s.size, list(s.index)) for s in candidates]
+
+        matched = 0
+        for segment, size, index in snapshot:
+            offset = 0
+            if start_ts is not None and index:
+                pos = bisect_right([entry[0] for entry in index], start_ts) - 1
+                offset = int(index[max(pos, 0)][1])
+            with open(segment.path, "rb") as f:
+                f.seek(offset)
+                while f.tell() < size:
+                    line = f.readline()
+                    if not line:
+                        break
+                    record = json.loads(line)
+                    ts = record["ts"]
+                    if start_ts is not None and ts < start_ts:
+                        continue
+                    if end_ts is not None and ts > end_ts:
+                        return
+                    if driver_id is not None and driver_id not in (
+                        record.get("from"),
+                        record.get("to"),
+                    ):
+                        continue
+                    if message_type is not None and record.get("type") != message_type:
+                        continue
+                    yield record
+                    matched += 1
+                    if limit is not None and matched >= limit:
+                        return
+
+    def stats(self) -> Dict[str, Any]:
+        """Segment counts and sizes"""
+        with self._lock:
+            return {
+                "log_dir": str(self.log_dir),
+                "segments": len(self.segments),
+                "records": sum(s.count for s in self.segments),
+                "bytes": sum(s.size for s in self.segments),
+            }
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Retrieval - Template passages for the chat prompt
+Like the race engineer reading the relevant page of the rulebook over the radio.
+
+Markdown under docs/ (as listed by the shared template registry) is split
+into heading-scoped chunks of a few hundred words and indexed into two flat
+files: the chunk text and a uint32 array holding chunk offsets, lengths and
+BM25 postings. Both are memory-mapped, so a query touches only the postings
+for its terms and the chunks it returns.
+
+Each build is written to its own version directory and published by
+replacing the CURRENT pointer, so readers always map a matching set of
+files. Chat turns never build: ensure_fresh() serves the index already on
+disk (or none) and checks for changed sources on a background thread.
+Build ahead of time with:
+    python -m partner_agents.retrieval build
+
+Layout:
+    .cache/retrieval/CURRENT                  # name of the live version
+    .cache/retrieval/<version>/meta.json      # sources, vocabulary, sections
+    .cache/retrieval/<version>/chunks.txt     # UTF-8 chunk text, back to back
+    .cache/retrieval/<version>/index.bin      # uint32: offsets | lengths |
+                                              #         docs | postings
+"""
+
+import argparse
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .atomic import atomic_write
+from .template_search import (
+    B,
+    K1,
+    REPO_ROOT,
+    TemplateRegistry,
+    get_registry,
+    split_frontmatter,
+    tokenize,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = REPO_ROOT / ".cache" / "retrieval"
+CURRENT_FILE = "CURRENT"
+INDEX_VERSION = 1
+CHUNK_WORDS = 180
+
+HEADING_RE = re.compile(r"^#{1,4}\s+(.+?)\s*#*$", re.MULTILINE)
+
+
+@dataclass
+class Passage:
+    """A retrieved chunk and where it came from."""
+
+    source: str
+    heading: str
+    text: str
+    score: float
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def chunk_markdown(body: str, max_words: int = CHUNK_WORDS) -> List[Tuple[str, str]]:
+    """Split a markdown body into (heading, text) chunks of at most max_words."""
+    sections: List[Tuple[str, str]] = []
+    starts = [(m.start(), m.group(1)) for m in HEADING_RE.finditer(body)]
+    if not starts or starts[0][0] > 0:
+        starts.insert(0, (0, ""))
+    for i, (start, heading) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else len(body)
+        text = body[start:end]
+        if heading:
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+        sections.append((heading, text))
+
+    chunks = []
+    for heading, text in sections:
+        # Whole lines per chunk so tables and lists keep their shape
+        lines: List[str] = []
+        words = 0
+        for line in text.strip().splitlines() + [None]:
+            if line is None or (words and words + len(line.split()) > max_words):
+                piece = "\n".join(lines).strip()
+                if len(tokenize(piece)) >= 5:
+                    chunks.append((heading, piece))
+                lines, words = [], 0
+            if line is not None:
+                lines.append(line)
+                words += len(line.split())
+    return chunks
+
+
+class ChunkIndex:
+    """
+    Memory-mapped BM25 index over template chunks.
+
+    Args:
+        registry: Template registry listing the sources (default: the shared one)
+        index_dir: Where the index versions and CURRENT pointer live
+        check_interval: Seconds between background checks for changed sources
+        root: Registry root to index
+    """
+
+    def __init__(
+        self,
+        registry: Optional[TemplateRegistry] = None,
+        index_dir: Union[str, Path] = INDEX_DIR,
+        check_interval: float = 5.0,
+        root: str = "docs",
+    ):
+        self.registry = registry or get_registry(refresh=False)
+        self.root = root
+        self.index_dir = Path(index_dir)
+        self.check_interval = check_interval
+        # (meta, chunk text map, uint32 view), swapped as one on rebuild
+        self._state: Optional[Tuple[Dict, Optional[mmap.mmap], memoryview]] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._builder: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    # -- building --------------------------------------------------------
+
+    def _signatures(self) -> Dict[str, List[int]]:
+        records = self.registry.refresh().query(root=self.root, include_index=True)
+        return {r.path: [r.mtime_ns, r.size] for r in records}
+
+    def build(self, signatures: Optional[Dict[str, List[int]]] = None) -> str:
+        """Chunk every template, publish a new index version and open it."""
+        with self._build_lock:
+            signatures = signatures if signatures is not None else self._signatures()
+            version = self._write_version(signatures)
+            self._publish(version)
+            self._open()
+        return version
+
+    def _write_version(self, signatures: Dict[str, List[int]]) -> str:
+        docs_dir = self.registry.roots[self.root]
+        sources = list(signatures)
+        text = bytearray()
+        offsets = array("I", [0])
+        lengths = array("I")
+        docs = array("I")
+        headings: List[str] = []
+        term_postings: Dict[str, List[Tuple[int, int]]] = {}
+
+        for doc_id, rel in enumerate(sources):
+            content = (docs_dir / rel).read_text(encoding="utf-8", errors="replace")
+            frontmatter, body = split_frontmatter(content)
+            title = str(frontmatter.get("title") or Path(rel).stem)
+            for heading, piece in chunk_markdown(body):
+                chunk_id = len(lengths)
+                tokens = tokenize(f"{title} {heading} {piece}")
+                counts: Dict[str, int] = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                for term, tf in counts.items():
+                    term_postings.setdefault(term, []).append((chunk_id, tf))
+                text += piece.encode("utf-8")
+                offsets.append(len(text))
+                lengths.append(len(tokens))
+                docs.append(doc_id)
+                headings.append(f"{title} > {heading}" if heading else title)
+
+        count = len(lengths)
+        postings = array("I")
+        vocab = {}
+        for term in sorted(term_postings):
+            entries = term_postings[term]
+            vocab[term] = [len(postings) // 2, len(entries)]
+            for chunk_id, tf in entries:
+                postings.extend((chunk_id, tf))
+
+        sections = {"offsets": 0, "lengths": count + 1, "docs": 2 * count + 1}
+        sections["postings"] = 3 * count + 1
+        meta = {
+            "version": INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "signatures": signatures,
+            "sources": sources,
+            "headings": headings,
+            "chunks": count,
+            "avg_length": (sum(lengths) / count) if count else 0.0,
+            "sections": sections,
+            "vocab": vocab,
+        }
+
+        version = f"v{time.time_ns()}-{os.getpid()}"
+        staging = self.index_dir / f".{version}.tmp"
+        staging.mkdir(parents=True)
+        (staging / "chunks.txt").write_bytes(bytes(text))
+        (staging / "index.bin").write_bytes(
+            b"".join(a.tobytes() for a in (offsets, lengths, docs, postings))
+        )
+        (staging / "meta.json").write_text(
+            json.dumps(meta, separators=(",", ":")), encoding="utf-8"
+        )
+        os.replace(staging, self.index_dir / version)
+        return version
+
+    def _publish(self, version: str):
+        """Point CURRENT at version and drop all but it and the one before."""
+        previous = self._current_version()
+        atomic_write(self.index_dir / CURRENT_FILE, version, fsync=False)
+        keep = {version, previous}
+        for path in self.index_dir.iterdir():
+            if path.is_dir() and path.name.startswith("v") and path.name not in keep:
+                # Open maps of removed files stay valid until they are closed
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _current_version(self) -> Optional[str]:
+        try:
+            return (self.index_dir / CURRENT_FILE).read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+    # -- loading ---------------------------------------------------------
+
+    @staticmethod
+    def _map(path: Path) -> Optional[mmap.mmap]:
+        if not path.exists() or path.stat().st_size == 0:
+            return None
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _open(self) -> bool:
+        version = self._current_version()
+        if not version:
+            return False
+        directory = self.index_dir / version
+        try:
+            meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if (
+            meta.get("version") != INDEX_VERSION
+            or meta.get("byteorder") != sys.byteorder
+        ):
+            return False
+        ints = self._map(directory / "index.bin")
+        # Old maps are left to the garbage collector: in-flight searches may hold them
+        self._version = version
+        self._state = (
+            meta,
+            self._map(directory / "chunks.txt"),
+            (
+                memoryview(ints).cast("I")
+                if ints is not None
+                else memoryview(b"").cast("I")
+            ),
+        )
+        return True
+
+    @property
+    def meta(self) -> Dict:
+        return self._state[0] if self._state else {}
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def ensure_fresh(self) -> "ChunkIndex":
+        """
+        Open the published index and, every check_interval, look for changed
+        sources on a background thread. Never builds on the caller's thread:
+        until a rebuild is published, searches use the previous version (or
+        return nothing on a cold start).
+        """
+        with self._lock:
+            if self._state is None or self._version != self._current_version():
+                self._open()
+            now = time.monotonic()
+            if now - self._checked_at >= self.check_interval and not self.building:
+                self._checked_at = now
+                self._builder = threading.Thread(
+                    target=self._refresh, name="retrieval-index", daemon=True
+                )
+                self._builder.start()
+        return self
+
+    @property
+    def building(self) -> bool:
+        return self._builder is not None and self._builder.is_alive()
+
+    def _refresh(self):
+        try:
+            signatures = self._signatures()
+            if self.meta.get("signatures") != signatures:
+                self.build(signatures)
+        except OSError as e:
+            logger.warning(f"Retrieval index rebuild failed: {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> "ChunkIndex":
+        """Block until a background check or rebuild in progress finishes."""
+        builder = self._builder
+        if builder is not None:
+            builder.join(timeout)
+        return self
+
+    # -- querying --------------------------------------------------------
+
+    def search(self, query: str, top_k: int = 4) -> List[Passage]:
+        """Top-k chunks by BM25 score."""
+        if self._state is None:
+            return []
+        meta, text, ints = self._state
+        total = meta.get("chunks", 0)
+        if not total:
+            return []
+
+        avg_length = meta["avg_length"] or 1.0
+        sections = meta["sections"]
+        lengths, base = sections["lengths"], sections["postings"]
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            entry = meta["vocab"].get(term)
+            if not entry:
+                continue
+            start, df = entry
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for i in range(base + 2 * start, base + 2 * (start + df), 2):
+                chunk_id, tf = ints[i], ints[i + 1]
+                norm = K1 * (1 - B + B * ints[lengths + chunk_id] / avg_length)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (K1 + 1) / (
+                    tf + norm
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        passages = []
+        for chunk_id, score in ranked[:top_k]:
+            begin, end = ints[chunk_id], ints[chunk_id + 1]
+            passages.append(
+                Passage(
+                    source=meta["sources"][ints[sections["docs"] + chunk_id]],
+                    heading=meta["headings"][chunk_id],
+                    text=text[begin:end].decode("utf-8", errors="replace"),
+                    score=round(score, 4),
+                )
+            )
+        return passages
+
+    def retrieve(
+        self, query: str, top_k: int = 4, token_budget: int = 800
+    ) -> List[Passage]:
+        """Best passages for query that fit within token_budget, best first."""
+        selected: List[Passage] = []
+        used = 0
+        for passage in self.search(query, top_k):
+            if used + passage.tokens > token_budget:
+                continue
+            selected.append(passage)
+            used += passage.tokens
+        return selected
+
+
+def format_passages(passages: List[Passage]) -> str:
+    """Passages as a prompt section, or "" when there are none."""
+    if not passages:
+        return ""
+    blocks = [f"[{p.source} - {p.heading}]\n{p.text}" for p in passages]
+    return "\nREFERENCE MATERIAL (from our templates):\n" + "\n\n".join(blocks) + "\n"
+
+
+_index: Optional[ChunkIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_chunk_index() -> ChunkIndex:
+    """Shared chunk index over docs/, refreshed in the background."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ChunkIndex()
+    return _index.ensure_fresh()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Template retrieval index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="Build and publish the chunk index")
+    build_cmd.add_argument("--index-dir", default=INDEX_DIR)
+    build_cmd.add_argument(
+        "--if-stale", action="store_true", help="Skip if sources are unchanged"
+    )
+    args = parser.parse_args(argv)
+
+    index = ChunkIndex(get_registry(refresh=False), args.index_dir)
+    index._open()
+    signatures = index._signatures()
+    if args.if_stale and index.meta.get("signatures") == signatures:
+        print(f"Index {index.version} is up to date")
+        return
+    version = index.build(signatures)
+    print(f"Built {index.meta['chunks']} chunk(s) as {Path(args.index_dir) / version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,26 @@ Telemetry System - Live state tracking
 The data layer for all agent activity.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .activity_log import ActivityLog, DateLike
+from .atomic import read_json, write_state
+from .config import TeamConfig
+from .metrics import MetricsSampler, MetricsStore, program_values
+from .store import STATE_DIR as PARTNER_STATE_DIR, PartnerStore, store_for
+
+# Partner statuses (or lifecycle stages) that no longer count as active
+INACTIVE_STATUSES = {"churned", "inactive", "terminated"}
+
+# Deal statuses counted as closed revenue; lost deals count nowhere and
+# every other status is open pipeline
+CLOSED_DEAL_STATUSES = {"won", "closed", "closed_won"}
+LOST_DEAL_STATUSES = {"lost", "closed_lost"}
+
 
 @dataclass
 class PartnerState:
@@ -47,40 +61,111 @@ class Telemetry:
     """
     The telemetry system.
     Persists partner state, program metrics, activity logs.
+
+    Program metrics are derived from the shared partner store (partner
+    records and their deals), not from the per-driver state kept here.
     """
 
-    def __init__(self, state_dir: str = "scripts/partner_agents/state"):
+    def __init__(
+        self,
+        state_dir: str = "scripts/partner_agents/state",
+        log_retention_days: Optional[int] = 90,
+        activity_tail_size: int = 1000,
+        metrics_refresh_minutes: float = 15,
+        partner_store: Optional[PartnerStore] = None,
+    ):
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
 
         self.partners: Dict[str, PartnerState] = {}
+        # owner -> partner IDs (dict used as an insertion-ordered set)
+        self._owner_index: Dict[str, Dict[str, None]] = {}
+        # partner ID -> owner it is indexed under; compared on every save since
+        # the cached PartnerState may be the very object that was edited
+        self._indexed_owner: Dict[str, str] = {}
+        self._loaded_all = False
         self.metrics = ProgramMetrics()
-        self.activity_log: List[Dict] = []
+        self.metrics_store = MetricsStore(self.state_dir / "metrics.json")
+        self.metrics_refresh_minutes = metrics_refresh_minutes
+        self.partner_store = partner_store or store_for(PARTNER_STATE_DIR)
+        self.activity_log = ActivityLog(
+            self.state_dir / "activity",
+            retention_days=log_retention_days,
+            tail_size=activity_tail_size,
+        )
+
+    @classmethod
+    def from_config(cls, config) -> "Telemetry":
+        """Build telemetry from TeamConfig's telemetry settings"""
+        settings = config.telemetry
+        return cls(
+            state_dir=settings.get("state_dir", "scripts/partner_agents/state"),
+            log_retention_days=settings.get("log_retention_days", 90),
+            activity_tail_size=settings.get("activity_tail_size", 1000),
+            metrics_refresh_minutes=settings.get("metrics_refresh_minutes", 15),
+        )
+
+    def _index(self, state: PartnerState):
+        """Cache a partner and keep the owner index in step"""
+        previous = self._indexed_owner.get(state.partner_id)
+        if previous is not None and previous != state.owner:
+            self._owner_index.get(previous, {}).pop(state.partner_id, None)
+        self.partners[state.partner_id] = state
+        self._indexed_owner[state.partner_id] = state.owner
+        self._owner_index.setdefault(state.owner, {})[state.partner_id] = None
+
+    def _partner_paths(self) -> List[Path]:
+        """Partner state files, leaving out the metrics store and other state"""
+        reserved = {self.metrics_store.path.name}
+        return [
+            p for p in sorted(self.state_dir.glob("*.json")) if p.name not in reserved
+        ]
+
+    @staticmethod
+    def _read_state(file_path: Path) -> Optional[PartnerState]:
+        try:
+            return PartnerState(**read_json(file_path))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def load_all(self, max_workers: int = 8) -> int:
+        """
+        Load every partner state file in one pass.
+
+        Files are read in parallel; partners already in memory are kept as-is
+        since they may hold unsaved changes. Returns the number of partners.
+        """
+        paths = [p for p in self._partner_paths() if p.stem not in self.partners]
+        if paths:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for state in pool.map(self._read_state, paths):
+                    if state is not None and state.partner_id not in self.partners:
+                        self._index(state)
+        self._loaded_all = True
+        return len(self.partners)
 
     def save_partner(self, state: PartnerState):
         """Persist partner state"""
-        self.partners[state.partner_id] = state
+        self._index(state)
 
-        file_path = self.state_dir / f"{state.partner_id}.json"
-        with open(file_path, "w") as f:
-            json.dump(
-                {
-                    "partner_id": state.partner_id,
-                    "company_name": state.company_name,
-                    "tier": state.tier,
-                    "health_score": state.health_score,
-                    "owner": state.owner,
-                    "last_contact": state.last_contact,
-                    "next_action": state.next_action,
-                    "renewal_date": state.renewal_date,
-                    "blockers": state.blockers,
-                    "champion": state.champion,
-                    "metadata": state.metadata,
-                    "updated_at": state.updated_at,
-                },
-                f,
-                indent=2,
-            )
+        write_state(
+            self.state_dir / f"{state.partner_id}.json",
+            {
+                "partner_id": state.partner_id,
+                "company_name": state.company_name,
+                "tier": state.tier,
+                "health_score": state.health_score,
+                "owner": state.owner,
+                "last_contact": state.last_contact,
+                "next_action": state.next_action,
+                "renewal_date": state.renewal_date,
+                "blockers": state.blockers,
+                "champion": state.champion,
+                "metadata": state.metadata,
+                "updated_at": state.updated_at,
+            },
+            indent=2,
+        )
 
     def load_partner(self, partner_id: str) -> Optional[PartnerState]:
         """Load partner from disk"""
@@ -89,16 +174,16 @@ class Telemetry:
 
         file_path = self.state_dir / f"{partner_id}.json"
         if file_path.exists():
-            with open(file_path) as f:
-                data = json.load(f)
-                state = PartnerState(**data)
-                self.partners[partner_id] = state
-                return state
+            state = PartnerState(**read_json(file_path))
+            self._index(state)
+            return state
         return None
 
     def get_partners_by_driver(self, driver_id: str) -> List[PartnerState]:
         """Get all partners owned by a specific driver"""
-        return [p for p in self.partners.values() if p.owner == driver_id]
+        if not self._loaded_all:
+            self.load_all()
+        return [self.partners[pid] for pid in self._owner_index.get(driver_id, {})]
 
     def log_activity(self, driver_id: str, action: str, details: Dict):
         """Log an activity"""
@@ -110,6 +195,82 @@ class Telemetry:
         }
         self.activity_log.append(entry)
 
+    def get_activity(
+        self,
+        start: DateLike = None,
+        end: DateLike = None,
+        driver_id: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Stream logged activity for a date range from disk"""
+        return self.activity_log.iter_range(start, end, driver_id=driver_id)
+
+    def compute_metrics(self, now: Optional[datetime] = None) -> ProgramMetrics:
+        """
+        Derive program metrics from the partner store.
+
+        Pipeline is the value of open deals and closed revenue the value of
+        won deals; partners count as active unless their status or stage is
+        inactive, and as new by their created date.
+        """
+        now = now or datetime.now()
+        metrics = ProgramMetrics()
+        for record in self.partner_store.all():
+            metrics.total_partners += 1
+            statuses = {
+                str(record.get(key) or "").lower() for key in ("status", "stage")
+            }
+            if not statuses & INACTIVE_STATUSES:
+                metrics.active_partners += 1
+            tier = record.get("tier") or "Unassigned"
+            metrics.partners_by_tier[tier] = metrics.partners_by_tier.get(tier, 0) + 1
+            for deal in record.get("deals", []):
+                try:
+                    value = float(deal.get("value") or 0)
+                except (TypeError, ValueError):
+                    continue
+                status = str(deal.get("status") or "").lower()
+                if status in CLOSED_DEAL_STATUSES:
+                    metrics.closed_revenue += value
+                elif status not in LOST_DEAL_STATUSES:
+                    metrics.total_pipeline += value
+            created = record.get("created")
+            if created:
+                try:
+                    created_at = datetime.fromisoformat(str(created))
+                except ValueError:
+                    continue
+                if created_at.year == now.year:
+                    metrics.ytd_new_partners += 1
+                    if created_at.month == now.month:
+                        metrics.mtd_new_partners += 1
+        return metrics
+
+    def refresh_metrics(self, now: Optional[datetime] = None) -> ProgramMetrics:
+        """Recompute program metrics and record a time-series sample"""
+        now = now or datetime.now()
+        self.metrics = self.compute_metrics(now)
+        self.metrics_store.record(program_values(self.metrics), ts=now)
+        self.metrics_store.save()
+        return self.metrics
+
+    def refresh_metrics_if_stale(self) -> ProgramMetrics:
+        """Sample only if metrics_refresh_minutes have passed since the last one"""
+        last = self.metrics_store.last_sample_at
+        interval = self.metrics_refresh_minutes * 60
+        if last is None or datetime.now().timestamp() - last >= interval:
+            return self.refresh_metrics()
+        return self.metrics
+
+    def start_metrics_sampler(self) -> MetricsSampler:
+        """Sample metrics in the background every metrics_refresh_minutes"""
+        sampler = MetricsSampler(self, self.metrics_refresh_minutes)
+        sampler.start()
+        return sampler
+
+    def get_metrics_history(self, *args, **kwargs) -> Dict:
+        """Time-series query over recorded metrics (see MetricsStore.query)"""
+        return self.metrics_store.query(*args, **kwargs)
+
     def get_driver_telemetry(self, driver_id: str) -> Dict:
         """Get full telemetry for a driver"""
         partners = self.get_partners_by_driver(driver_id)
@@ -131,4 +292,4 @@ class Telemetry:
         }
 
 
-telemetry = Telemetry()
+telemetry = Telemetry.from_config(TeamConfig())
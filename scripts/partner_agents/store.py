@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Partner Store - One persistence layer for every partner record
+Like parc fermé: one garage, one set of scrutineering rules, every car inside it.
+
+The web/CLI stack (partner_agents.partner_state) and the playbook agent
+(partner_agent.PartnerState, generate_report.py) share this store. Each
+partner is one record with a single schema, kept as <slug>/metadata.json
+under the state directory, next to index.json, which holds one summary per
+partner for listings and name lookups.
+
+A process-wide PartnerStore per state directory caches parsed records
+keyed on file mtime and size, so each record is read from disk once and
+re-read only after another process changes it.
+
+Layout:
+    scripts/partner_agent/state/index.json
+    scripts/partner_agent/state/<slug>/metadata.json
+
+Migrating the legacy single-file partners.json:
+    python -m partner_agents.store migrate [--from FILE] [--state-dir DIR]
+    python -m partner_agents.store rebuild-index [--state-dir DIR]
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .atomic import read_json, read_verified, write_state
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+STATE_DIR = Path(
+    os.environ.get("PARTNERAGENTS_STATE_DIR")
+    or REPO_ROOT / "scripts" / "partner_agent" / "state"
+)
+LEGACY_PARTNERS_FILE = Path(__file__).resolve().parent / "partners.json"
+
+SCHEMA_VERSION = 1
+INDEX_FILE = "index.json"
+METADATA_FILE = "metadata.json"
+
+# Collection fields every record carries; scalar fields (tier, stage,
+# status, vertical, health_score, rm, contact, email, id) are optional
+LIST_FIELDS = ("milestones", "notes", "deals", "campaigns", "documents")
+DICT_FIELDS = ("playbooks",)
+
+# Field names used by the single-file format before the schema was unified
+LEGACY_FIELDS = {"created_at": "created", "updated_at": "updated"}
+
+
+def slugify(text: str) -> str:
+    """URL- and path-safe partner identifier."""
+    text = re.sub(r"[^\w\s-]", "", str(text).strip())
+    return re.sub(r"[-\s]+", "-", text).lower().strip("-")
+
+
+def normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring a record from either format to the shared schema (in place)."""
+    for old, new in LEGACY_FIELDS.items():
+        if old in record:
+            value = record.pop(old)
+            if not record.get(new):
+                record[new] = value
+    record["name"] = record.get("name") or record.get("slug") or ""
+    record["slug"] = record.get("slug") or slugify(record["name"])
+    for name in LIST_FIELDS:
+        if not isinstance(record.get(name), list):
+            record[name] = []
+    for name in DICT_FIELDS:
+        if not isinstance(record.get(name), dict):
+            record[name] = {}
+    if not record.get("created"):
+        record["created"] = datetime.now().isoformat()
+    record["schema"] = SCHEMA_VERSION
+    return record
+
+
+def _dump(record: Dict[str, Any]) -> str:
+    return json.dumps(record, indent=2)
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def index_entry(state: dict) -> dict:
+    """Summary of a partner's record kept in the index."""
+    return {
+        "name": state.get("name"),
+        "slug": state.get("slug"),
+        "tier": state.get("tier"),
+        "stage": state.get("stage"),
+        "health_score": state.get("health_score"),
+        "created": state.get("created"),
+        "updated": state.get("updated") or datetime.now().isoformat(),
+        "playbooks": {
+            name: {
+                "completed": bool(data.get("completed")),
+                "current_step": data.get("current_step", 0),
+            }
+            for name, data in state.get("playbooks", {}).items()
+        },
+    }
+
+
+class PartnerIndex:
+    """
+    index.json: slug -> summary for every partner directory.
+
+    Written atomically on each save. Reads list the state directory once
+    (no file opens) and rebuild the index if a partner directory was added
+    or removed behind its back.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, state_dir: Union[str, Path] = STATE_DIR):
+        self.state_dir = Path(state_dir)
+        self.path = self.state_dir / INDEX_FILE
+        self._cached: Optional[Tuple[Tuple[int, int], Dict[str, dict]]] = None
+
+    def _stale(self, entries: Dict[str, dict]) -> bool:
+        names = {e.name for e in os.scandir(self.state_dir) if e.is_dir()}
+        if set(entries) - names:
+            return True
+        return any(
+            (self.state_dir / name / METADATA_FILE).exists()
+            for name in names - set(entries)
+        )
+
+    def _read(self) -> Optional[Dict[str, dict]]:
+        key = _stat_key(self.path)
+        if key is None:
+            return None
+        if self._cached and self._cached[0] == key:
+            return self._cached[1]
+        try:
+            data = read_json(self.path)
+        except OSError:
+            return None
+        except ValueError as e:
+            logger.warning("Rebuilding unreadable partner index %s: %s", self.path, e)
+            return None
+        entries = data.get("partners") if isinstance(data, dict) else None
+        if entries is not None:
+            self._cached = (key, entries)
+        return entries
+
+    def _write(self, entries: Dict[str, dict]):
+        write_state(
+            self.path, {"version": SCHEMA_VERSION, "partners": entries}, indent=1
+        )
+        self._cached = (_stat_key(self.path), entries)
+
+    def signature(self) -> Optional[Tuple[int, int]]:
+        """Changes whenever the index is rewritten."""
+        return _stat_key(self.path)
+
+    def entries(self) -> Dict[str, dict]:
+        """All summaries keyed by slug, rebuilding a missing or stale index."""
+        if not self.state_dir.exists():
+            return {}
+        with self._lock:
+            entries = self._read()
+            if entries is None or self._stale(entries):
+                entries = self.rebuild()
+            return entries
+
+    def update(self, *states: dict):
+        """Record the summaries of one or more partners in a single write."""
+        with self._lock:
+            entries = dict(self._read() or {})
+            for state in states:
+                entries[state["slug"]] = index_entry(state)
+            self._write(entries)
+
+    def remove(self, slug: str):
+        with self._lock:
+            entries = dict(self._read() or {})
+            if entries.pop(slug, None) is not None:
+                self._write(entries)
+
+    def rebuild(self) -> Dict[str, dict]:
+        """Re-read every partner's metadata.json and rewrite the index."""
+        entries = {}
+        if self.state_dir.exists():
+            for meta_file in sorted(self.state_dir.glob(f"*/{METADATA_FILE}")):
+                try:
+                    state = read_json(meta_file)
+                except (OSError, ValueError):
+                    continue
+                # The directory name is the slug; older files may lack one
+                slug = meta_file.parent.name
+                state["slug"] = slug
+                state["name"] = state.get("name") or slug
+                entries[slug] = index_entry(state)
+        with self._lock:
+            self._write(entries)
+        return entries
+
+    def list(self) -> List[dict]:
+        """Summaries, most recently updated first."""
+        return sorted(
+            self.entries().values(), key=lambda p: p.get("updated") or "", reverse=True
+        )
+
+    def find(self, slug_or_name: str) -> Optional[dict]:
+        """Summary by slug or case-insensitive display name."""
+        entries = self.entries()
+        if slug_or_name in entries:
+            return entries[slug_or_name]
+        wanted = slug_or_name.lower()
+        for entry in entries.values():
+            if (entry.get("name") or "").lower() == wanted:
+                return entry
+        return None
+
+
+class PartnerStore:
+    """
+    Partner records under one state directory.
+
+    Records returned by get()/all() are shared with the cache: change them
+    and pass them to save(). Records whose content did not change are not
+    rewritten.
+    """
+
+    def __init__(self, state_dir: Union[str, Path] = STATE_DIR):
+        self.state_dir = Path(state_dir)
+        self.index = PartnerIndex(self.state_dir)
+        # slug -> (file stat, text on disk, parsed record)
+        self._records: Dict[str, Tuple[Tuple[int, int], str, Dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+        self.stats = {"reads": 0, "hits": 0, "writes": 0}
+
+    def _path(self, slug: str) -> Path:
+        return self.state_dir / slug / METADATA_FILE
+
+    def get(self, slug: str) -> Optional[Dict[str, Any]]:
+        """The record stored under slug, or None."""
+        if not slug or slug != slugify(slug):
+            return None
+        path = self._path(slug)
+        with self._lock:
+            key = _stat_key(path)
+            cached = self._records.get(slug)
+            if key is None:
+                self._records.pop(slug, None)
+                return None
+            if cached and cached[0] == key:
+                self.stats["hits"] += 1
+                return cached[2]
+            try:
+                text = read_verified(path).decode("utf-8")
+                record = json.loads(text)
+            except OSError:
+                return None
+            except ValueError as e:
+                logger.warning("Skipping unreadable partner record %s: %s", path, e)
+                return None
+            self.stats["reads"] += 1
+            record["slug"] = slug
+            self._records[slug] = (key, text, normalize(record))
+            return record
+
+    def find(self, slug_or_name: str) -> Optional[Dict[str, Any]]:
+        """Record by slug or case-insensitive display name."""
+        record = self.get(slug_or_name) or self.get(slugify(slug_or_name))
+        if record and slug_or_name.lower() in (
+            record["slug"],
+            record["name"].lower(),
+        ):
+            return record
+        entry = self.index.find(slug_or_name)
+        return self.get(entry["slug"]) if entry else None
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Every record, oldest first."""
+        records = [self.get(slug) for slug in self.index.entries()]
+        return sorted(
+            (r for r in records if r is not None),
+            key=lambda r: (r.get("created") or "", r["slug"]),
+        )
+
+    def signature(self) -> Optional[Tuple[int, int]]:
+        """Changes whenever any record is saved or deleted through a store."""
+        return self.index.signature()
+
+    def _unique_slug(self, name: str) -> str:
+        base = slugify(name) or "partner"
+        slug, n = base, 1
+        while True:
+            existing = self.get(slug)
+            if existing is None or existing["name"].lower() == name.lower():
+                return slug
+            n += 1
+            slug = f"{base}-{n}"
+
+    def save(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Write one record (if it changed) and update the index."""
+        self.save_many([record])
+        return record
+
+    def save_many(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write records that changed, then update the index once."""
+        written = []
+        with self._lock:
+            for record in records:
+                if not record.get("slug"):
+                    record["slug"] = self._unique_slug(record.get("name") or "")
+                normalize(record)
+                slug = record["slug"]
+                if slug != slugify(slug):
+                    raise ValueError(f"Invalid partner slug: {slug!r}")
+                cached = self._records.get(slug)
+                if cached and cached[1] == _dump(record) and self._path(slug).exists():
+                    continue
+                record["updated"] = datetime.now().isoformat()
+                text = _dump(record)
+                path = self._path(slug)
+                write_state(path, record, indent=2)
+                self.stats["writes"] += 1
+                # Cache a copy: the caller may keep editing its dict unsaved
+                self._records[slug] = (_stat_key(path), text, json.loads(text))
+                written.append(record)
+            if written:
+                self.index.update(*written)
+        return written
+
+    def delete(self, slug: str) -> bool:
+        """Remove a record. Other files in its directory are left alone."""
+        with self._lock:
+            self._records.pop(slug, None)
+            path = self._path(slug)
+            if not path.exists():
+                return False
+            path.unlink()
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+            self.index.remove(slug)
+            return True
+
+    def rebuild_index(self) -> Dict[str, dict]:
+        return self.index.rebuild()
+
+
+_stores: Dict[Path, PartnerStore] = {}
+_stores_lock = threading.Lock()
+
+
+def store_for(state_dir: Union[str, Path] = STATE_DIR) -> PartnerStore:
+    """The process-wide store for a state directory."""
+    root = Path(state_dir).resolve()
+    with _stores_lock:
+        if root not in _stores:
+            _stores[root] = PartnerStore(root)
+        return _stores[root]
+
+
+def migrate(
+    partners_file: Union[str, Path] = LEGACY_PARTNERS_FILE,
+    state_dir: Union[str, Path] = STATE_DIR,
+    dry_run: bool = False,
+) -> Dict[str, List[str]]:
+    """
+    Copy partners from the legacy single-file format into the store.
+
+    Partners already in the store keep their values; fields only the
+    legacy file has (contact, deals, documents, ...) are added. Running
+    it twice is harmless. The legacy file is not modified.
+    """
+    with open(partners_file) as f:
+        legacy = json.load(f)
+
+    store = store_for(state_dir)
+    report: Dict[str, List[str]] = {"created": [], "merged": [], "unchanged": []}
+    to_save = []
+    for old in legacy:
+        incoming = normalize(dict(old, slug=None))
+        existing = store.find(incoming["name"])
+        if existing is None:
+            incoming["slug"] = store._unique_slug(incoming["name"])
+            report["created"].append(incoming["slug"])
+            to_save.append(incoming)
+            continue
+        merged = dict(existing)
+        for key, value in incoming.items():
+            if key not in merged or merged[key] in (None, "", [], {}):
+                merged[key] = value
+        merged["slug"] = existing["slug"]
+        if _dump(merged) == _dump(existing):
+            report["unchanged"].append(existing["slug"])
+        else:
+            report["merged"].append(existing["slug"])
+            to_save.append(merged)
+    if not dry_run:
+        store.save_many(to_save)
+    return report
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Partner store utilities")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate_cmd = sub.add_parser("migrate", help="Import a legacy partners.json")
+    migrate_cmd.add_argument("--from", dest="source", default=LEGACY_PARTNERS_FILE)
+    migrate_cmd.add_argument("--state-dir", default=STATE_DIR)
+    migrate_cmd.add_argument("--dry-run", action="store_true")
+    rebuild_cmd = sub.add_parser("rebuild-index", help="Rebuild index.json")
+    rebuild_cmd.add_argument("--state-dir", default=STATE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        report = migrate(args.source, args.state_dir, dry_run=args.dry_run)
+        for outcome, slugs in report.items():
+            print(f"{outcome}: {len(slugs)}")
+            for slug in slugs:
+                print(f"  {slug}")
+    else:
+        count = len(store_for(args.state_dir).rebuild_index())
+        print(f"Indexed {count} partner(s) in {Path(args.state_dir) / INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Template Search - Offline full-text search over the markdown templates
+Like the team's setup library: ask for "wet-weather rear wing" and get the right sheet.
+
+Every markdown file under docs/ is tokenized into term frequencies and kept
+in an inverted index ranked with BM25 (title terms weighted up). Files, titles
+and descriptions come from the shared template registry
+(scripts/template_registry.py); only templates whose registry mtime or size
+changed are re-tokenized, and the index is persisted as gzipped JSON so a
+fresh process starts warm.
+
+Usage:
+    from partner_agents.template_search import get_search_index
+
+    get_search_index().search("partner tier benefits", limit=5)
+"""
+
+import gzip
+import json
+import math
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .atomic import atomic_write
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from template_registry import (
+    TemplateRecord,
+    TemplateRegistry,
+    get_registry,
+    split_frontmatter,
+)
+
+DOCS_DIR = REPO_ROOT / "docs"
+INDEX_PATH = REPO_ROOT / ".cache" / "template-search.json.gz"
+INDEX_VERSION = 1
+
+# BM25 parameters and the weight given to title terms
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 3
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or our "
+    "that the this to was we what when which who will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens, minus stopwords and single characters."""
+    return [
+        t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS
+    ]
+
+
+@dataclass
+class IndexedDoc:
+    """One indexed template: display fields, file signature and term counts."""
+
+    path: str
+    title: str
+    category: str
+    description: str
+    mtime_ns: int
+    size: int
+    terms: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def length(self) -> int:
+        return sum(self.terms.values())
+
+    def to_row(self) -> list:
+        return [
+            self.title,
+            self.category,
+            self.description,
+            self.mtime_ns,
+            self.size,
+            self.terms,
+        ]
+
+    @classmethod
+    def from_row(cls, path: str, row: list) -> "IndexedDoc":
+        title, category, description, mtime_ns, size, terms = row
+        return cls(path, title, category, description, mtime_ns, size, terms)
+
+
+class TemplateSearchIndex:
+    """
+    BM25 inverted index over markdown templates.
+
+    Args:
+        registry: Template registry listing the files (default: the shared one)
+        index_path: Gzipped JSON index file, or None to keep it in memory
+        refresh_interval: Seconds between on-disk change checks during search
+        root: Registry root to index
+    """
+
+    def __init__(
+        self,
+        registry: Optional[TemplateRegistry] = None,
+        index_path: Union[str, Path, None] = INDEX_PATH,
+        refresh_interval: float = 5.0,
+        root: str = "docs",
+    ):
+        self.registry = registry or get_registry(refresh=False)
+        self.root = root
+        self.index_path = Path(index_path) if index_path else None
+        self.refresh_interval = refresh_interval
+        self.docs: Dict[str, IndexedDoc] = {}
+        self.reindexed = 0  # files tokenized by the last refresh
+        self._snapshot: Tuple[list, list, dict, float] = ([], [], {}, 0.0)
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+        self._build_postings()
+
+    def _load(self):
+        if not self.index_path or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(gzip.decompress(self.index_path.read_bytes()))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        for path, row in data.get("docs", {}).items():
+            try:
+                self.docs[path] = IndexedDoc.from_row(path, row)
+            except ValueError:
+                continue
+
+    def _save(self):
+        if not self.index_path:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "docs": {path: doc.to_row() for path, doc in self.docs.items()},
+        }
+        data = gzip.compress(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8"), mtime=0
+        )
+        atomic_write(self.index_path, data, fsync=False)
+
+    def _index_record(self, record: TemplateRecord) -> IndexedDoc:
+        full = self.registry.roots[self.root] / record.path
+        content = full.read_text(encoding="utf-8", errors="replace")
+        _, body = split_frontmatter(content)
+        terms = Counter(tokenize(body))
+        for token in tokenize(record.title):
+            terms[token] += TITLE_WEIGHT
+        return IndexedDoc(
+            path=record.path,
+            title=record.title,
+            category=record.category,
+            description=str(record.frontmatter.get("description") or "")[:200],
+            mtime_ns=record.mtime_ns,
+            size=record.size,
+            terms=dict(terms),
+        )
+
+    def _build_postings(self):
+        paths = sorted(self.docs)
+        lengths: List[int] = []
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for doc_id, path in enumerate(paths):
+            doc = self.docs[path]
+            lengths.append(doc.length)
+            for term, tf in doc.terms.items():
+                postings.setdefault(term, []).append((doc_id, tf))
+        avg_length = sum(lengths) / len(lengths) if lengths else 0.0
+        # Swapped in one assignment so concurrent searches see a consistent view
+        self._snapshot = (paths, lengths, postings, avg_length)
+
+    def refresh(self, force: bool = False) -> "TemplateSearchIndex":
+        """Re-tokenize new or changed templates and drop deleted ones."""
+        with self._lock:
+            records = self.registry.refresh().query(root=self.root, include_index=True)
+            seen = set()
+            changed = 0
+            for record in records:
+                seen.add(record.path)
+                doc = self.docs.get(record.path)
+                if (
+                    not force
+                    and doc is not None
+                    and doc.mtime_ns == record.mtime_ns
+                    and doc.size == record.size
+                ):
+                    continue
+                try:
+                    self.docs[record.path] = self._index_record(record)
+                except OSError:
+                    continue  # deleted since the registry scanned it
+                changed += 1
+            removed = [path for path in self.docs if path not in seen]
+            for path in removed:
+                del self.docs[path]
+            self.reindexed = changed
+            if changed or removed or len(self._snapshot[0]) != len(self.docs):
+                self._build_postings()
+                self._save()
+            self._checked_at = time.monotonic()
+        return self
+
+    def search(
+        self, query: str, limit: int = 10, category: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Templates ranked by BM25 relevance to query.
+
+        Returns dicts with path, title, category, description and score.
+        """
+        if time.monotonic() - self._checked_at > self.refresh_interval:
+            self.refresh()
+
+        paths, lengths, postings_by_term, avg_length = self._snapshot
+        terms = set(tokenize(query))
+        total = len(paths)
+        if not terms or not total:
+            return []
+
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = postings_by_term.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings:
+                norm = K1 * (1 - B + B * lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (
+                    tf + norm
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        results = []
+        for doc_id, score in ranked:
+            doc = self.docs.get(paths[doc_id])
+            if doc is None:
+                continue
+            if category is not None and doc.category != category:
+                continue
+            results.append(
+                {
+                    "path": doc.path,
+                    "title": doc.title,
+                    "category": doc.category,
+                    "description": doc.description,
+                    "score": round(score, 4),
+                }
+            )
+            if len(results) >= limit:
+                break
+        return results
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+
+_index: Optional[TemplateSearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> TemplateSearchIndex:
+    """Shared index over docs/, refreshed on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TemplateSearchIndex().refresh()
+    return _index
+
+
+def search_templates(
+    query: str, limit: int = 10, category: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Search the shared template index."""
+    return get_search_index().search(query, limit, category)
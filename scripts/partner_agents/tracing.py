@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Timing System - Handoff tracing and latency histograms
+Like F1 sector timing: every handoff is clocked, every lap is binned.
+
+A trace is started per inbound chat. Spans opened inside it (orchestrator
+handoffs, skill calls, LLM calls) inherit the trace ID through a context
+variable, so nothing has to be threaded through call signatures by hand.
+Skill spans also feed per-skill and per-driver latency histograms.
+
+Usage:
+    from partner_agents.tracing import tracer
+
+    with tracer.span("chat", new_trace=True):
+        with tracer.span("skill:architect_onboard", driver="architect",
+                         skill="architect_onboard"):
+            ...
+
+    tracer.export()  # JSON-serializable snapshot
+"""
+
+import contextvars
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+
+def new_id(length: int = 16) -> str:
+    """Return a random hex identifier."""
+    return uuid.uuid4().hex[:length]
+
+
+@dataclass
+class Span:
+    """A single timed unit of work inside a trace"""
+
+    trace_id: str
+    span_id: str
+    name: str
+    parent_span_id: Optional[str] = None
+    driver: Optional[str] = None
+    skill: Optional[str] = None
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "driver": self.driver,
+            "skill": self.skill,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "partner_agents_current_span", default=None
+)
+
+
+def current_span() -> Optional[Span]:
+    """Return the span active in this context, if any."""
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """Return the trace ID active in this context, if any."""
+    span = _current_span.get()
+    return span.trace_id if span else None
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Buckets grow geometrically from 0.1 ms to ~2 minutes, so recording is
+    O(log buckets) and memory is constant regardless of call volume.
+    Percentiles are reported as the upper bound of the bucket holding the
+    requested rank, clamped to the observed maximum.
+    """
+
+    BUCKETS_MS = tuple(round(0.1 * (1.5**i), 3) for i in range(35))
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def record(self, duration_ms: float, error: bool = False):
+        """Add one observation"""
+        self.counts[bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if error:
+            self.errors += 1
+        if self.min_ms is None or duration_ms < self.min_ms:
+            self.min_ms = duration_ms
+        if self.max_ms is None or duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Estimate the latency at the given percentile (0-100)"""
+        if not self.count:
+            return None
+
+        rank = max(1, int(round(pct / 100.0 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index < len(self.BUCKETS_MS):
+                    return min(self.BUCKETS_MS[index], self.max_ms)
+                return self.max_ms
+        return self.max_ms
+
+    def mean_above(self, threshold_ms: float) -> Optional[float]:
+        """Estimate the mean of observations slower than threshold_ms"""
+        if not self.count:
+            return None
+        total = weight = 0
+        for index, bucket_count in enumerate(self.counts):
+            if index < len(self.BUCKETS_MS):
+                upper = min(self.BUCKETS_MS[index], self.max_ms)
+            else:
+                upper = self.max_ms
+            if not bucket_count or upper <= threshold_ms:
+                continue
+            lower = self.BUCKETS_MS[index - 1] if index else 0.0
+            total += bucket_count * (max(lower, threshold_ms) + upper) / 2
+            weight += bucket_count
+        return total / weight if weight else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
+
+
+class Tracer:
+    """
+    Collects spans and latency histograms.
+    One process-wide instance is shared by the orchestrator and all drivers.
+    """
+
+    def __init__(self, max_spans: int = 500):
+        self.max_spans = max_spans
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self.skills: Dict[str, LatencyHistogram] = {}
+        self.drivers: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        driver: Optional[str] = None,
+        skill: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        parent_span_id: Optional[str] = None,
+        new_trace: bool = False,
+        **attributes: Any,
+    ) -> Iterator[Span]:
+        """
+        Time a block of work.
+
+        The span joins the active trace unless new_trace is set or an explicit
+        trace_id/parent_span_id is supplied (e.g. from a HandoffRequest).
+        Spans with a skill also feed the skill and driver histograms.
+        """
+        parent = None if new_trace else _current_span.get()
+        if trace_id is None:
+            trace_id = parent.trace_id if parent else new_id(32)
+        if parent_span_id is None and parent and parent.trace_id == trace_id:
+            parent_span_id = parent.span_id
+
+        span = Span(
+            trace_id=trace_id,
+            span_id=new_id(),
+            name=name,
+            parent_span_id=parent_span_id,
+            driver=driver,
+            skill=skill,
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+            if span.skill:
+                failed = span.error is not None
+                self.skills.setdefault(span.skill, LatencyHistogram()).record(
+                    span.duration_ms, failed
+                )
+                if span.driver:
+                    self.drivers.setdefault(span.driver, LatencyHistogram()).record(
+                        span.duration_ms, failed
+                    )
+
+    def get_trace(self, trace_id: str) -> List[Dict[str, Any]]:
+        """All recorded spans belonging to one trace, oldest first"""
+        with self._lock:
+            return [s.to_dict() for s in self.spans if s.trace_id == trace_id]
+
+    def get_recent(self, count: int = 20) -> List[Dict[str, Any]]:
+        """Most recently finished spans"""
+        with self._lock:
+            spans = list(self.spans)[-count:]
+        return [s.to_dict() for s in spans]
+
+    def export(self, recent: int = 20) -> Dict[str, Any]:
+        """JSON-serializable snapshot of all histograms and recent spans"""
+        with self._lock:
+            skills = {name: h.to_dict() for name, h in sorted(self.skills.items())}
+            drivers = {name: h.to_dict() for name, h in sorted(self.drivers.items())}
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "skills": skills,
+            "drivers": drivers,
+            "recent_spans": self.get_recent(recent),
+        }
+
+    def reset(self):
+        """Drop all spans and histograms"""
+        with self._lock:
+            self.spans.clear()
+            self.skills.clear()
+            self.drivers.clear()
+
+
+tracer = Tracer()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Usage - Token, latency and cost accounting for LLM calls
+Like the fuel-flow meter: every lap's consumption, by car, by stint, by race day.
+
+The LLM gateway records one observation per call (prompt and completion
+tokens, latency, estimated cost). Observations are folded into running
+totals per conversation, model, agent and day, so the store stays a few
+kilobytes however many calls are made. Recording only updates memory and
+marks the store dirty; a background thread persists the totals as JSON
+every few seconds and once more at exit, so no call waits on the disk.
+Totals can be exported as CSV.
+
+Layout:
+    partners/.usage/usage.json
+"""
+
+import atexit
+import csv
+import io
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .atomic import read_json, write_state
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+USAGE_PATH = REPO_ROOT / "partners" / ".usage" / "usage.json"
+
+DIMENSIONS = ("conversation", "model", "agent", "day")
+
+# USD per million tokens (prompt, completion); unknown models cost 0
+PRICES = {
+    "openrouter/qwen/qwen3.5-plus-02-15": (0.40, 1.20),
+    "openrouter/anthropic/claude-sonnet-4": (3.00, 15.00),
+    "openrouter/openai/gpt-4o": (2.50, 10.00),
+    "openrouter/openai/gpt-4o-mini": (0.15, 0.60),
+    "openai/gpt-4o": (2.50, 10.00),
+    "openai/gpt-4o-mini": (0.15, 0.60),
+    "anthropic/sonnet-4-20250514": (3.00, 15.00),
+    "anthropic/haiku-3-20250514": (0.25, 1.25),
+}
+
+
+@dataclass
+class UsageTotals:
+    """Running totals for one conversation, model, agent or day."""
+
+    calls: int = 0
+    cached_calls: int = 0
+    errors: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+    last_seen: float = 0.0
+
+    def add(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_ms: float,
+        cost_usd: float,
+        cached: bool,
+        error: bool,
+        now: float,
+    ):
+        self.calls += 1
+        self.cached_calls += int(cached)
+        self.errors += int(error)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.latency_ms += latency_ms
+        self.cost_usd += cost_usd
+        self.last_seen = now
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def to_row(self, key: str) -> Dict[str, Any]:
+        live = self.calls - self.cached_calls
+        return {
+            "key": key,
+            "calls": self.calls,
+            "cached_calls": self.cached_calls,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "avg_latency_ms": round(self.latency_ms / live, 1) if live else 0.0,
+            "cost_usd": round(self.cost_usd, 6),
+            "last_seen": (
+                datetime.fromtimestamp(self.last_seen).isoformat(timespec="seconds")
+                if self.last_seen
+                else ""
+            ),
+        }
+
+
+def estimate_cost(model_key: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Cost in USD for a provider/model key, 0 if the price is unknown."""
+    prompt_price, completion_price = PRICES.get(model_key, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1e6
+
+
+class UsageStore:
+    """
+    Aggregated LLM usage per conversation, model, agent and day.
+
+    Args:
+        path: JSON file the totals are persisted to (None keeps them in memory)
+        max_conversations: Conversations kept, least recently active dropped first
+        retention_days: Daily totals kept
+        flush_interval: Seconds between background writes of changed totals
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = USAGE_PATH,
+        max_conversations: int = 500,
+        retention_days: int = 400,
+        flush_interval: float = 5.0,
+    ):
+        self.path = Path(path) if path else None
+        self.max_conversations = max_conversations
+        self.retention_days = retention_days
+        self.flush_interval = flush_interval
+        self.totals: Dict[str, Dict[str, UsageTotals]] = {d: {} for d in DIMENSIONS}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._load()
+        if self.path:
+            atexit.register(self.close)
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = read_json(self.path)
+        except (OSError, ValueError):
+            return
+        for dimension in DIMENSIONS:
+            for key, values in data.get(dimension, {}).items():
+                try:
+                    self.totals[dimension][key] = UsageTotals(**values)
+                except TypeError:
+                    continue
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            payload = {
+                dimension: {key: asdict(t) for key, t in rows.items()}
+                for dimension, rows in self.totals.items()
+            }
+            self._dirty = False
+        write_state(self.path, payload, separators=(",", ":"))
+
+    def flush(self):
+        """Persist the totals if anything was recorded since the last write."""
+        if self._dirty:
+            self.save()
+
+    def _start_flusher(self):
+        if self._flusher is None and self.path and not self._stop.is_set():
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="usage-flush", daemon=True
+            )
+            self._flusher.start()
+
+    def _run_flusher(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                pass  # retried on the next tick
+
+    def close(self):
+        """Stop the background writer and persist any pending totals."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+            self._flusher = None
+        self.flush()
+
+    def _prune(self, today: date):
+        conversations = self.totals["conversation"]
+        if len(conversations) > self.max_conversations:
+            ordered = sorted(conversations, key=lambda k: conversations[k].last_seen)
+            for key in ordered[: len(conversations) - self.max_conversations]:
+                del conversations[key]
+        cutoff = (today - timedelta(days=self.retention_days)).isoformat()
+        for day in [d for d in self.totals["day"] if d < cutoff]:
+            del self.totals["day"][day]
+
+    def record(
+        self,
+        model: str,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        latency_ms: float = 0.0,
+        conversation: Optional[str] = None,
+        agent: Optional[str] = None,
+        cached: bool = False,
+        error: bool = False,
+        when: Optional[float] = None,
+    ) -> float:
+        """Fold one LLM call into the totals. Returns its cost."""
+        now = when if when is not None else time.time()
+        today = date.fromtimestamp(now)
+        cost = 0.0 if cached else estimate_cost(model, prompt_tokens, completion_tokens)
+        keys = {
+            "conversation": conversation or "unknown",
+            "model": model,
+            "agent": agent or "unknown",
+            "day": today.isoformat(),
+        }
+        with self._lock:
+            for dimension, key in keys.items():
+                totals = self.totals[dimension].setdefault(key, UsageTotals())
+                totals.add(
+                    prompt_tokens,
+                    completion_tokens,
+                    latency_ms,
+                    cost,
+                    cached,
+                    error,
+                    now,
+                )
+            self._prune(today)
+            self._dirty = True
+        self._start_flusher()
+        return cost
+
+    def rows(
+        self,
+        by: str = "model",
+        start: Union[date, str, None] = None,
+        end: Union[date, str, None] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Totals for one dimension, highest spend (then tokens) first.
+
+        start/end only apply to by="day", which is returned oldest first.
+        """
+        if by not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {by} (use {', '.join(DIMENSIONS)})")
+        with self._lock:
+            rows = [t.to_row(key) for key, t in self.totals[by].items()]
+        if by == "day":
+            start_key = start.isoformat() if isinstance(start, date) else start
+            end_key = end.isoformat() if isinstance(end, date) else end
+            rows = [
+                r
+                for r in rows
+                if (not start_key or r["key"] >= start_key)
+                and (not end_key or r["key"] <= end_key)
+            ]
+            return sorted(rows, key=lambda r: r["key"])
+        return sorted(
+            rows, key=lambda r: (r["cost_usd"], r["total_tokens"]), reverse=True
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """Overall totals across all models."""
+        rows = self.rows("model")
+        return {
+            "calls": sum(r["calls"] for r in rows),
+            "cached_calls": sum(r["cached_calls"] for r in rows),
+            "prompt_tokens": sum(r["prompt_tokens"] for r in rows),
+            "completion_tokens": sum(r["completion_tokens"] for r in rows),
+            "cost_usd": round(sum(r["cost_usd"] for r in rows), 6),
+        }
+
+    def to_csv(self, by: str = "model", **filters) -> str:
+        rows = self.rows(by, **filters)
+        out = io.StringIO()
+        fields = list(rows[0]) if rows else list(UsageTotals().to_row("").keys())
+        writer = csv.DictWriter(
+            out, fieldnames=[by if f == "key" else f for f in fields]
+        )
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({(by if k == "key" else k): v for k, v in row.items()})
+        return out.getvalue()
+
+
+def _from_env() -> UsageStore:
+    path = os.environ.get("PARTNERAGENTS_USAGE_PATH")
+    return UsageStore(path or USAGE_PATH)
+
+
+# Process-wide store the LLM gateway records into
+usage_store = _from_env()
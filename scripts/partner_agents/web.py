@@ -19,6 +19,11 @@ API Endpoints:
 - DELETE /api/partners/{name} - Delete partner
 - GET /api/memory - Get conversation memory
 - DELETE /api/memory - Clear conversation memory
+- GET /api/traces - Handoff traces and latency histograms (JSON)
+- GET /api/metrics - Program metrics time series (minute/hour/day rollups)
+- GET /api/search - Full-text template search
+- GET /api/llm - LLM gateway latency, token and circuit breaker stats
+- GET /api/usage - Token, latency and cost totals by conversation/model/agent/day
 """
 
 import os
@@ -27,21 +32,28 @@ import re
 import time
 import hashlib
 import logging
+from contextlib import asynccontextmanager
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-import httpx
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 import uvicorn
 
 from partner_agents import partner_state, router, document_generator, chat_orchestrator
+from partner_agents import retrieval
 from partner_agents import skills
+from partner_agents.orchestrator import orchestrator
+from partner_agents.tracing import tracer
+from partner_agents.state import telemetry
+from partner_agents.template_search import search_templates
+from partner_agents.llm_gateway import gateway, GatewayUnavailable, ProviderError
+from partner_agents.usage import usage_store
 
 # Rate limiting
 rate_limit_store = {}
@@ -51,8 +63,22 @@ RATE_WINDOW = 60
 # Response caching
 response_cache = {}
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the retrieval index and start the metrics sampler in the background;
+    stop the sampler and close the gateway at shutdown.
+    """
+    retrieval.get_chunk_index()
+    sampler = telemetry.start_metrics_sampler()
+    yield
+    sampler.stop()
+    await gateway.aclose()
+
+
 # CORS middleware to allow browser requests
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -79,6 +105,19 @@ def check_rate_limit(client_ip: str) -> bool:
     return True
 
 
+@app.middleware("http")
+async def trace_chat_requests(request: Request, call_next):
+    """Start a trace per inbound chat so every handoff below it is linked."""
+    if request.url.path != "/chat":
+        return await call_next(request)
+
+    with tracer.span("http:/chat", new_trace=True, method=request.method) as span:
+        response = await call_next(request)
+        span.attributes["status_code"] = response.status_code
+    response.headers["X-Trace-Id"] = span.trace_id
+    return response
+
+
 @app.get("/")
 async def root():
     return HTMLResponse(HTML)
@@ -192,7 +231,28 @@ async def chat(request: Request):
                         }
                     )
 
-            # Handle other action types (onboard, campaign, etc.) - create NDA by default
+            # Onboarding creates the full NDA/MSA/DPA/checklist packet
+            if intent.name == "onboard":
+                packet = document_generator.create_onboarding_packet(
+                    partner_name, intent.entities
+                )
+                partner_state.add_documents(partner_name, packet)
+                created_docs = [doc["doc_type"].upper() for doc in packet]
+                return JSONResponse(
+                    {
+                        "response": f"## Onboarded **{partner_name}**!\n\nCreated:\n"
+                        + "\n".join(f"- {d}" for d in created_docs)
+                        + "\n\nPartner is now ready for enablement!",
+                        "agent": "architect",
+                        "onboarding": {
+                            "partner": partner_name,
+                            "documents": created_docs,
+                            "paths": [doc["relative_path"] for doc in packet],
+                        },
+                    }
+                )
+
+            # Handle other action types (campaign, etc.) - create NDA by default
             doc_type = intent.name
             if intent.type == "action":
                 # Actions get an NDA document created
@@ -433,29 +493,22 @@ Based on current partnership data:
             messages.append({"role": "user", "content": user_msg})
 
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        "https://openrouter.ai/api/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {key}",
-                            "Content-Type": "application/json",
-                        },
-                        json={"model": model, "messages": messages},
-                        timeout=30.0,
-                    )
-                    if response.status_code != 200:
-                        return (
-                            f"API Error ({response.status_code}): {response.text[:100]}"
-                        )
-
-                    result = response.json()
-                    choices = result.get("choices", [])
-                    if not choices:
-                        return "No response from AI."
-
-                    return choices[0].get("message", {}).get("content", "No response")
+                reply = await gateway.complete(
+                    "openrouter",
+                    model,
+                    messages,
+                    api_key=key,
+                    conversation="default",
+                    agent="swarm",
+                )
+            except GatewayUnavailable:
+                # Provider brownout or saturated queue: answer locally, fast
+                return chat_orchestrator.orchestrator._fallback_response(user_msg)
+            except ProviderError as e:
+                return f"API Error ({e.status_code}): {e.body[:100]}"
             except Exception as e:
                 return f"Error: {str(e)}"
+            return reply.content or "No response from AI."
 
         try:
             result = await chat_orchestrator.chat(
@@ -540,6 +593,68 @@ async def clear_memory():
     return JSONResponse({"success": True})
 
 
+@app.get("/api/traces")
+async def get_traces(trace_id: str = ""):
+    if trace_id:
+        return JSONResponse({"trace_id": trace_id, "spans": tracer.get_trace(trace_id)})
+    return JSONResponse(orchestrator.race_summary())
+
+
+@app.get("/api/metrics")
+async def get_metrics(
+    metric: str = "",
+    start: str = "",
+    end: str = "",
+    resolution: str = "auto",
+    max_points: int = 500,
+):
+    # Sampling happens on the background sampler started in lifespan
+    try:
+        history = telemetry.get_metrics_history(
+            metrics=[m for m in metric.split(",") if m] or None,
+            start=start or None,
+            end=end or None,
+            resolution=resolution,
+            max_points=max_points,
+        )
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    return JSONResponse({"latest": telemetry.metrics_store.latest(), **history})
+
+
+@app.get("/api/usage")
+async def get_usage(
+    by: str = "model", start: str = "", end: str = "", format: str = "json"
+):
+    try:
+        rows = usage_store.rows(by, start=start or None, end=end or None)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=400)
+    if format == "csv":
+        return PlainTextResponse(
+            usage_store.to_csv(by, start=start or None, end=end or None),
+            media_type="text/csv",
+        )
+    return JSONResponse({"by": by, "summary": usage_store.summary(), "rows": rows})
+
+
+@app.get("/api/llm")
+async def get_llm_stats():
+    return JSONResponse(gateway.metrics())
+
+
+@app.get("/api/search")
+async def search(q: str = "", limit: int = 10, category: str = ""):
+    if not q.strip():
+        return JSONResponse(
+            {"error": "Query parameter 'q' is required"}, status_code=400
+        )
+    results = search_templates(
+        q, limit=max(1, min(limit, 50)), category=category or None
+    )
+    return JSONResponse({"query": q, "results": results})
+
+
 HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Template registry: one shared index over every template's frontmatter.
+
+Walks docs/ and partneros-docs/src/content/docs once, records each template's
+path, category, title, tier, phase, placeholders and content hash, and caches
+the result in .cache/template-registry.json. Later runs only re-parse files
+whose mtime or size changed, so scripts and agents can query templates
+instead of globbing and re-parsing YAML themselves.
+
+Usage:
+    python scripts/template_registry.py                 # refresh and summarize
+    python scripts/template_registry.py --category legal
+    python scripts/template_registry.py --rebuild       # ignore the cache
+
+    from template_registry import get_registry
+    get_registry().query(root="docs", folder="legal")
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import yaml
+
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ROOTS = {
+    "docs": REPO_ROOT / "docs",
+    "partneros-docs": REPO_ROOT / "partneros-docs" / "src" / "content" / "docs",
+}
+CACHE_PATH = REPO_ROOT / ".cache" / "template-registry.json"
+CACHE_VERSION = 1
+
+# Same placeholder styles as partner_agents.document_generator
+PLACEHOLDER_PATTERNS = (
+    re.compile(r"\[([^\]]+)\]"),
+    re.compile(r"\$\{?(\w+)\}?"),
+    re.compile(r"___([a-z_]+)___"),
+)
+
+
+@dataclass
+class TemplateRecord:
+    """Index entry for one template file."""
+
+    root: str
+    path: str  # relative to the root, e.g. "legal/01-nda.md"
+    category: str
+    folder: str
+    title: str
+    tier: Any = None
+    phase: Optional[str] = None
+    placeholders: List[str] = field(default_factory=list)
+    content_hash: str = ""
+    mtime_ns: int = 0
+    size: int = 0
+    frontmatter: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return Path(self.path).name
+
+    @property
+    def abs_path(self) -> Path:
+        return ROOTS.get(self.root, Path(self.root)) / self.path
+
+
+def split_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """Return (frontmatter, body) for a markdown document."""
+    if not content.startswith("---"):
+        return {}, content
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return {}, content
+
+    frontmatter: Dict[str, Any] = {}
+    if YAML_AVAILABLE:
+        try:
+            loaded = yaml.safe_load(parts[1])
+            if isinstance(loaded, dict):
+                frontmatter = loaded
+        except yaml.YAMLError:
+            frontmatter = {}
+    if not frontmatter:
+        for line in parts[1].split("\n"):
+            if ":" in line and not line.startswith((" ", "\t", "-")):
+                key, value = line.split(":", 1)
+                frontmatter[key.strip()] = value.strip().strip("\"'")
+    return frontmatter, parts[2].strip()
+
+
+def extract_placeholders(body: str) -> List[str]:
+    """Placeholder names in first-seen order."""
+    names: Dict[str, None] = {}
+    for pattern in PLACEHOLDER_PATTERNS:
+        for match in pattern.finditer(body):
+            names.setdefault(match.group(1).strip(), None)
+    return list(names)
+
+
+def _json_safe(value: Any) -> Any:
+    """YAML can yield dates; keep the cache plain JSON."""
+    return json.loads(json.dumps(value, default=str))
+
+
+class TemplateRegistry:
+    """
+    Incrementally refreshed index of templates under one or more roots.
+
+    Args:
+        roots: Mapping of root name -> directory (default: docs + partneros-docs)
+        cache_path: JSON cache file, or None to keep the index in memory
+    """
+
+    def __init__(
+        self,
+        roots: Optional[Dict[str, Path]] = None,
+        cache_path: Optional[Path] = CACHE_PATH,
+    ):
+        self.roots = {name: Path(p) for name, p in (roots or ROOTS).items()}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.records: Dict[Tuple[str, str], TemplateRecord] = {}
+        self.parsed = 0  # files (re)parsed by the last refresh
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load_cache()
+
+    def _load_cache(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        for item in data.get("templates", []):
+            try:
+                record = TemplateRecord(**item)
+            except TypeError:
+                continue
+            if record.root in self.roots:
+                self.records[(record.root, record.path)] = record
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": CACHE_VERSION,
+            "templates": [asdict(r) for r in self.records.values()],
+        }
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        tmp.replace(self.cache_path)
+
+    def _parse(self, root: str, rel: str, full: Path, stat) -> TemplateRecord:
+        raw = full.read_bytes()
+        content = raw.decode("utf-8", errors="replace")
+        frontmatter, body = split_frontmatter(content)
+        frontmatter = _json_safe(frontmatter)
+        parts = rel.split("/")
+        return TemplateRecord(
+            root=root,
+            path=rel,
+            category=parts[0] if len(parts) > 1 else "",
+            folder="/".join(parts[:-1]),
+            title=str(frontmatter.get("title") or full.stem),
+            tier=frontmatter.get("tier"),
+            phase=frontmatter.get("phase"),
+            placeholders=extract_placeholders(body),
+            content_hash=hashlib.sha256(raw).hexdigest(),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            frontmatter=frontmatter,
+        )
+
+    def refresh(self, force: bool = False) -> "TemplateRegistry":
+        """Re-scan the roots, parsing only new or changed files."""
+        with self._lock:
+            seen = set()
+            parsed = 0
+            for root, directory in self.roots.items():
+                if not directory.exists():
+                    continue
+                for full in directory.rglob("*.md"):
+                    rel = full.relative_to(directory).as_posix()
+                    key = (root, rel)
+                    seen.add(key)
+                    stat = full.stat()
+                    record = self.records.get(key)
+                    if (
+                        not force
+                        and record is not None
+                        and record.mtime_ns == stat.st_mtime_ns
+                        and record.size == stat.st_size
+                    ):
+                        continue
+                    self.records[key] = self._parse(root, rel, full, stat)
+                    parsed += 1
+            removed = [key for key in self.records if key not in seen]
+            for key in removed:
+                del self.records[key]
+            self.parsed = parsed
+            if parsed or removed or self._dirty:
+                self._save_cache()
+                self._dirty = False
+        return self
+
+    def get_fresh(self, path: str, root: str) -> Optional[TemplateRecord]:
+        """
+        Look up one template, re-parsing just that file if it changed.
+
+        Cheaper than refresh() for single lookups: one stat, no directory walk.
+        """
+        rel = Path(path).as_posix()
+        full = self.roots[root] / rel
+        try:
+            stat = full.stat()
+        except OSError:
+            with self._lock:
+                self._dirty |= self.records.pop((root, rel), None) is not None
+            return None
+        with self._lock:
+            record = self.records.get((root, rel))
+            if (
+                record is None
+                or record.mtime_ns != stat.st_mtime_ns
+                or record.size != stat.st_size
+            ):
+                record = self._parse(root, rel, full, stat)
+                self.records[(root, rel)] = record
+                self._dirty = True
+            return record
+
+    def query(
+        self,
+        root: Optional[str] = None,
+        category: Optional[str] = None,
+        folder: Optional[str] = None,
+        tier: Optional[str] = None,
+        phase: Optional[str] = None,
+        include_index: bool = False,
+    ) -> List[TemplateRecord]:
+        """Templates matching every given filter, sorted by root and path."""
+        results = []
+        for record in self.records.values():
+            if root is not None and record.root != root:
+                continue
+            if category is not None and record.category != category:
+                continue
+            if folder is not None and record.folder != folder:
+                continue
+            if phase is not None and record.phase != phase:
+                continue
+            if tier is not None and not _tier_matches(record.tier, tier):
+                continue
+            if not include_index and record.name == "index.md":
+                continue
+            results.append(record)
+        return sorted(results, key=lambda r: (r.root, r.path))
+
+    def get(self, path: str, root: Optional[str] = None) -> Optional[TemplateRecord]:
+        """Look up one template by its root-relative path."""
+        path = Path(path).as_posix()
+        for name in [root] if root else list(self.roots):
+            record = self.records.get((name, path))
+            if record is not None:
+                return record
+        return None
+
+    def categories(self, root: Optional[str] = None) -> List[str]:
+        return sorted({r.category for r in self.query(root=root) if r.category})
+
+    def find_by_hash(self, content_hash: str) -> List[TemplateRecord]:
+        """Templates whose content hashes to content_hash (e.g. duplicates)."""
+        return [r for r in self.records.values() if r.content_hash == content_hash]
+
+
+def _tier_matches(value: Any, tier: str) -> bool:
+    if isinstance(value, (list, tuple)):
+        return any(str(v).lower() == tier.lower() for v in value)
+    return value is not None and str(value).lower() == tier.lower()
+
+
+_registry: Optional[TemplateRegistry] = None
+_refreshed = False
+_registry_lock = threading.Lock()
+
+
+def get_registry(refresh: bool = True) -> TemplateRegistry:
+    """
+    Shared registry for this process, refreshed against disk by default.
+
+    refresh=False skips the scan, except on first use: the registry is
+    always refreshed once per process, so it never serves an empty or
+    stale cache.
+    """
+    global _registry, _refreshed
+    with _registry_lock:
+        if _registry is None:
+            _registry = TemplateRegistry()
+        first_use = not _refreshed
+        _refreshed = True
+    return _registry.refresh() if refresh or first_use else _registry
+
+
+def root_name_for(directory: Path) -> Optional[str]:
+    """Registry root name for a directory, if it is one of the indexed roots."""
+    try:
+        resolved = Path(directory).resolve()
+    except OSError:
+        return None
+    for name, path in ROOTS.items():
+        if path.resolve() == resolved:
+            return name
+    return None
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Template registry")
+    parser.add_argument("--root", choices=sorted(ROOTS), help="Limit to one root")
+    parser.add_argument("--category", help="Filter by category")
+    parser.add_argument("--tier", help="Filter by tier")
+    parser.add_argument("--phase", help="Filter by phase")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Re-parse every template"
+    )
+    parser.add_argument("--json", action="store_true", help="Print records as JSON")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    registry = TemplateRegistry().refresh(force=args.rebuild)
+    records = registry.query(
+        root=args.root, category=args.category, tier=args.tier, phase=args.phase
+    )
+    if args.json:
+        print(json.dumps([asdict(r) for r in records], indent=2))
+    else:
+        for record in records:
+            print(f"{record.root}:{record.path}  {record.title}")
+        print(
+            f"\n{len(records)} templates ({registry.parsed} parsed, cache: {registry.cache_path})",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
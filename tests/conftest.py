@@ -1,5 +1,7 @@
 """Shared fixtures and constants for PartnerAgents tests."""
 
+import sys
+
 import pytest
 from pathlib import Path
 
@@ -102,3 +104,19 @@ def starlight_docs_dir():
 def valid_sections():
     """Return list of valid section names."""
     return VALID_SECTIONS
+
+
+@pytest.fixture
+def ollama_server():
+    """
+    Run the mock LLM server on a free local port for offline client tests.
+
+    It answers Ollama's /api/chat with a fixed reply; tests can tune
+    token_delay, fail_next, stall_next and stall_delay and read requests.
+    """
+    if str(REPO_ROOT / "scripts") not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT / "scripts"))
+    from partner_agents.mock_llm import MockLLMServer
+
+    with MockLLMServer(reply="Hello from the stand-in model") as server:
+        yield server
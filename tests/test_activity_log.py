@@ -0,0 +1,94 @@
+"""Tests for the persisted, time-partitioned activity log."""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import ActivityLog, TeamConfig, Telemetry
+
+
+def _entry(when, driver="architect", action="onboard"):
+    return {
+        "timestamp": when.isoformat(),
+        "driver": driver,
+        "action": action,
+        "details": {},
+    }
+
+
+def test_daily_segments_and_range(tmp_path):
+    """Entries land in one file per day and range reads span days."""
+    log = ActivityLog(tmp_path, retention_days=None)
+    base = datetime(2026, 1, 1, 12, 0)
+    for day in range(5):
+        log.append(_entry(base + timedelta(days=day), driver=f"d{day}"))
+    log.close()
+
+    assert len(list(tmp_path.glob("*.jsonl"))) == 5
+    drivers = [e["driver"] for e in log.iter_range(date(2026, 1, 2), date(2026, 1, 4))]
+    assert drivers == ["d1", "d2", "d3"]
+    assert [e["driver"] for e in log.iter_range(driver_id="d4")] == ["d4"]
+    assert len(list(log.iter_range(start=base + timedelta(days=4, hours=1)))) == 0
+
+
+def test_tail_is_bounded(tmp_path):
+    """The in-memory tail never exceeds its size."""
+    log = ActivityLog(tmp_path, tail_size=10)
+    now = datetime.now()
+    for n in range(50):
+        log.append(_entry(now, action=f"a{n}"))
+
+    assert len(log) == 10
+    assert log.recent(2)[-1]["action"] == "a49"
+    assert len(list(log.iter_range())) == 50
+
+
+def test_retention_deletes_old_segments(tmp_path):
+    """Segments older than the retention window are removed."""
+    today = date.today()
+    old = tmp_path / f"{(today - timedelta(days=120)).isoformat()}.jsonl"
+    old.write_text("{}\n")
+    recent = tmp_path / f"{(today - timedelta(days=5)).isoformat()}.jsonl"
+    recent.write_text("{}\n")
+
+    ActivityLog(tmp_path, retention_days=90)
+    assert not old.exists()
+    assert recent.exists()
+
+
+def test_history_survives_restart(tmp_path):
+    """A new Telemetry sees activity logged by a previous one."""
+    first = Telemetry(state_dir=str(tmp_path))
+    first.log_activity("architect", "onboard", {"partner": "acme"})
+    first.log_activity("engine", "provision", {"partner": "acme"})
+    first.activity_log.close()
+
+    second = Telemetry(state_dir=str(tmp_path))
+    assert [e["action"] for e in second.activity_log.recent()] == [
+        "onboard",
+        "provision",
+    ]
+    assert len(list(second.get_activity(date.today(), driver_id="engine"))) == 1
+
+
+def test_from_config(tmp_path):
+    """Telemetry picks up state_dir and retention from TeamConfig."""
+    config = TeamConfig()
+    config.telemetry["state_dir"] = str(tmp_path)
+    config.telemetry["log_retention_days"] = 7
+
+    telemetry = Telemetry.from_config(config)
+    assert telemetry.activity_log.retention_days == 7
+    assert telemetry.activity_log.log_dir == tmp_path / "activity"
+
+
+def test_global_telemetry_uses_config():
+    """The shared telemetry honours the TeamConfig telemetry defaults."""
+    from partner_agents.state import telemetry
+
+    settings = TeamConfig().telemetry
+    assert telemetry.activity_log.retention_days == settings["log_retention_days"]
+    assert telemetry.activity_log.tail.maxlen == settings["activity_tail_size"]
@@ -490,6 +490,252 @@ def test_partner_state_delete():
             partner_state.PARTNERS_FILE = original_file
 
 
+def _write(path, text):
+    """Write a file and bump its mtime so the change is always visible."""
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_playbooks_cached_until_changed(tmp_path):
+    """Playbooks are parsed once and re-parsed only after an edit."""
+    agent, config_path = _make_agent()
+    try:
+        agent.playbooks_dir = tmp_path
+        playbook = tmp_path / "recruit.yaml"
+        _write(playbook, "name: Recruit\nsteps:\n  - name: One\n")
+
+        assert agent.list_playbooks()[0]["steps"] == 1
+        misses = agent.cache.stats()["misses"]
+        agent.list_playbooks()
+        agent.load_playbook("recruit")
+        assert agent.cache.stats()["misses"] == misses
+
+        # Callers cannot corrupt the cached parse
+        agent.load_playbook("recruit")["steps"].clear()
+        assert len(agent.load_playbook("recruit")["steps"]) == 1
+
+        _write(playbook, "name: Recruit\nsteps:\n  - name: One\n  - name: Two\n")
+        assert agent.list_playbooks()[0]["steps"] == 2
+        _write(tmp_path / "enable.yaml", "name: Enable\nsteps: []\n")
+        assert [p["name"] for p in agent.list_playbooks()] == ["enable", "recruit"]
+    finally:
+        os.unlink(config_path)
+
+
+def test_reload_flushes_cache(tmp_path):
+    """reload_config() drops every cached file."""
+    agent, config_path = _make_agent()
+    try:
+        agent.playbooks_dir = tmp_path
+        _write(tmp_path / "recruit.yaml", "name: Recruit\nsteps: []\n")
+        agent.list_playbooks()
+        assert agent.cache.stats()["size"] > 0
+        agent.reload_config()
+        assert agent.cache.stats()["size"] == 1  # just the config again
+    finally:
+        os.unlink(config_path)
+
+
+def test_watcher_refreshes_config_in_background():
+    """With the watcher running, config edits are picked up without a lookup."""
+    import time
+
+    agent, config_path = _make_agent()
+    try:
+        agent.cache.start_watcher(interval=0.02)
+        _write(Path(config_path), "provider: openai\nmodel: gpt-4o\n")
+        deadline = time.time() + 2
+        while agent.config.get("provider") != "openai" and time.time() < deadline:
+            time.sleep(0.02)
+        assert agent.config["model"] == "gpt-4o"
+        assert agent.cache.stats()["reloads"] >= 1
+    finally:
+        agent.cache.stop_watcher()
+        os.unlink(config_path)
+
+
+def _prefetch_agent(tmp_path, delay=0.2):
+    """Agent with two local templates and a slow fake LLM."""
+    import time
+
+    agent, config_path = _make_agent()
+    agent.templates_dir = tmp_path
+    for name in ("one", "two"):
+        (tmp_path / f"{name}.md").write_text(
+            f"---\ntitle: Step {name}\n---\nFill in [Partner Name] for {name}.\n"
+        )
+    calls = []
+
+    def slow_chat(messages, system_prompt=None):
+        calls.append(messages[-1]["content"])
+        time.sleep(delay)
+        return f"draft {len(calls)}"
+
+    agent.chat = slow_chat
+    agent.prefetch = True
+    playbook = {
+        "name": "Onboard",
+        "steps": [
+            {"name": "One", "template": "one.md"},
+            {"name": "Two", "template": "two.md"},
+        ],
+    }
+    return agent, config_path, playbook, calls
+
+
+def test_prefetch_makes_next_step_instant(tmp_path):
+    """While step 1 is reviewed, step 2's draft is generated in the background."""
+    import time
+
+    agent, config_path, playbook, calls = _prefetch_agent(tmp_path)
+    try:
+        first = agent.run_playbook_step(playbook, 0, "Acme", {"messages": []})
+        time.sleep(0.3)  # user reviews step 1
+
+        start = time.perf_counter()
+        second = agent.run_playbook_step(
+            playbook, 1, "Acme", {"messages": first["messages"]}
+        )
+        assert time.perf_counter() - start < 0.1
+        assert second["response"] == "draft 2"
+        assert len(calls) == 2
+        assert agent.prefetch_stats == {
+            "started": 1,
+            "used": 1,
+            "ready": 1,
+            "discarded": 0,
+        }
+    finally:
+        os.unlink(config_path)
+
+
+def test_prefetch_discarded_when_context_changes(tmp_path):
+    """Edits to step 1's conversation beyond the threshold void the draft."""
+    from agent import context_drift
+
+    agent, config_path, playbook, calls = _prefetch_agent(tmp_path, delay=0.01)
+    try:
+        first = agent.run_playbook_step(playbook, 0, "Acme", {"messages": []})
+        messages = first["messages"] + [
+            {
+                "role": "user",
+                "content": "Actually the partner is a reseller in EMEA " * 40,
+            }
+        ]
+        second = agent.run_playbook_step(playbook, 1, "Acme", {"messages": messages})
+        assert second["response"] == "draft 3"  # generated live
+        assert agent.prefetch_stats["discarded"] == 1
+        assert agent.prefetch_stats["used"] == 0
+    finally:
+        os.unlink(config_path)
+
+    assert context_drift("a b c d", "a b c d") == 0.0
+    assert 0 < context_drift("a b c d", "a b c e") < 0.5
+
+
+def test_partner_index_maintained_on_save(tmp_path):
+    """Saves update state/index.json; listings and lookups read only the index."""
+    import json
+    from partner_agents.store import PartnerIndex
+    from partner_state import PartnerState
+
+    agent, config_path = _make_agent()
+    try:
+        agent.state_dir = tmp_path
+        state = agent.get_partner_state("Acme Corp")
+        state["tier"] = "Gold"
+        agent.save_partner_state("Acme Corp", state)
+
+        other = PartnerState("Globex", state_dir=str(tmp_path))
+        other.update_stage("recruiting")
+        other.save()
+
+        index = json.loads((tmp_path / "index.json").read_text())["partners"]
+        assert index["acme-corp"]["tier"] == "Gold"
+        assert index["globex"]["stage"] == "recruiting"
+
+        summaries = agent.list_partners()
+        assert {p["slug"] for p in summaries} == {"acme-corp", "globex"}
+        assert "notes" not in summaries[0]
+        acme = next(p for p in summaries if p["slug"] == "acme-corp")
+        assert agent.load_partner(acme)["name"] == "Acme Corp"
+
+        assert PartnerIndex(tmp_path).find("ACME CORP")["slug"] == "acme-corp"
+        assert PartnerIndex(tmp_path).find("Initech") is None
+        assert PartnerState.list_all(str(tmp_path), summary=True)[0]["slug"]
+    finally:
+        os.unlink(config_path)
+
+
+def test_agent_and_web_front_share_slugs(tmp_path, monkeypatch):
+    """A partner saved by the web front is the one the agent loads and saves."""
+    from partner_agents import partner_state as web_state
+    from partner_state import PartnerState
+
+    monkeypatch.setattr(web_state, "PARTNERS_FILE", tmp_path / "partners.json")
+    monkeypatch.setattr(web_state, "_partners_cache", None)
+    web_state.add_partner("Acme_Corp", tier="Gold")
+
+    agent, config_path = _make_agent()
+    try:
+        agent.state_dir = tmp_path / "state"
+        assert agent.slugify("Acme_Corp") == "acme_corp"
+        state = agent.get_partner_state("Acme_Corp")
+        assert state["tier"] == "Gold"
+        state["health_score"] = 70
+        agent.save_partner_state("Acme_Corp", state)
+    finally:
+        os.unlink(config_path)
+
+    assert PartnerState("Acme_Corp", state_dir=str(tmp_path / "state")).slug == (
+        "acme_corp"
+    )
+    assert [p["slug"] for p in web_state.list_partners()] == ["acme_corp"]
+    assert web_state.get_partner("Acme_Corp")["health_score"] == 70
+
+
+def test_partner_index_rebuilds_when_out_of_sync(tmp_path):
+    """Partner directories added or removed behind the index trigger a rebuild."""
+    import json
+    import shutil
+    from partner_agents.store import PartnerIndex
+    from partner_state import PartnerState
+
+    PartnerState("Acme", state_dir=str(tmp_path)).save()
+    manual = tmp_path / "initech"
+    manual.mkdir()
+    (manual / "metadata.json").write_text(
+        json.dumps({"name": "Initech", "slug": "initech", "stage": "prospect"})
+    )
+    (tmp_path / "empty-dir").mkdir()
+
+    index = PartnerIndex(tmp_path)
+    assert set(index.entries()) == {"acme", "initech"}
+    shutil.rmtree(manual)
+    assert set(index.entries()) == {"acme"}
+
+    (tmp_path / "index.json").unlink()
+    assert set(index.rebuild()) == {"acme"}
+
+
+def test_generate_report_uses_index(tmp_path, monkeypatch):
+    """generate_report finds partners by display name through the index."""
+    sys.path.insert(0, str(REPO_ROOT / "scripts"))
+    import generate_report
+    from partner_state import PartnerState
+
+    state = PartnerState("Acme Industries", state_dir=str(tmp_path))
+    state.set_tier("Gold")
+    state.save()
+    PartnerState("Globex", state_dir=str(tmp_path)).save()
+    monkeypatch.setattr(generate_report, "STATE_DIR", tmp_path)
+
+    assert generate_report.load_partner("acme industries")["tier"] == "Gold"
+    names = [p["name"] for p in generate_report.load_all_partners()]
+    assert names == ["Acme Industries", "Globex"]
+
+
 if __name__ == "__main__":
     print("Running PartnerAgents v1.2 tests...")
 
@@ -0,0 +1,82 @@
+"""Tests for the async Ollama client against a local stand-in server."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "partner_agent"))
+
+from agent import AsyncOllamaClient, RetryConfig
+
+FAST_RETRY = RetryConfig(max_retries=3, base_delay=0.01, max_delay=0.05)
+
+
+async def test_chat_returns_full_reply(ollama_server):
+    async with AsyncOllamaClient(ollama_server.url) as client:
+        reply = await client.chat([{"role": "user", "content": "hi"}], "be brief")
+    assert reply.strip() == "Hello from the stand-in model"
+
+
+async def test_stream_yields_tokens_incrementally(ollama_server):
+    ollama_server.token_delay = 0.02
+    async with AsyncOllamaClient(ollama_server.url) as client:
+        start = time.perf_counter()
+        stream = client.stream_chat([{"role": "user", "content": "hi"}])
+        first = await stream.__anext__()
+        first_at = time.perf_counter() - start
+        rest = [token async for token in stream]
+    assert first == "Hello "
+    assert len(rest) == 4
+    assert first_at < 5 * 0.02
+
+
+async def test_retries_transient_errors(ollama_server):
+    ollama_server.fail_next = 2
+    async with AsyncOllamaClient(ollama_server.url, retry_config=FAST_RETRY) as client:
+        reply = await client.chat([{"role": "user", "content": "hi"}])
+    assert reply.startswith("Hello")
+    assert ollama_server.requests == 3
+
+
+async def test_gives_up_after_max_retries(ollama_server):
+    ollama_server.fail_next = 10
+    retry = RetryConfig(max_retries=1, base_delay=0.01, max_delay=0.01)
+    async with AsyncOllamaClient(ollama_server.url, retry_config=retry) as client:
+        with pytest.raises(Exception):
+            await client.chat([{"role": "user", "content": "hi"}])
+    assert ollama_server.requests == 2
+
+
+async def test_backoff_is_jittered_and_capped():
+    client = AsyncOllamaClient(retry_config=RetryConfig(base_delay=1, max_delay=4))
+    delays = [client.backoff_delay(5) for _ in range(50)]
+    assert all(0 <= d <= 4 for d in delays)
+    assert len(set(delays)) > 1
+
+
+async def test_cancellation_stops_stream(ollama_server):
+    ollama_server.token_delay = 0.2
+    async with AsyncOllamaClient(ollama_server.url) as client:
+        task = asyncio.create_task(client.chat([{"role": "user", "content": "hi"}]))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+async def test_concurrent_requests_share_pool(ollama_server):
+    """Benchmark: concurrent chats overlap instead of queueing."""
+    ollama_server.token_delay = 0.02
+    async with AsyncOllamaClient(ollama_server.url, max_connections=10) as client:
+        start = time.perf_counter()
+        replies = await asyncio.gather(
+            *(client.chat([{"role": "user", "content": str(i)}]) for i in range(10))
+        )
+        elapsed = time.perf_counter() - start
+    assert len(replies) == 10
+    # One request streams for ~4 x 20 ms; ten sequential would take ~0.8 s
+    assert elapsed < 0.5
@@ -0,0 +1,78 @@
+"""Tests for atomic, optionally checksummed state file writes."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import atomic
+from partner_agents.atomic import (
+    CorruptFileError,
+    atomic_write,
+    atomic_write_json,
+    read_json,
+    write_state,
+)
+from partner_agents.store import PartnerStore
+
+
+def test_write_replaces_file(tmp_path):
+    path = tmp_path / "nested" / "state.json"
+    atomic_write_json(path, {"n": 1})
+    atomic_write_json(path, {"n": 2}, indent=2)
+    assert read_json(path) == {"n": 2}
+    assert [p.name for p in path.parent.iterdir()] == ["state.json"]
+
+
+def test_failed_rename_keeps_old_content(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    atomic_write_json(path, {"n": 1})
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(atomic.os, "replace", fail)
+    with pytest.raises(OSError):
+        atomic_write_json(path, {"n": 2})
+    assert read_json(path) == {"n": 1}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_checksum_footer(tmp_path):
+    path = tmp_path / "state.json"
+    atomic_write_json(path, {"partners": ["acme"]}, checksum=True)
+    assert path.read_text().splitlines()[-1].startswith("#sha256:")
+    assert read_json(path) == {"partners": ["acme"]}
+
+    path.write_text(path.read_text().replace("acme", "acne"))
+    with pytest.raises(CorruptFileError):
+        read_json(path)
+
+    # Files without a footer still read
+    atomic_write(path, json.dumps([1, 2]))
+    assert read_json(path) == [1, 2]
+
+
+def test_state_writers_honor_checksum_switch(tmp_path, monkeypatch):
+    monkeypatch.setattr(atomic, "STATE_CHECKSUM", True)
+    write_state(tmp_path / "plain.json", {"ok": True})
+    assert b"#sha256:" in (tmp_path / "plain.json").read_bytes()
+
+    store = PartnerStore(tmp_path / "state")
+    store.save({"name": "Acme Corp", "tier": "Gold"})
+    meta = tmp_path / "state" / "acme-corp" / "metadata.json"
+    assert meta.read_text().splitlines()[-1].startswith("#sha256:")
+
+    reader = PartnerStore(tmp_path / "state")
+    assert reader.get("acme-corp")["tier"] == "Gold"
+    assert reader.index.find("acme corp")["slug"] == "acme-corp"
+
+    # A damaged record is skipped rather than returned half-parsed
+    meta.write_bytes(meta.read_bytes().replace(b"Gold", b"Gilt"))
+    os.utime(meta, ns=(0, 10**18))
+    assert reader.get("acme-corp") is None
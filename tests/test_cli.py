@@ -816,3 +816,49 @@ async def test_input_sanitization_blocks_path_traversal():
     # Assert - should return error, not crash
     assert "response" in response
     # Should either show "not found" or ask for clarification
+
+
+@pytest.mark.asyncio
+async def test_slash_bulk_usage():
+    """Test /bulk without a valid document type shows usage."""
+    from scripts.partner_agents.cli import handle_slash_command
+
+    class MockConsole:
+        def print(self, *args, **kwargs):
+            pass
+
+    response = await handle_slash_command("bulk memo", MockConsole(), "", "model", None)
+    assert "Usage: /bulk" in response["response"]
+
+
+@pytest.mark.asyncio
+async def test_slash_search():
+    """Test /search lists matching templates."""
+    from scripts.partner_agents.cli import handle_slash_command
+
+    class MockConsole:
+        def print(self, *args, **kwargs):
+            pass
+
+    response = await handle_slash_command(
+        "search deal registration", MockConsole(), "", "model", None
+    )
+    assert response["results"]
+    assert "deal" in response["response"].lower()
+
+    response = await handle_slash_command("search", MockConsole(), "", "model", None)
+    assert "Usage: /search" in response["response"]
+
+
+@pytest.mark.asyncio
+async def test_slash_tokens_reports_usage():
+    """Test /tokens shows token usage and cache stats."""
+    from scripts.partner_agents.cli import handle_slash_command
+
+    class MockConsole:
+        def print(self, *args, **kwargs):
+            pass
+
+    response = await handle_slash_command("tokens", MockConsole(), "", "model", None)
+    assert "Token usage" in response["response"]
+    assert "models" in response["usage"]
@@ -0,0 +1,296 @@
+"""Tests for document_generator template loading and caching."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import document_generator
+from partner_agents.document_generator import TemplateCache
+
+
+@pytest.fixture
+def templates(tmp_path, monkeypatch):
+    """Point the generator at a scratch template dir with a fresh cache."""
+    (tmp_path / "legal").mkdir()
+    (tmp_path / "legal" / "01-nda.md").write_text(
+        "---\ntitle: NDA\n---\nBetween [Partner Name] and ${company} on ___today_date___.\n"
+    )
+    monkeypatch.setattr(document_generator, "TEMPLATES_DIR", tmp_path)
+    monkeypatch.setattr(document_generator, "template_cache", TemplateCache(4))
+    return tmp_path
+
+
+def test_template_parsed_once(templates):
+    """Repeated loads hit the cache instead of re-parsing."""
+    for _ in range(1000):
+        template = document_generator.load_template("legal/01-nda")
+
+    stats = document_generator.template_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 999
+    assert template["frontmatter"] == {"title": "NDA"}
+    assert template["plan"] == {
+        "bracket": ["Partner Name"],
+        "dollar": ["company"],
+        "underscore": ["today_date"],
+    }
+
+
+def test_edited_template_is_reparsed(templates):
+    """A change in mtime or size invalidates the cached entry."""
+    path = templates / "legal" / "01-nda.md"
+    document_generator.load_template("legal/01-nda.md")
+
+    path.write_text("Hello [Name], welcome aboard.\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    template = document_generator.load_template("legal/01-nda.md")
+    assert template["placeholders"] == ["Name"]
+    assert document_generator.template_cache.stats()["misses"] == 2
+
+
+def test_callers_cannot_corrupt_cache(templates):
+    """Mutating a loaded template leaves the cached copy intact."""
+    first = document_generator.load_template("legal/01-nda.md")
+    first["frontmatter"]["title"] = "changed"
+    first["placeholders"].clear()
+
+    second = document_generator.load_template("legal/01-nda.md")
+    assert second["frontmatter"]["title"] == "NDA"
+    assert second["placeholders"]
+
+
+def test_missing_template_returns_none(templates):
+    """Unknown template paths return None."""
+    assert document_generator.load_template("legal/99-missing.md") is None
+
+
+def test_cache_is_bounded(tmp_path):
+    """The least recently used template is evicted past max_size."""
+    cache = TemplateCache(max_size=2)
+    paths = []
+    for n in range(3):
+        path = tmp_path / f"t{n}.md"
+        path.write_text(f"[Field {n}]")
+        paths.append(path)
+        cache.get(path)
+
+    assert cache.stats()["size"] == 2
+    cache.get(paths[0])
+    assert cache.stats()["misses"] == 4
+
+
+@pytest.mark.parametrize(
+    "body, fields",
+    [
+        ("Hi [Name], ${a} and $a on ___b___.", {"Name": "Acme", "a": "1", "b": "x"}),
+        ("Unfilled [Name] stays", {}),
+        ("Fee: $[Amount] due", {"Amount": "500"}),
+        ("Fee: $[Amount] due", {"Amount": "500", "500": "five hundred"}),
+        ("[A] chains", {"A": "$b", "b": "resolved"}),
+        ("[A] chains", {"A": "___c___", "c": "resolved"}),
+        ("x___[A]___", {"A": "abc", "abc": "merged"}),
+        ("Count: [N]", {"N": 3}),
+    ],
+)
+def test_compiled_matches_regex_passes(body, fields):
+    """The single-pass renderer reproduces the three regex passes exactly."""
+    compiled = document_generator.CompiledTemplate(body)
+    try:
+        expected = document_generator._fill_passes(body, fields)
+    except TypeError:
+        with pytest.raises(TypeError):
+            compiled.render(fields)
+        return
+    assert compiled.render(fields) == expected
+
+
+def test_compiled_plan_reused():
+    """Renders with the same filled names share one compiled plan."""
+    compiled = document_generator.CompiledTemplate("[A] and $b")
+    assert compiled.render({"A": "1", "b": "2"}) == "1 and 2"
+    assert compiled.render({"A": "3", "b": "4"}) == "3 and 4"
+    assert compiled.render({"A": "5"}) == "5 and $b"
+    assert len(compiled._plans) == 2
+
+
+def test_real_templates_render_identically():
+    """Every shipped template renders the same as the regex passes."""
+    for path in document_generator.TEMPLATES_DIR.rglob("*.md"):
+        relative = str(path.relative_to(document_generator.TEMPLATES_DIR))
+        template = document_generator.load_template(relative)
+        fields = {name: "Acme Corp" for name in template["placeholders"]}
+        expected = document_generator._fill_passes(template["body"], fields)
+        assert document_generator.fill_template(template, fields) == expected
+
+
+@pytest.fixture
+def partner_store(tmp_path, monkeypatch):
+    """Scratch partners.json and documents dir."""
+    from partner_agents import partner_state
+
+    monkeypatch.setattr(partner_state, "PARTNERS_FILE", tmp_path / "partners.json")
+    monkeypatch.setattr(partner_state, "_partners_cache", None)
+    monkeypatch.setattr(document_generator, "DOCUMENTS_DIR", tmp_path / "partners")
+    monkeypatch.setattr(document_generator, "REPO_ROOT", tmp_path)
+    return partner_state
+
+
+def test_onboarding_packet(partner_store, monkeypatch):
+    """The packet writes all documents and records them in one state save."""
+    partner_store.add_partner(name="Acme Corp", tier="Gold")
+    saves = []
+    original_save = partner_store.save_partners
+    monkeypatch.setattr(
+        partner_store,
+        "save_partners",
+        lambda partners: saves.append(1) or original_save(partners),
+    )
+
+    packet = document_generator.create_onboarding_packet("Acme Corp")
+    docs = partner_store.add_documents("Acme Corp", packet)
+
+    assert [d["doc_type"] for d in packet] == ["nda", "msa", "dpa", "checklist"]
+    assert all(Path(d["path"]).exists() for d in packet)
+    assert "Acme Corp" in Path(packet[-1]["path"]).read_text()
+    assert [d["id"] for d in docs] == ["doc-1", "doc-2", "doc-3", "doc-4"]
+    assert len(saves) == 1
+    assert len(partner_store.get_partner_documents("Acme Corp")) == 4
+
+
+def test_add_document_still_works(partner_store):
+    """The single-document helper goes through the batched path."""
+    partner_store.add_partner(name="Beta", tier="Silver")
+    doc = partner_store.add_document("Beta", "nda", "legal/01-nda.md", "/tmp/x.md")
+
+    assert doc["type"] == "nda"
+    assert doc["fields"] == {}
+    assert partner_store.add_document("Missing", "nda", "t", "p") is None
+
+
+def test_bulk_generation(partner_store, tmp_path):
+    """Bulk runs filter partners, write documents and return a manifest."""
+    for n in range(30):
+        partner_store.add_partner(
+            name=f"Partner {n}", tier="Gold" if n % 3 else "Silver"
+        )
+    seen = []
+
+    manifest = document_generator.create_documents_bulk(
+        "dpa",
+        {"tier": "gold"},
+        fields_fn=lambda p: {"Partner Name": p["name"].upper()},
+        progress=lambda done, total, entry: seen.append((done, total)),
+        manifest_dir=tmp_path / "manifests",
+    )
+
+    assert manifest["total"] == manifest["created"] == 20
+    assert manifest["failed"] == 0
+    assert seen[-1] == (20, 20)
+    assert all(Path(d["path"]).exists() for d in manifest["documents"])
+    assert Path(manifest["manifest_path"]).exists()
+    assert len(partner_store.get_partner_documents("Partner 1")) == 1
+    assert partner_store.get_partner_documents("Partner 0") == []
+
+
+def test_bulk_unknown_doc_type(partner_store):
+    """Unknown document types return an empty manifest with an error."""
+    manifest = document_generator.create_documents_bulk("nope", partners=[])
+    assert manifest["created"] == 0
+    assert manifest["errors"]
+
+
+def test_catalog_tracks_saved_documents(partner_store):
+    """Saved documents are catalogued and looked up without a directory scan."""
+    docs_dir = document_generator._ensure_partner_dir("Acme Corp")
+    (docs_dir / "2025-01-15-nda.md").write_text("old nda")
+    document_generator.generator.rebuild_catalog("Acme Corp")
+
+    new_nda = document_generator.save_document("Acme Corp", "nda", "new nda")
+    document_generator.save_document("Acme Corp", "msa", "msa")
+
+    generator = document_generator.generator
+    assert generator.get_document_path("Acme Corp", "nda") == new_nda
+    assert generator.get_document_path("Acme Corp", "dpa") is None
+    listed = generator.list_partner_documents("Acme Corp")
+    assert [d["doc_type"] for d in listed[:2]] == ["msa", "nda"]
+    assert len(listed) == 3
+
+    old = generator.find_documents("Acme Corp", "nda", end="2025-12-31")
+    assert [d["filename"] for d in old] == ["2025-01-15-nda.md"]
+
+
+def test_catalog_rebuild_fixes_drift(partner_store):
+    """Deleted or hand-added files are picked up by a rebuild."""
+    newest = document_generator.save_document("Beta", "nda", "nda")
+    docs_dir = newest.parent
+    newest.unlink()
+    (docs_dir / "2024-06-01-nda.md").write_text("restored")
+
+    generator = document_generator.generator
+    assert generator.get_document_path("Beta", "nda").name == "2024-06-01-nda.md"
+
+    (docs_dir / "2024-07-01-dpa.md").write_text("manual")
+    assert generator.rebuild_catalog() == {"beta": 2}
+    assert generator.get_document_path("Beta", "dpa").name == "2024-07-01-dpa.md"
+
+
+def test_catalogs_lock_per_partner(tmp_path):
+    """Saves for different partners never wait on each other's catalog."""
+    from partner_agents.document_catalog import DocumentCatalog
+
+    a = DocumentCatalog(tmp_path / "a" / "documents")
+    b = DocumentCatalog(tmp_path / "b" / "documents")
+    assert a._lock is not b._lock
+    assert DocumentCatalog(tmp_path / "a" / "documents")._lock is a._lock
+
+
+def test_catalog_missing_partner(partner_store):
+    """Unknown partners have no documents and no catalog."""
+    assert document_generator.list_documents("Nobody") == []
+    assert document_generator.generator.get_document_path("Nobody", "nda") is None
+
+
+def test_cas_storage_dedupes(partner_store, monkeypatch, tmp_path):
+    """In CAS mode identical renders share one compressed blob."""
+    monkeypatch.setattr(document_generator, "STORAGE_MODE", "cas")
+    paths = [
+        document_generator.save_document(f"Partner {n}", "nda", "Same NDA body")
+        for n in range(5)
+    ]
+    document_generator.save_document("Partner 0", "msa", "Different body")
+
+    blobs = list((tmp_path / "partners" / ".blobs").rglob("*.gz"))
+    assert len(blobs) == 2
+    assert not any(p.exists() for p in paths)
+    assert all(document_generator.read_document(p) == "Same NDA body" for p in paths)
+
+    generator = document_generator.generator
+    assert generator.get_document_path("Partner 3", "nda") == paths[3]
+    assert [d["doc_type"] for d in generator.list_partner_documents("Partner 0")] == [
+        "msa",
+        "nda",
+    ]
+    # A rebuild keeps blob-backed entries
+    generator.rebuild_catalog("Partner 3")
+    assert generator.get_document_path("Partner 3", "nda") == paths[3]
+
+
+def test_compact_existing_documents(partner_store, tmp_path):
+    """Existing files can be migrated into shared blobs."""
+    paths = [
+        document_generator.save_document(f"Partner {n}", "dpa", "Shared DPA")
+        for n in range(3)
+    ]
+
+    counts = document_generator.compact_documents()
+
+    assert counts == {"files": 3, "blobs": 1}
+    assert not any(p.exists() for p in paths)
+    assert document_generator.read_document(paths[0]) == "Shared DPA"
@@ -0,0 +1,134 @@
+"""Tests for the LLM completion cache."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents.llm_cache import LLMCache, cosine, embed, from_env
+from partner_agents.llm_gateway import LLMGateway
+
+SYSTEM = {"role": "system", "content": "You are the partner swarm."}
+
+
+def ask(text):
+    return [SYSTEM, {"role": "user", "content": text}]
+
+
+def test_exact_hit_ignores_case_and_punctuation(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl", similarity=None)
+    cache.put("m", ask("Email Acme about QBR"), "Hi Acme...")
+    assert cache.get("m", ask("email acme about qbr!")).content == "Hi Acme..."
+    assert cache.stats.exact_hits == 1
+
+
+def test_similar_phrasing_hits(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl", similarity=0.85)
+    cache.put("m", ask("email Acme about the QBR"), "Hi Acme...")
+    assert cache.get("m", ask("please email Acme about QBRs")).content == "Hi Acme..."
+    assert cache.get("m", ask("email Globex about the QBR")) is None
+    assert cache.stats.similar_hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_similarity_is_off_by_default(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl")
+    cache.put("m", ask("email Acme about the QBR"), "Hi Acme...")
+    assert cache.get("m", ask("please email Acme about QBRs")) is None
+
+
+def test_near_hit_needs_same_names_numbers_and_order(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl", similarity=0.5)
+    cache.put("m", ask("Globex owes Acme 5000 dollars for the renewal"), "Globex")
+    cache.put("m", ask("draft a plan for a partner with health score 35"), "35")
+    assert cache.get("m", ask("Acme owes Globex 5000 dollars for the renewal")) is None
+    assert (
+        cache.get("m", ask("draft a plan for a partner with health score 80")) is None
+    )
+    assert cache.get("m", ask("Globex owes Acme 7000 dollars for the renewal")) is None
+    assert cache.stats.similar_hits == 0
+
+
+def test_scope_includes_model_and_context(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl")
+    cache.put("m", ask("email Acme about QBR"), "Hi Acme...")
+    assert cache.get("other-model", ask("email Acme about QBR")) is None
+    other_context = [{"role": "system", "content": "different"}] + ask("x")[1:]
+    other_context[-1]["content"] = "email Acme about QBR"
+    assert cache.get("m", other_context) is None
+
+
+def test_scope_includes_endpoint_and_max_tokens(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl")
+    messages = ask("email Acme about QBR")
+    cache.put("m", messages, "real", base_url="https://api.example", max_tokens=500)
+    assert cache.get("m", messages, "http://127.0.0.1:9", 500) is None
+    assert cache.get("m", messages, "https://api.example", 50) is None
+    assert cache.get("m", messages, "https://api.example", 500).content == "real"
+
+
+def test_from_env_defaults_to_exact_in_memory(monkeypatch):
+    for name in ("", "_SIMILARITY", "_PATH"):
+        monkeypatch.delenv(f"PARTNERAGENTS_LLM_CACHE{name}", raising=False)
+    cache = from_env()
+    assert cache.path is None
+    assert cache.similarity is None
+
+
+def test_ttl_expires_entries(tmp_path, monkeypatch):
+    cache = LLMCache(tmp_path / "cache.jsonl", ttl_seconds=60)
+    cache.put("m", ask("roi"), "ROI is...")
+    later = cache.entries[next(iter(cache.entries))].created_at + 61
+    monkeypatch.setattr("partner_agents.llm_cache.time.time", lambda: later)
+    assert cache.get("m", ask("roi")) is None
+
+
+def test_lru_eviction(tmp_path):
+    cache = LLMCache(tmp_path / "cache.jsonl", max_entries=2, similarity=None)
+    cache.put("m", ask("one"), "1")
+    cache.put("m", ask("two"), "2")
+    cache.get("m", ask("one"))
+    cache.put("m", ask("three"), "3")
+    assert cache.get("m", ask("two")) is None
+    assert cache.get("m", ask("one")).content == "1"
+    assert cache.stats.evictions == 1
+
+
+def test_survives_restart_and_compacts(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = LLMCache(path, max_entries=3, similarity=None)
+    for i in range(20):
+        cache.put("m", ask(f"question {i}"), str(i))
+
+    reloaded = LLMCache(path, max_entries=3, similarity=None)
+    assert len(reloaded) == 3
+    assert reloaded.get("m", ask("question 19")).content == "19"
+    assert reloaded.get("m", ask("question 0")) is None
+    assert len(path.read_text().splitlines()) <= 2 * 3 + 2
+
+
+def test_embedding_is_normalized():
+    vector = embed("partner partner deal")
+    assert cosine(vector, vector) == pytest.approx(1.0)
+    assert embed("the and of") == {}
+
+
+async def test_gateway_serves_repeat_from_cache(ollama_server, tmp_path):
+    gw = LLMGateway(cache=LLMCache(tmp_path / "cache.jsonl", similarity=0.85))
+    messages = ask("email Acme about the QBR")
+    first = await gw.complete(
+        "ollama", "stand-in", messages, base_url=ollama_server.url
+    )
+    second = await gw.complete(
+        "ollama",
+        "stand-in",
+        ask("please email Acme about QBRs"),
+        base_url=ollama_server.url,
+    )
+    assert not first.cached and second.cached
+    assert second.content == first.content
+    assert ollama_server.requests == 1
+    assert gw.metrics()["cache"]["hit_rate"] == 0.5
@@ -0,0 +1,210 @@
+"""Tests for the shared LLM gateway, run against the local Ollama stand-in."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents.tracing import LatencyHistogram
+from partner_agents.llm_gateway import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HedgePolicy,
+    LLMGateway,
+    ProviderError,
+    QueueTimeoutError,
+)
+
+MESSAGES = [
+    {"role": "system", "content": "be brief"},
+    {"role": "user", "content": "hi"},
+]
+
+
+def call(gw, server, **kwargs):
+    return gw.complete("ollama", "stand-in", MESSAGES, base_url=server.url, **kwargs)
+
+
+async def test_complete_records_metrics(ollama_server):
+    gw = LLMGateway()
+    reply = await call(gw, ollama_server)
+    assert reply.content.strip() == "Hello from the stand-in model"
+    assert reply.completion_tokens > 0
+
+    stats = gw.metrics()["models"]["ollama/stand-in"]
+    assert stats["count"] == 1
+    assert stats["errors"] == 0
+    assert stats["completion_tokens"] == reply.completion_tokens
+    assert gw.metrics()["circuits"]["ollama"] == "closed"
+
+
+async def test_per_model_limit_queues_calls(ollama_server):
+    ollama_server.token_delay = 0.05
+    gw = LLMGateway(per_model_concurrency=1)
+    start = time.perf_counter()
+    await asyncio.gather(call(gw, ollama_server), call(gw, ollama_server))
+    # Two calls of >= 0.05 s each ran one after the other
+    assert time.perf_counter() - start >= 0.1
+
+
+async def test_queue_deadline_rejects_waiting_caller(ollama_server):
+    ollama_server.token_delay = 0.2
+    gw = LLMGateway(per_model_concurrency=1)
+    results = await asyncio.gather(
+        call(gw, ollama_server),
+        call(gw, ollama_server, queue_timeout=0.05),
+        return_exceptions=True,
+    )
+    assert not isinstance(results[0], Exception)
+    assert isinstance(results[1], QueueTimeoutError)
+    assert gw.metrics()["models"]["ollama/stand-in"]["queue_timeouts"] == 1
+
+
+async def test_circuit_opens_and_fails_fast(ollama_server):
+    ollama_server.fail_next = 100
+    gw = LLMGateway(failure_threshold=2, reset_timeout=0.1)
+    for _ in range(2):
+        with pytest.raises(ProviderError):
+            await call(gw, ollama_server)
+
+    start = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        await call(gw, ollama_server)
+    assert time.perf_counter() - start < 0.05
+    assert ollama_server.requests == 2
+
+    # After the reset timeout a successful probe closes the circuit
+    ollama_server.fail_next = 0
+    await asyncio.sleep(0.12)
+    await call(gw, ollama_server)
+    assert gw.breaker("ollama").state == "closed"
+
+
+async def test_client_errors_do_not_trip_breaker(ollama_server):
+    gw = LLMGateway(failure_threshold=1)
+    with pytest.raises(ProviderError) as excinfo:
+        await gw.complete(
+            "ollama", "stand-in", MESSAGES, base_url=ollama_server.url + "/missing"
+        )
+    assert excinfo.value.status_code == 404
+    assert gw.breaker("ollama").state == "closed"
+
+
+async def test_request_timeout_counts_as_failure(ollama_server):
+    ollama_server.token_delay = 0.2
+    gw = LLMGateway(failure_threshold=1, reset_timeout=60)
+    with pytest.raises(asyncio.TimeoutError):
+        await call(gw, ollama_server, timeout=0.05)
+    assert gw.breaker("ollama").state == "open"
+
+
+def test_complete_sync(ollama_server):
+    reply = LLMGateway().complete_sync(
+        "ollama", "stand-in", MESSAGES, base_url=ollama_server.url
+    )
+    assert reply.content.startswith("Hello")
+
+
+def test_limits_are_shared_across_event_loops(ollama_server):
+    """complete_sync's loop and a caller's own loop draw on one quota."""
+    ollama_server.token_delay = 0.2
+    gw = LLMGateway(per_model_concurrency=1)
+    background = threading.Thread(
+        target=gw.complete_sync,
+        args=("ollama", "stand-in", MESSAGES),
+        kwargs={"base_url": ollama_server.url},
+    )
+    background.start()
+    while gw._model_slots("ollama/stand-in").in_use == 0:
+        time.sleep(0.01)
+    with pytest.raises(QueueTimeoutError):
+        asyncio.run(call(gw, ollama_server, queue_timeout=0.05))
+    background.join()
+    assert gw.model_slots["ollama/stand-in"].in_use == 0
+    gw.close()
+
+
+async def test_aclose_closes_the_loops_pool(ollama_server):
+    gw = LLMGateway()
+    await call(gw, ollama_server)
+    client = gw._clients[asyncio.get_running_loop()]
+    await gw.aclose()
+    assert client.is_closed
+
+
+def test_close_stops_pools_and_background_loop(ollama_server):
+    gw = LLMGateway()
+    gw.complete_sync("ollama", "stand-in", MESSAGES, base_url=ollama_server.url)
+    clients = list(gw._clients.values())
+    gw.close()
+    assert clients and all(c.is_closed for c in clients)
+    assert gw._sync_loop is None
+
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.allow()  # reset_timeout=0: next probe window opens at once
+
+
+async def test_hedge_races_slow_call(ollama_server):
+    ollama_server.stall_next = 1
+    ollama_server.stall_delay = 1.0
+    gw = LLMGateway(hedge=HedgePolicy(default_delay=0.05))
+    start = time.perf_counter()
+    reply = await call(gw, ollama_server)
+    assert time.perf_counter() - start < 0.8
+    assert reply.hedged
+    assert ollama_server.requests == 2
+
+    stats = gw.metrics()["models"]["ollama/stand-in"]
+    assert stats["hedges"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["count"] == 1  # the cancelled call is not a latency sample
+    assert gw.metrics()["hedging"]["fired"] == 1
+
+
+async def test_hedge_skipped_for_fast_calls(ollama_server):
+    gw = LLMGateway(hedge=HedgePolicy(default_delay=0.5))
+    reply = await call(gw, ollama_server)
+    assert not reply.hedged
+    assert ollama_server.requests == 1
+    assert gw.metrics()["hedging"]["fired"] == 0
+
+
+async def test_hedge_to_fallback_model(ollama_server):
+    ollama_server.stall_next = 1
+    gw = LLMGateway(hedge=HedgePolicy(default_delay=0.05, fallback_model="backup"))
+    reply = await call(gw, ollama_server)
+    assert reply.model == "backup"
+    assert gw.metrics()["models"]["ollama/stand-in"]["hedge_wins"] == 1
+
+
+async def test_hedge_opt_out(ollama_server):
+    ollama_server.stall_next = 1
+    ollama_server.stall_delay = 0.2
+    gw = LLMGateway(hedge=HedgePolicy(default_delay=0.05))
+    reply = await call(gw, ollama_server, hedge=False)
+    assert not reply.hedged
+    assert ollama_server.requests == 1
+
+
+def test_hedge_delay_follows_recorded_latency():
+    policy = HedgePolicy(min_samples=10, min_delay=0.1, max_delay=5.0)
+    latency = LatencyHistogram()
+    assert policy.delay(latency) == policy.default_delay
+    for _ in range(20):
+        latency.record(800.0)
+    assert 0.8 <= policy.delay(latency) <= 1.2
+    for _ in range(20):
+        latency.record(60_000.0)
+    assert policy.delay(latency) == 5.0
@@ -0,0 +1,116 @@
+"""Tests for the program metrics time-series store."""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import TeamConfig, Telemetry
+from partner_agents.metrics import MetricsStore
+from partner_agents.store import store_for
+
+BASE = datetime(2026, 3, 2, 9, 0)
+
+
+def _fill(store, hours=48, step_minutes=15):
+    for n in range(hours * 60 // step_minutes):
+        when = BASE + timedelta(minutes=n * step_minutes)
+        store.record({"total_pipeline": float(n), "closed_revenue": 10.0}, ts=when)
+
+
+def test_rollups_average_buckets():
+    """Hourly rollup averages the four 15-minute samples in each hour."""
+    store = MetricsStore()
+    _fill(store, hours=2)
+
+    raw = store.query(["total_pipeline"], resolution="raw")
+    hourly = store.query(["total_pipeline"], resolution="hour")
+    assert len(raw["timestamps"]) == 8
+    assert hourly["series"]["total_pipeline"] == [1.5, 5.5]
+
+
+def test_range_and_auto_resolution():
+    """Range bounds are inclusive and auto picks a coarser rollup for long spans."""
+    store = MetricsStore()
+    _fill(store)
+
+    window = store.query(
+        ["total_pipeline"],
+        start=BASE + timedelta(hours=1),
+        end=BASE + timedelta(hours=2),
+        resolution="raw",
+    )
+    assert window["series"]["total_pipeline"] == [4.0, 5.0, 6.0, 7.0, 8.0]
+
+    auto = store.query(start=BASE, end=BASE + timedelta(hours=48), max_points=100)
+    assert auto["resolution"] == "hour"
+
+
+def test_downsampling_caps_points():
+    """max_points averages runs of points together."""
+    store = MetricsStore()
+    _fill(store)
+
+    result = store.query(["closed_revenue"], resolution="raw", max_points=10)
+    assert len(result["timestamps"]) == 10
+    assert set(result["series"]["closed_revenue"]) == {10.0}
+
+
+def test_unknown_metric_rejected():
+    """Unknown metric names raise instead of returning empty series."""
+    with pytest.raises(ValueError):
+        MetricsStore().query(["nope"])
+
+
+def test_persists_across_restart(tmp_path):
+    """Series survive a save/load round trip."""
+    path = tmp_path / "metrics.json"
+    store = MetricsStore(path)
+    _fill(store, hours=1)
+    store.save()
+
+    reloaded = MetricsStore(path)
+    assert reloaded.query(resolution="raw") == store.query(resolution="raw")
+    assert reloaded.last_sample_at == store.last_sample_at
+
+
+def test_telemetry_refresh(tmp_path):
+    """Telemetry derives metrics from the partner store and samples them."""
+    partners = store_for(tmp_path / "partners")
+    partners.save_many(
+        [
+            {
+                "name": "Acme",
+                "tier": "Gold",
+                "status": "Active",
+                "created": "2026-03-01T10:00:00",
+                "deals": [
+                    {"value": 1000, "status": "registered"},
+                    {"value": 250, "status": "won"},
+                    {"value": 75, "status": "lost"},
+                ],
+            },
+            {"name": "Old", "tier": "Silver", "stage": "churned"},
+        ]
+    )
+    config = TeamConfig()
+    config.telemetry["state_dir"] = str(tmp_path / "telemetry")
+    config.telemetry["metrics_refresh_minutes"] = 60
+    telemetry = Telemetry.from_config(config)
+    telemetry.partner_store = partners
+
+    metrics = telemetry.refresh_metrics(now=BASE)
+    assert metrics.total_partners == 2
+    assert metrics.active_partners == 1
+    assert metrics.partners_by_tier == {"Gold": 1, "Silver": 1}
+    assert metrics.total_pipeline == 1000.0
+    assert metrics.closed_revenue == 250.0
+    assert metrics.mtd_new_partners == 1
+
+    history = Telemetry.from_config(config).get_metrics_history(resolution="raw")
+    assert history["series"]["total_pipeline"][0] == 1000.0
+    assert history["series"]["closed_revenue"][0] == 250.0
@@ -0,0 +1,153 @@
+"""Tests for the offline mock LLM server and its record/replay fixtures."""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents.llm_gateway import LLMGateway
+from partner_agents.mock_llm import LatencyProfile, MockLLMServer
+
+MESSAGES = [
+    {"role": "system", "content": "be brief"},
+    {"role": "user", "content": "draft a QBR agenda for Acme"},
+]
+
+
+@pytest.fixture
+def mock_llm():
+    with MockLLMServer(reply_tokens=12) as server:
+        yield server
+
+
+def test_latency_profiles():
+    rng = random.Random(1)
+    assert LatencyProfile("fixed:250").sample(rng) == 250
+    assert 100 <= LatencyProfile("uniform:100:200").sample(rng) <= 200
+    samples = sorted(
+        LatencyProfile("lognormal:500:0.5").sample(rng) for _ in range(501)
+    )
+    assert 400 <= samples[250] <= 600
+    assert LatencyProfile("recorded").sample(rng, recorded_ms=42.0) == 42.0
+    with pytest.raises(ValueError):
+        LatencyProfile("gamma:1")
+
+
+async def test_gateway_against_openai_wire(mock_llm):
+    gw = LLMGateway()
+    first = await gw.complete(
+        "openrouter", "qwen/test", MESSAGES, base_url=f"{mock_llm.url}/api/v1"
+    )
+    second = await gw.complete(
+        "openrouter", "qwen/test", MESSAGES, base_url=f"{mock_llm.url}/api/v1"
+    )
+    assert first.content.startswith("Mock reply to: draft a QBR agenda")
+    assert first.content == second.content  # deterministic per request
+    assert first.completion_tokens == len(first.content.split())
+    assert mock_llm.stats["synthesized"] == 2
+
+
+async def test_gateway_against_ollama_wire(mock_llm):
+    reply = await LLMGateway().complete(
+        "ollama", "llama3.2", MESSAGES, base_url=mock_llm.url
+    )
+    assert reply.content.startswith("Mock reply to:")
+    assert reply.prompt_tokens > 0
+
+
+def test_openai_streaming_matches_full_reply(mock_llm):
+    url = f"{mock_llm.url}/v1/chat/completions"
+    full = httpx.post(url, json={"model": "m", "messages": MESSAGES}).json()
+    pieces = []
+    with httpx.stream(
+        "POST", url, json={"model": "m", "messages": MESSAGES, "stream": True}
+    ) as response:
+        assert response.headers["content-type"] == "text/event-stream"
+        for line in response.iter_lines():
+            if not line.startswith("data: ") or line == "data: [DONE]":
+                continue
+            choice = json.loads(line[6:])["choices"][0]
+            pieces.append(choice["delta"].get("content", ""))
+    assert len(pieces) > 1
+    assert "".join(pieces) == full["choices"][0]["message"]["content"]
+
+
+def test_latency_and_token_rate_are_applied():
+    with MockLLMServer(
+        latency="fixed:100", tokens_per_second=100, reply_tokens=10
+    ) as server:
+        start = time.perf_counter()
+        lines = []
+        with httpx.stream(
+            "POST",
+            f"{server.url}/api/chat",
+            json={"model": "m", "messages": MESSAGES},
+        ) as response:
+            for line in response.iter_lines():
+                if line:
+                    lines.append(json.loads(line))
+                    if len(lines) == 1:
+                        first_at = time.perf_counter() - start
+        total = time.perf_counter() - start
+    assert lines[-1]["done"]
+    assert first_at >= 0.1
+    assert total >= 0.1 + 9 * 0.01
+
+
+async def test_record_then_replay(tmp_path):
+    fixtures = tmp_path / "fixtures.jsonl"
+    with MockLLMServer(latency="fixed:30", reply_tokens=8, seed=3) as upstream:
+        with MockLLMServer(
+            mode="record", upstream=upstream.url, fixtures=fixtures
+        ) as recorder:
+            recorded = await LLMGateway().complete(
+                "openai", "gpt-4o-mini", MESSAGES, base_url=recorder.url
+            )
+            assert recorder.stats["recorded"] == 1
+
+    lines = fixtures.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["latency_ms"] >= 30
+
+    with MockLLMServer(mode="replay", fixtures=fixtures, latency="recorded") as replay:
+        start = time.perf_counter()
+        replayed = await LLMGateway().complete(
+            "openai", "gpt-4o-mini", MESSAGES, base_url=replay.url
+        )
+        assert time.perf_counter() - start >= 0.03
+        await LLMGateway().complete(
+            "openai", "gpt-4o-mini", MESSAGES[:1], base_url=replay.url
+        )
+        assert replay.stats == {
+            "requests": 2,
+            "replayed": 1,
+            "recorded": 0,
+            "synthesized": 1,
+        }
+    assert replayed.content == recorded.content
+    assert replayed.completion_tokens == recorded.completion_tokens
+
+
+def test_record_mode_needs_upstream():
+    with pytest.raises(ValueError):
+        MockLLMServer(mode="record")
+
+
+def test_fault_injection(mock_llm):
+    mock_llm.fail_next = 1
+    mock_llm.stall_next = 1
+    mock_llm.stall_delay = 0.05
+    url = f"{mock_llm.url}/v1/chat/completions"
+    body = {"model": "m", "messages": MESSAGES}
+    assert httpx.post(url, json=body).status_code == 503
+    start = time.perf_counter()
+    assert httpx.post(url, json=body).status_code == 200
+    assert time.perf_counter() - start >= 0.05
+    assert mock_llm.requests == 2
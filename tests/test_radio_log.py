@@ -0,0 +1,124 @@
+"""Tests for the persistent, segmented TeamRadio log."""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import MessageType, RadioLog, TeamConfig, TeamRadio
+
+
+def _record(ts, sender="architect", to="engine", kind="radio_message", n=0):
+    return {"ts": ts, "from": sender, "to": to, "type": kind, "message": f"m{n}"}
+
+
+def test_rotates_segments_by_size(tmp_path):
+    """Segments rotate once the size cap is reached."""
+    log = RadioLog(tmp_path, max_segment_bytes=500, index_every=4)
+    for n in range(50):
+        log.append(_record(1000.0 + n, n=n))
+    log.close()
+
+    assert len(log.segments) > 1
+    assert log.count == 50
+    assert all(s.size <= 500 for s in log.segments[:-1])
+    assert list(tmp_path.glob("radio-*.idx.json"))
+
+
+def test_time_range_query(tmp_path):
+    """Range queries return exactly the records inside the window."""
+    log = RadioLog(tmp_path, max_segment_bytes=400, index_every=3)
+    for n in range(100):
+        log.append(_record(1000.0 + n, n=n))
+
+    results = list(log.query(start=1020.0, end=1029.0))
+    assert [r["message"] for r in results] == [f"m{n}" for n in range(20, 30)]
+
+    assert len(list(log.query(start=1095.0))) == 5
+    assert len(list(log.query(end=1004.0))) == 5
+    assert len(list(log.query(start=1010.0, limit=3))) == 3
+
+
+def test_driver_and_type_filters(tmp_path):
+    """Driver and message type filters apply within the range."""
+    log = RadioLog(tmp_path, max_segment_bytes=300)
+    log.append(_record(1.0, sender="spark", to="all", kind="pit_stop"))
+    log.append(_record(2.0, sender="engine", to="architect"))
+    log.append(_record(3.0, sender="architect", to="spark", kind="pit_stop"))
+
+    assert [r["ts"] for r in log.query(driver_id="spark")] == [1.0, 3.0]
+    assert [r["ts"] for r in log.query(message_type="pit_stop")] == [1.0, 3.0]
+    assert list(log.query(driver_id="builder")) == []
+
+
+def test_survives_restart_and_torn_write(tmp_path):
+    """A reopened log recovers unindexed records and drops torn writes."""
+    log = RadioLog(tmp_path, index_every=100)
+    for n in range(10):
+        log.append(_record(1000.0 + n, n=n))
+    log._close_handle()  # simulate crash: sidecar not flushed
+
+    segment = sorted(tmp_path.glob("radio-*.jsonl"))[-1]
+    with open(segment, "ab") as f:
+        f.write(b'{"ts": 2000.0, "from": "arch')
+
+    reopened = RadioLog(tmp_path, index_every=100)
+    assert reopened.count == 10
+    reopened.append(_record(1010.0, n=10))
+    assert [r["message"] for r in reopened.query(start=1009.0)] == ["m9", "m10"]
+
+
+def test_team_radio_persists_and_queries(tmp_path):
+    """TeamRadio writes through to the log and queries it after restart."""
+    radio = TeamRadio(log=RadioLog(tmp_path))
+    before = datetime.now() - timedelta(seconds=1)
+    radio.transmit({"from": "architect", "to": "engine", "message": "hello"})
+    radio.transmit({"from": "engine", "to": "all", "type": "pit_stop"})
+    radio.log.close()
+
+    restarted = TeamRadio(log=RadioLog(tmp_path))
+    assert restarted.get_recent() == []
+    history = restarted.query(start=before)
+    assert [m["from"] for m in history] == ["architect", "engine"]
+    assert restarted.query(message_type=MessageType.HANDOFF)[0]["from"] == "engine"
+
+    # IDs keep counting across restarts
+    new_id = restarted.transmit({"from": "spark", "to": "all"})
+    assert new_id == "MSG-000003"
+
+
+def test_team_radio_memory_query():
+    """Without a log, query filters the in-memory history."""
+    radio = TeamRadio()
+    radio.transmit({"from": "architect", "to": "engine"})
+    time.sleep(0.01)
+    mid = datetime.now()
+    radio.transmit({"from": "spark", "to": "all"})
+
+    assert [m["from"] for m in radio.query(start=mid)] == ["spark"]
+    assert [m["from"] for m in radio.query(driver_id="engine")] == ["architect"]
+
+
+def test_from_config(tmp_path):
+    """TeamConfig enables persistence via radio_log_dir."""
+    config = TeamConfig()
+    assert TeamRadio.from_config(config).log is None
+
+    config.telemetry["radio_log_dir"] = str(tmp_path)
+    radio = TeamRadio.from_config(config)
+    assert radio.log is not None
+    assert radio.log.log_dir == tmp_path
+    assert radio.log.max_segments is None
+
+    config.telemetry["radio_max_segments"] = 3
+    assert TeamRadio.from_config(config).log.max_segments == 3
+
+
+def test_global_radio_is_shared():
+    """The module orchestrator transmits on the configured module radio."""
+    from partner_agents import messages, orchestrator
+
+    assert orchestrator.orchestrator.radio is messages.radio
@@ -0,0 +1,139 @@
+"""Tests for template chunk retrieval used in chat prompts."""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import chat_orchestrator, retrieval
+from partner_agents.retrieval import ChunkIndex, chunk_markdown, format_passages
+from template_registry import TemplateRegistry
+
+
+@pytest.fixture
+def docs(tmp_path):
+    root = tmp_path / "docs"
+    (root / "finance").mkdir(parents=True)
+    (root / "finance" / "01-commission.md").write_text(
+        "---\ntitle: Commission Structure\n---\n"
+        "## Tier Rates\n\n| Tier | Rate |\n|---|---|\n| Gold | 20% commission |\n"
+        "| Silver | 15% commission |\n\n"
+        "## Payment Terms\n\nCommission is paid quarterly within 45 days of close.\n"
+    )
+    (root / "legal").mkdir()
+    (root / "legal" / "01-nda.md").write_text(
+        "---\ntitle: Mutual NDA\n---\n## Term\n\n"
+        "Confidential information stays protected for three years after disclosure.\n"
+    )
+    return root
+
+
+def make_index(docs, tmp_path):
+    registry = TemplateRegistry({"docs": docs}, cache_path=None)
+    return (
+        ChunkIndex(registry, tmp_path / "index", check_interval=0).ensure_fresh().wait()
+    )
+
+
+def test_chunks_split_on_headings():
+    chunks = chunk_markdown(
+        "## One\nalpha beta gamma delta epsilon\n## Two\nzeta eta theta iota kappa\n"
+    )
+    assert [heading for heading, _ in chunks] == ["One", "Two"]
+
+
+def test_long_sections_are_split_on_lines():
+    body = "\n".join(f"line {i} partner commission payout terms" for i in range(100))
+    chunks = chunk_markdown(body, max_words=50)
+    assert len(chunks) > 1
+    assert all(len(text.split()) <= 50 for _, text in chunks)
+
+
+def test_retrieves_relevant_passage(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    passages = index.retrieve("when is commission paid?", top_k=2)
+    assert passages[0].source == "finance/01-commission.md"
+    assert passages[0].heading == "Commission Structure > Payment Terms"
+    assert "45 days" in passages[0].text
+
+
+def test_token_budget_limits_passages(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    everything = index.retrieve("commission tier gold", top_k=10, token_budget=10_000)
+    budget = everything[0].tokens
+    limited = index.retrieve("commission tier gold", top_k=10, token_budget=budget)
+    assert sum(p.tokens for p in limited) <= budget
+    assert len(limited) < len(everything)
+
+
+def test_reopens_without_rebuilding(docs, tmp_path):
+    version = make_index(docs, tmp_path).version
+    reopened = make_index(docs, tmp_path)
+    assert reopened.version == version
+    assert reopened.retrieve("confidential information")[0].source == "legal/01-nda.md"
+
+
+def test_rebuilds_in_background_when_sources_change(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    old_version = index.version
+    (docs / "legal" / "02-dpa.md").write_text(
+        "---\ntitle: DPA\n---\nPersonal data processing follows GDPR subprocessors rules.\n"
+    )
+    index.ensure_fresh().wait()
+    assert index.version != old_version
+    assert index.retrieve("gdpr subprocessors")[0].source == "legal/02-dpa.md"
+    # The previous version stays on disk for readers that still map it
+    versions = {p.name for p in (tmp_path / "index").iterdir() if p.is_dir()}
+    assert versions == {old_version, index.version}
+
+
+def test_cold_start_does_not_build_on_caller(docs, tmp_path, monkeypatch):
+    registry = TemplateRegistry({"docs": docs}, cache_path=None)
+    index = ChunkIndex(registry, tmp_path / "index", check_interval=0)
+    callers, release = [], threading.Event()
+    build = index.build
+
+    def slow_build(*args):
+        callers.append(threading.current_thread())
+        release.wait(5)
+        return build(*args)
+
+    monkeypatch.setattr(index, "build", slow_build)
+    assert index.ensure_fresh().retrieve("commission") == []
+    release.set()
+    index.wait()
+    assert callers and threading.main_thread() not in callers
+    assert index.retrieve("commission")[0].source == "finance/01-commission.md"
+
+
+def test_precompute_command_publishes_one_version(docs, tmp_path, monkeypatch):
+    registry = TemplateRegistry({"docs": docs}, cache_path=None)
+    monkeypatch.setattr(retrieval, "get_registry", lambda refresh=True: registry)
+    retrieval.main(["build", "--index-dir", str(tmp_path / "index")])
+    version = (tmp_path / "index" / "CURRENT").read_text()
+    assert sorted(p.name for p in (tmp_path / "index" / version).iterdir()) == [
+        "chunks.txt",
+        "index.bin",
+        "meta.json",
+    ]
+    retrieval.main(["build", "--index-dir", str(tmp_path / "index"), "--if-stale"])
+    assert (tmp_path / "index" / "CURRENT").read_text() == version
+
+
+def test_prompt_includes_reference_material(docs, tmp_path, monkeypatch):
+    index = make_index(docs, tmp_path)
+    monkeypatch.setattr(chat_orchestrator.retrieval, "get_chunk_index", lambda: index)
+    prompt = chat_orchestrator.build_swarm_prompt("what are the gold commission rates?")
+    assert "REFERENCE MATERIAL" in prompt
+    assert "finance/01-commission.md" in prompt
+
+
+def test_prompt_without_matches_has_no_reference(docs, tmp_path, monkeypatch):
+    index = make_index(docs, tmp_path)
+    monkeypatch.setattr(chat_orchestrator.retrieval, "get_chunk_index", lambda: index)
+    assert format_passages([]) == ""
+    assert "REFERENCE MATERIAL" not in chat_orchestrator.build_swarm_prompt("hello")
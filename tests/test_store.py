@@ -0,0 +1,139 @@
+"""Tests for the shared partner store and the partners.json migration."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+sys.path.insert(0, str(REPO_ROOT / "scripts" / "partner_agent"))
+
+from partner_agents import partner_state as web_state
+from partner_agents.store import PartnerStore, migrate, store_for
+from partner_state import PartnerState
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Point the web front at tmp_path/state, where PartnerState writes too."""
+    monkeypatch.setattr(web_state, "PARTNERS_FILE", tmp_path / "partners.json")
+    monkeypatch.setattr(web_state, "_partners_cache", None)
+    return tmp_path / "state"
+
+
+def test_records_are_read_once(tmp_path):
+    store = PartnerStore(tmp_path)
+    store.save({"name": "Acme Corp", "tier": "Gold"})
+    reader = PartnerStore(tmp_path)
+    assert reader.get("acme-corp")["tier"] == "Gold"
+    assert reader.find("ACME CORP") is reader.get("acme-corp")
+    assert reader.stats["reads"] == 1
+
+    # A change made by another process is picked up
+    path = tmp_path / "acme-corp" / "metadata.json"
+    data = json.loads(path.read_text())
+    data["tier"] = "Silver"
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(0, 10**18))
+    assert reader.get("acme-corp")["tier"] == "Silver"
+
+
+def test_unchanged_records_are_not_rewritten(tmp_path):
+    store = PartnerStore(tmp_path)
+    acme, globex = store.save_many([{"name": "Acme"}, {"name": "Globex"}])
+    globex["tier"] = "Gold"
+    assert store.save_many([acme, globex]) == [globex]
+    assert store.stats["writes"] == 3
+
+
+def test_unsaved_edits_do_not_leak_to_readers(tmp_path):
+    state = PartnerState("Acme Corp", state_dir=str(tmp_path))
+    state.save()
+    state.state["stage"] = "X"
+    assert store_for(tmp_path).get(state.slug)["stage"] != "X"
+    assert PartnerState.list_all(str(tmp_path))[0]["stage"] != "X"
+
+
+def test_schema_and_slug_collisions(tmp_path):
+    store = PartnerStore(tmp_path)
+    first = store.save({"name": "Acme Corp", "created_at": "2026-01-01T00:00:00"})
+    second = store.save({"name": "acme-corp!"})
+    assert first["created"] == "2026-01-01T00:00:00"
+    assert "created_at" not in first
+    assert first["deals"] == [] and first["playbooks"] == {}
+    assert second["slug"] == "acme-corp-2"
+    with pytest.raises(ValueError):
+        store.save({"name": "x", "slug": "../escape"})
+
+
+def test_web_and_agent_share_records(state_dir):
+    web_state.add_partner("Acme Corp", tier="Gold", email="a@acme.test")
+    web_state.register_deal("Acme Corp", 5000, "Initech")
+
+    state = PartnerState("Acme Corp", state_dir=str(state_dir))
+    assert state.state["tier"] == "Gold"
+    assert state.state["deals"][0]["value"] == 5000
+    state.update_stage("onboarding")
+    state.save()
+
+    assert web_state.get_partner("acme corp")["stage"] == "onboarding"
+    assert [p["name"] for p in web_state.list_partners()] == ["Acme Corp"]
+    assert PartnerState.list_all(str(state_dir), summary=True)[0]["tier"] == "Gold"
+
+    assert web_state.delete_partner("Acme Corp")
+    assert PartnerState.list_all(str(state_dir)) == []
+
+
+def test_web_save_keeps_partners_it_has_not_loaded(state_dir):
+    web_state.add_partner("Acme Corp", tier="Gold")
+    partners = web_state.load_partners()
+
+    # The playbook agent adds a partner after the web front loaded its list
+    PartnerState("Globex", state_dir=str(state_dir)).save()
+    partners[0]["tier"] = "Silver"
+    web_state.save_partners(partners)
+
+    assert (state_dir / "globex" / "metadata.json").exists()
+    assert {p["name"] for p in web_state.list_partners()} == {"Acme Corp", "Globex"}
+    assert not web_state.delete_partner("acme-corp")  # names only
+    assert web_state.delete_partner("ACME CORP")
+    assert [p["name"] for p in web_state.list_partners()] == ["Globex"]
+
+
+def test_migrate_legacy_partners_file(tmp_path):
+    legacy = tmp_path / "partners.json"
+    legacy.write_text(
+        json.dumps(
+            [
+                {
+                    "id": "partner-1",
+                    "name": "Acme Corp",
+                    "tier": "Gold",
+                    "email": "a@acme.test",
+                    "created_at": "2026-01-01T00:00:00",
+                    "deals": [{"id": "deal-1", "value": 100}],
+                },
+                {"id": "partner-2", "name": "Globex", "tier": "Silver"},
+            ]
+        )
+    )
+    state_dir = tmp_path / "state"
+    existing = PartnerState("Acme Corp", state_dir=str(state_dir))
+    existing.set_tier("Strategic")
+    existing.save()
+
+    assert migrate(legacy, state_dir, dry_run=True)["created"] == ["globex"]
+    assert not (state_dir / "globex").exists()
+
+    report = migrate(legacy, state_dir)
+    assert report == {"created": ["globex"], "merged": ["acme-corp"], "unchanged": []}
+    acme = store_for(state_dir).get("acme-corp")
+    assert acme["tier"] == "Strategic"  # the store's value wins
+    assert acme["email"] == "a@acme.test"
+    assert acme["deals"][0]["value"] == 100
+
+    again = migrate(legacy, state_dir)
+    assert again["created"] == [] and again["merged"] == []
@@ -0,0 +1,87 @@
+"""Tests for Telemetry partner state loading and the owner index."""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import PartnerState, Telemetry
+
+
+def _seed(state_dir, count=6):
+    writer = Telemetry(state_dir=str(state_dir))
+    for n in range(count):
+        owner = "architect" if n % 2 else "engine"
+        writer.save_partner(
+            PartnerState(f"p{n}", f"Partner {n}", "Gold", health_score=60, owner=owner)
+        )
+
+
+def test_cold_start_driver_telemetry(tmp_path):
+    """get_driver_telemetry sees partners that were never loaded explicitly."""
+    _seed(tmp_path)
+    telemetry = Telemetry(state_dir=str(tmp_path))
+
+    report = telemetry.get_driver_telemetry("architect")
+    assert report["partner_count"] == 3
+    assert report["avg_health"] == 60
+    assert {p["id"] for p in report["partners"]} == {"p1", "p3", "p5"}
+
+
+def test_load_all_skips_bad_files(tmp_path):
+    """Corrupt or unrelated JSON files do not break the bulk load."""
+    _seed(tmp_path, count=2)
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "other.json").write_text('{"hello": "world"}')
+
+    assert Telemetry(state_dir=str(tmp_path)).load_all() == 2
+
+
+def test_owner_index_follows_reassignment(tmp_path):
+    """Changing owner in save_partner moves the partner in the index."""
+    telemetry = Telemetry(state_dir=str(tmp_path))
+    telemetry.save_partner(PartnerState("acme", "Acme", "Gold", owner="architect"))
+    telemetry.save_partner(PartnerState("acme", "Acme", "Gold", owner="engine"))
+
+    assert telemetry.get_partners_by_driver("architect") == []
+    assert [p.partner_id for p in telemetry.get_partners_by_driver("engine")] == [
+        "acme"
+    ]
+
+
+def test_owner_index_follows_in_place_reassignment(tmp_path):
+    """Editing the cached state object and saving it moves the partner too."""
+    telemetry = Telemetry(state_dir=str(tmp_path))
+    telemetry.save_partner(PartnerState("acme", "Acme", "Gold", owner="architect"))
+    state = telemetry.load_partner("acme")
+    state.owner = "engine"
+    telemetry.save_partner(state)
+
+    assert telemetry.get_partners_by_driver("architect") == []
+    assert telemetry.get_partners_by_driver("engine") == [state]
+
+
+def test_load_all_ignores_metrics_store(tmp_path, monkeypatch):
+    """metrics.json shares the state directory but is not a partner file."""
+    _seed(tmp_path, count=2)
+    Telemetry(state_dir=str(tmp_path)).refresh_metrics()
+    assert (tmp_path / "metrics.json").exists()
+    read = []
+    monkeypatch.setattr(
+        Telemetry, "_read_state", staticmethod(lambda path: read.append(path.name))
+    )
+
+    Telemetry(state_dir=str(tmp_path)).load_all()
+    assert sorted(read) == ["p0.json", "p1.json"]
+
+
+def test_in_memory_state_wins_over_disk(tmp_path):
+    """load_all keeps unsaved in-memory changes."""
+    _seed(tmp_path, count=1)
+    telemetry = Telemetry(state_dir=str(tmp_path))
+    state = telemetry.load_partner("p0")
+    state.health_score = 99
+
+    telemetry.load_all()
+    assert telemetry.partners["p0"].health_score == 99
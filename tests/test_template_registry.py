@@ -0,0 +1,113 @@
+"""Tests for the shared template registry."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import template_registry
+from template_registry import TemplateRegistry
+
+
+@pytest.fixture
+def docs(tmp_path):
+    root = tmp_path / "docs"
+    (root / "legal").mkdir(parents=True)
+    (root / "legal" / "index.md").write_text("---\ntitle: Legal\n---\nOverview\n")
+    (root / "legal" / "01-nda.md").write_text(
+        "---\ntitle: NDA\ntier: [Gold, Silver]\nphase: recruit\n---\n"
+        "Between [Partner Name] and ${company}.\n"
+    )
+    (root / "finance").mkdir()
+    (root / "finance" / "01-rebates.md").write_text(
+        "---\ntitle: Rebates\ntier: Gold\nphase: grow\n---\nBody\n"
+    )
+    return root
+
+
+def make_registry(docs, tmp_path):
+    return TemplateRegistry({"docs": docs}, tmp_path / "cache.json").refresh()
+
+
+def test_refresh_parses_only_changed_files(docs, tmp_path):
+    registry = make_registry(docs, tmp_path)
+    assert registry.parsed == 3
+
+    registry.refresh()
+    assert registry.parsed == 0
+
+    nda = docs / "legal" / "01-nda.md"
+    nda.write_text(nda.read_text() + "More text.\n")
+    registry.refresh()
+    assert registry.parsed == 1
+
+
+def test_cache_survives_new_instance(docs, tmp_path):
+    make_registry(docs, tmp_path)
+    reloaded = make_registry(docs, tmp_path)
+    assert reloaded.parsed == 0
+    assert reloaded.get("legal/01-nda.md").title == "NDA"
+
+
+def test_deleted_files_drop_out(docs, tmp_path):
+    registry = make_registry(docs, tmp_path)
+    (docs / "finance" / "01-rebates.md").unlink()
+    registry.refresh()
+    assert registry.get("finance/01-rebates.md") is None
+    assert registry.categories() == ["legal"]
+
+
+def test_query_filters(docs, tmp_path):
+    registry = make_registry(docs, tmp_path)
+    assert [r.path for r in registry.query(folder="legal")] == ["legal/01-nda.md"]
+    assert len(registry.query(folder="legal", include_index=True)) == 2
+    assert [r.title for r in registry.query(tier="silver")] == ["NDA"]
+    assert len(registry.query(tier="gold")) == 2
+    assert [r.title for r in registry.query(phase="grow")] == ["Rebates"]
+
+
+def test_record_fields(docs, tmp_path):
+    record = make_registry(docs, tmp_path).get("legal/01-nda.md")
+    assert record.category == "legal"
+    assert record.placeholders == ["Partner Name", "company"]
+    assert len(record.content_hash) == 64
+
+
+def test_get_fresh_reparses_single_file(docs, tmp_path):
+    registry = make_registry(docs, tmp_path)
+    nda = docs / "legal" / "01-nda.md"
+    nda.write_text("---\ntitle: Mutual NDA\n---\nBody\n")
+    stat = nda.stat()
+    os.utime(nda, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert registry.get_fresh("legal/01-nda.md", "docs").title == "Mutual NDA"
+    assert registry.get_fresh("legal/missing.md", "docs") is None
+
+
+def test_repo_docs_are_indexed():
+    registry = TemplateRegistry(cache_path=None).refresh()
+    assert registry.query(root="docs", folder="legal")
+    assert template_registry.root_name_for(REPO_ROOT / "docs") == "docs"
+
+
+def test_shared_registry_refreshes_on_first_use(monkeypatch):
+    """refresh=False still scans once, so a cold cache is never served empty."""
+    refreshes = []
+
+    class Counting(TemplateRegistry):
+        def refresh(self, force=False):
+            refreshes.append(force)
+            return super().refresh(force)
+
+    monkeypatch.setattr(template_registry, "_registry", None)
+    monkeypatch.setattr(template_registry, "_refreshed", False)
+    monkeypatch.setattr(
+        template_registry, "TemplateRegistry", lambda: Counting(cache_path=None)
+    )
+    registry = template_registry.get_registry(refresh=False)
+    assert registry.query(root="docs", folder="legal")
+    assert template_registry.get_registry(refresh=False) is registry
+    assert len(refreshes) == 1
@@ -0,0 +1,103 @@
+"""Tests for the BM25 template search index."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents.template_search import TemplateSearchIndex, tokenize
+from template_registry import TemplateRegistry
+
+
+@pytest.fixture
+def docs(tmp_path):
+    root = tmp_path / "docs"
+    (root / "legal").mkdir(parents=True)
+    (root / "legal" / "01-nda.md").write_text(
+        "---\ntitle: Mutual NDA\ndescription: Confidentiality terms\n---\n"
+        "Both parties keep confidential information confidential.\n"
+    )
+    (root / "operations").mkdir()
+    (root / "operations" / "01-deal-registration.md").write_text(
+        "---\ntitle: Deal Registration\n---\nRegister each deal before quoting. "
+        "Deal conflicts go to the channel manager.\n"
+    )
+    (root / "operations" / "02-portal.md").write_text(
+        "---\ntitle: Portal Guide\n---\nLog in to the portal to see your deal list.\n"
+    )
+    return root
+
+
+def make_index(docs, tmp_path):
+    registry = TemplateRegistry({"docs": docs}, cache_path=None)
+    return TemplateSearchIndex(registry, tmp_path / "index.json.gz").refresh()
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("The Deal and the NDA") == ["deal", "nda"]
+
+
+def test_ranks_most_relevant_first(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    results = index.search("deal registration")
+    assert results[0]["path"] == "operations/01-deal-registration.md"
+    assert [r["path"] for r in results][-1] == "operations/02-portal.md"
+    assert index.search("confidential")[0]["title"] == "Mutual NDA"
+
+
+def test_category_filter_and_limit(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    assert index.search("deal", category="legal") == []
+    assert len(index.search("deal", limit=1)) == 1
+
+
+def test_no_match_returns_empty(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    assert index.search("kubernetes") == []
+    assert index.search("the and") == []
+
+
+def test_incremental_refresh(docs, tmp_path):
+    index = make_index(docs, tmp_path)
+    assert index.reindexed == 3
+
+    (docs / "legal" / "02-msa.md").write_text("---\ntitle: MSA\n---\nIndemnity.\n")
+    (docs / "operations" / "02-portal.md").unlink()
+    index.refresh()
+    assert index.reindexed == 1
+    assert len(index) == 3
+    assert index.search("indemnity")[0]["path"] == "legal/02-msa.md"
+    assert index.search("portal") == []
+
+
+def test_index_persists(docs, tmp_path):
+    make_index(docs, tmp_path)
+    reloaded = make_index(docs, tmp_path)
+    assert reloaded.reindexed == 0
+    assert reloaded.search("portal")[0]["path"] == "operations/02-portal.md"
+
+
+def test_search_is_fast_on_repo_docs(tmp_path):
+    index = TemplateSearchIndex(index_path=None).refresh()
+    assert len(index) > 50
+    start = time.perf_counter()
+    for _ in range(20):
+        index.search("partner tier benefits commission")
+    assert (time.perf_counter() - start) / 20 < 0.01
+
+
+def test_uses_registry_records(docs, tmp_path):
+    registry = TemplateRegistry({"docs": docs}, cache_path=None)
+    index = TemplateSearchIndex(registry, None).refresh()
+    record = registry.get("legal/01-nda.md")
+    doc = index.docs["legal/01-nda.md"]
+    assert (doc.title, doc.mtime_ns, doc.size) == (
+        record.title,
+        record.mtime_ns,
+        record.size,
+    )
+    assert doc.description == "Confidentiality terms"
@@ -0,0 +1,164 @@
+"""Tests for handoff tracing and latency histograms."""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents import Orchestrator, RaceStrategy
+from partner_agents.drivers import ArchitectAgent, EngineAgent
+from partner_agents.tracing import LatencyHistogram, Tracer, tracer
+
+
+@pytest.fixture(autouse=True)
+def reset_tracer():
+    tracer.reset()
+    yield
+    tracer.reset()
+
+
+def test_histogram_percentiles():
+    """Percentiles come from bucket bounds and are ordered."""
+    hist = LatencyHistogram()
+    for ms in range(1, 101):
+        hist.record(float(ms))
+    hist.record(5000.0, error=True)
+
+    stats = hist.to_dict()
+    assert stats["count"] == 101
+    assert stats["errors"] == 1
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    assert 40 <= stats["p50_ms"] <= 80
+    assert stats["max_ms"] == 5000.0
+
+
+def test_empty_histogram():
+    """An empty histogram reports no percentiles."""
+    stats = LatencyHistogram().to_dict()
+    assert stats["count"] == 0
+    assert stats["p99_ms"] is None
+
+
+def test_histogram_mean_above():
+    """The tail mean only counts observations slower than the threshold."""
+    hist = LatencyHistogram()
+    for ms in (10.0, 20.0, 1000.0, 1200.0):
+        hist.record(ms)
+    assert 900 <= hist.mean_above(500.0) <= 1200
+    assert hist.mean_above(5000.0) is None
+
+
+def test_nested_spans_share_trace():
+    """Child spans inherit trace ID and parent span ID."""
+    local = Tracer()
+    with local.span("chat", new_trace=True) as root:
+        with local.span("skill:x", driver="architect", skill="x") as child:
+            pass
+
+    assert child.trace_id == root.trace_id
+    assert child.parent_span_id == root.span_id
+    assert local.skills["x"].count == 1
+    assert local.drivers["architect"].count == 1
+
+
+def test_handoff_propagates_trace():
+    """Handoffs carry the trace through HandoffRequest, skills and radio."""
+    orchestrator = Orchestrator()
+    architect = ArchitectAgent()
+    orchestrator.register_driver(architect)
+
+    seen = {}
+    original = architect.receive_handoff
+
+    def capture(request):
+        seen["request"] = request
+        original(request)
+
+    architect.receive_handoff = capture
+
+    with tracer.span("chat", new_trace=True) as root:
+        result = orchestrator.call_driver(
+            "architect", "architect_status", {"partner_id": "acme"}
+        )
+
+    assert result["trace_id"] == root.trace_id
+    assert seen["request"].trace_id == root.trace_id
+    assert all(m["trace_id"] == root.trace_id for m in orchestrator.radio.get_recent())
+
+    spans = tracer.get_trace(root.trace_id)
+    names = [s["name"] for s in spans]
+    assert "skill:architect_status" in names
+    assert "handoff:architect_status" in names
+
+    history = orchestrator.telemetry_history
+    assert len(history) == 1
+    assert history[0]["skill"] == "architect_status"
+    assert history[0]["duration_ms"] is not None
+
+
+def test_skill_errors_counted():
+    """Failing skills are counted per skill and per driver."""
+    orchestrator = Orchestrator()
+    engine = EngineAgent()
+    orchestrator.register_driver(engine)
+
+    def boom(context):
+        raise RuntimeError("portal down")
+
+    engine.skills["engine_provision"].callback = boom
+
+    with pytest.raises(RuntimeError):
+        orchestrator.call_driver("engine", "engine_provision", {})
+
+    assert tracer.skills["engine_provision"].errors == 1
+    assert tracer.drivers["engine"].errors == 1
+    assert orchestrator.telemetry_history[-1]["error"].startswith("RuntimeError")
+
+
+def test_orchestrator_tracer_reaches_drivers():
+    """Skill spans and driver latency land in the orchestrator's own tracer."""
+    own = Tracer()
+    orchestrator = Orchestrator(tracer=own)
+    orchestrator.register_driver(ArchitectAgent())
+
+    orchestrator.call_driver("architect", "architect_status", {})
+
+    assert "architect_status" in own.skills
+    assert "architect_status" not in tracer.skills
+    assert orchestrator.drivers["architect"].get_telemetry()["latency"]["count"] == 1
+
+
+def test_race_summary_is_json():
+    """race_summary exports strategy, handoffs and histograms as JSON."""
+    orchestrator = Orchestrator()
+    orchestrator.register_driver(ArchitectAgent())
+    orchestrator.set_strategy(RaceStrategy("architect", ["architect"]))
+    orchestrator.call_driver("architect", "architect_status", {"partner_id": "x"})
+
+    summary = json.loads(json.dumps(orchestrator.race_summary()))
+    assert summary["strategy"]["primary_driver"] == "architect"
+    assert "architect_status" in summary["tracing"]["skills"]
+    assert summary["standings"]["architect"]["latency"]["count"] == 1
+
+
+def test_chat_returns_trace_id():
+    """Each inbound chat gets its own trace."""
+    from partner_agents import chat_orchestrator
+
+    conv_id = "test_tracing_conv"
+    try:
+        first = asyncio.run(chat_orchestrator.chat("hello", conv_id=conv_id))
+        second = asyncio.run(chat_orchestrator.chat("hello", conv_id=conv_id))
+    finally:
+        chat_orchestrator.memory.clear(conv_id)
+        path = chat_orchestrator.memory._conversation_file(conv_id)
+        if path.exists():
+            path.unlink()
+
+    assert first["trace_id"]
+    assert first["trace_id"] != second["trace_id"]
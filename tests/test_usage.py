@@ -0,0 +1,128 @@
+"""Tests for LLM token, latency and cost accounting."""
+
+import csv
+import io
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from partner_agents.llm_gateway import LLMGateway, ProviderError
+from partner_agents.usage import UsageStore, estimate_cost
+
+DAY1 = datetime(2026, 3, 1, 12).timestamp()
+DAY2 = datetime(2026, 3, 2, 12).timestamp()
+MODEL = "openrouter/openai/gpt-4o-mini"
+
+
+def test_estimate_cost_uses_price_table():
+    assert estimate_cost(MODEL, 1_000_000, 1_000_000) == pytest.approx(0.75)
+    assert estimate_cost("ollama/llama3.2", 5000, 5000) == 0.0
+
+
+def test_record_aggregates_every_dimension():
+    store = UsageStore(path=None)
+    store.record(MODEL, 100, 50, 200.0, conversation="c1", agent="swarm", when=DAY1)
+    store.record(MODEL, 300, 150, 400.0, conversation="c2", agent="swarm", when=DAY2)
+    store.record("ollama/llama3.2", 10, 5, 50.0, agent="partner_agent", when=DAY2)
+
+    by_model = {r["key"]: r for r in store.rows("model")}
+    assert by_model[MODEL]["prompt_tokens"] == 400
+    assert by_model[MODEL]["avg_latency_ms"] == 300.0
+    assert store.rows("model")[0]["key"] == MODEL  # highest cost first
+
+    by_agent = {r["key"]: r for r in store.rows("agent")}
+    assert by_agent["swarm"]["calls"] == 2
+    assert by_agent["partner_agent"]["total_tokens"] == 15
+
+    assert {r["key"] for r in store.rows("conversation")} == {"c1", "c2", "unknown"}
+    assert [r["key"] for r in store.rows("day")] == ["2026-03-01", "2026-03-02"]
+    assert store.summary()["calls"] == 3
+
+
+def test_day_filter_and_unknown_dimension():
+    store = UsageStore(path=None)
+    store.record(MODEL, 10, 10, when=DAY1)
+    store.record(MODEL, 10, 10, when=DAY2)
+    assert [r["key"] for r in store.rows("day", start="2026-03-02")] == ["2026-03-02"]
+    with pytest.raises(ValueError):
+        store.rows("week")
+
+
+def test_cached_calls_are_free_and_skip_latency():
+    store = UsageStore(path=None)
+    store.record(MODEL, 1000, 1000, 300.0)
+    store.record(MODEL, 1000, 1000, 0.0, cached=True)
+    row = store.rows("model")[0]
+    assert row["cached_calls"] == 1
+    assert row["avg_latency_ms"] == 300.0
+    assert row["cost_usd"] == pytest.approx(estimate_cost(MODEL, 1000, 1000))
+
+
+def test_csv_export():
+    store = UsageStore(path=None)
+    store.record(MODEL, 100, 50, 120.0, agent="swarm")
+    rows = list(csv.DictReader(io.StringIO(store.to_csv("agent"))))
+    assert rows[0]["agent"] == "swarm"
+    assert rows[0]["total_tokens"] == "150"
+    assert UsageStore(path=None).to_csv("day").startswith("day,calls")
+
+
+def test_persists_and_prunes(tmp_path):
+    path = tmp_path / "usage.json"
+    store = UsageStore(path=path, max_conversations=2)
+    for i, conversation in enumerate(["a", "b", "c"]):
+        store.record(MODEL, 10, 10, conversation=conversation, when=DAY1 + i)
+    assert not path.exists()  # writes are batched
+    store.close()
+
+    reloaded = UsageStore(path=path, max_conversations=2)
+    assert {r["key"] for r in reloaded.rows("conversation")} == {"b", "c"}
+    assert reloaded.summary()["calls"] == 3
+
+
+def test_background_flush(tmp_path):
+    path = tmp_path / "usage.json"
+    store = UsageStore(path=path, flush_interval=0.01)
+    store.record(MODEL, 10, 10, when=DAY1)
+    for _ in range(200):
+        if path.exists():
+            break
+        time.sleep(0.01)
+    store.close()
+    assert UsageStore(path=path).summary()["calls"] == 1
+
+
+async def test_gateway_records_tagged_usage(ollama_server):
+    store = UsageStore(path=None)
+    gw = LLMGateway(usage=store)
+    await gw.complete(
+        "ollama",
+        "stand-in",
+        [{"role": "user", "content": "hi"}],
+        base_url=ollama_server.url,
+        conversation="acme",
+        agent="swarm",
+    )
+    ollama_server.fail_next = 1
+    with pytest.raises(ProviderError):
+        await gw.complete(
+            "ollama",
+            "stand-in",
+            [{"role": "user", "content": "again"}],
+            base_url=ollama_server.url,
+            conversation="acme",
+            agent="swarm",
+        )
+
+    row = store.rows("conversation")[0]
+    assert row["key"] == "acme"
+    assert row["calls"] == 2
+    assert row["errors"] == 1
+    assert row["completion_tokens"] > 0
+    assert store.rows("agent")[0]["key"] == "swarm"